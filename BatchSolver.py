@@ -0,0 +1,146 @@
+import CommandLine  # puts the package directories on the path
+import csv
+import json
+import sys
+from glob import glob
+from os import path
+from time import time
+from traceback import format_exc
+from multiprocessing import Pool, cpu_count
+from DataIO import DataIO
+from TourSolver import TourSolver
+from SolverBackend import SolverBackend
+
+_WORKER_STATE = dict()  # solver environment and settings of the current worker process
+
+
+def _initialize_worker(algorithm, backend_name, node_selection, time_limit, cache_directory=None):
+    """
+    Given the name of the algorithm, the name of the LP/MIP backend, the node selection rule, the time limit
+    per instance and the directory of the instance cache (if any), creates the solver environment of the current
+    worker process once, so that it is reused by every job of the worker
+    """
+    _WORKER_STATE["algorithm"] = algorithm
+    _WORKER_STATE["backend_name"] = backend_name
+    _WORKER_STATE["node_selection"] = node_selection
+    _WORKER_STATE["time_limit"] = time_limit
+    _WORKER_STATE["cache_directory"] = cache_directory
+    _WORKER_STATE["environment"] = None
+    if algorithm == "auto" or algorithm in TourSolver.SOLVER_ALGORITHMS:  # if the algorithm may need a solver
+        _WORKER_STATE["environment"] = SolverBackend.create_environment(backend_name, quiet=True)
+
+
+def _solve_instance(filename):
+    """
+    Given the name of a file containing a graph, solves the instance within the environment of the current
+    worker process and returns its summary row as a dictionary
+    """
+    row = dict({"instance": path.basename(filename)})
+    try:
+        if _WORKER_STATE["cache_directory"] is None:  # read the graph
+            graph = DataIO.read_graph(filename)
+        else:  # read the graph through the binary cache, whose pages are shared by the workers
+            from InstanceCache import InstanceCache
+            graph = InstanceCache.read_graph(filename, _WORKER_STATE["cache_directory"])
+        row["nodes"] = len(graph.keys())
+        row["edges"] = sum([len(graph[node].keys()) for node in graph.keys()]) // 2
+        t0 = time()  # start recording
+        result = TourSolver.solve(graph, _WORKER_STATE["algorithm"], _WORKER_STATE["backend_name"],
+                                  _WORKER_STATE["environment"], _WORKER_STATE["node_selection"], False,
+                                  _WORKER_STATE["time_limit"])
+        row["time"] = time() - t0  # stop recording the time
+        row["algorithm"] = result["algorithm"]
+        row["cost"] = float(result["cost"])
+        row["iterations"] = result["iterations"]
+        row["cuts"] = result["cuts"]
+    except Exception:  # record the failure instead of aborting the batch
+        row["error"] = format_exc().strip().split("\n").pop()
+    return row  # return the summary row
+
+
+class BatchSolver:
+    """
+    Class containing implementation of functions used to solve every instance of a directory in one run.
+    Instances are distributed over a pool of worker processes, every worker creates its solver environment
+    once and reuses it for all of its instances, and the results are written to a single CSV or JSON lines
+    summary file
+    """
+
+    FIELDS = tuple(("instance", "nodes", "edges", "algorithm", "cost", "time", "iterations", "cuts", "error"))
+
+    PATTERNS = tuple(("*.txt", "*.tsp", "*.tsp.gz"))  # patterns of the instance files within the directory
+
+    TOUR_SUFFIX = "_tour.txt"  # suffix of the reference tour files, which are not instances
+
+    @staticmethod
+    def apply(directory, output_filename, algorithm="auto", backend_name="gurobi", num_processes=None,
+              node_selection="best-first", time_limit=None, cache_directory=None):
+        """
+        Given a directory of instance files, the name of the summary file (.csv or .jsonl), the name of the
+        algorithm, the name of the LP/MIP backend, the number of worker processes (defaults to the number of
+        cores), the node selection rule of the native tree, the time limit per instance in seconds (if any) and
+        the directory of the binary instance cache (if any), solves every instance of the directory and writes
+        one summary row per instance. Returns the list of summary rows, sorted by instance name
+        """
+        filenames = BatchSolver.find_instances(directory)  # collect the instance files
+        num_processes = cpu_count() if num_processes is None else num_processes
+        if algorithm == "portfolio" and num_processes > 1:  # pool workers cannot start processes of their own
+            raise Exception("Error: The portfolio algorithm cannot be run by multiple worker processes")
+
+        if num_processes > 1:  # solve the instances in parallel
+            pool = Pool(num_processes, _initialize_worker,
+                        (algorithm, backend_name, node_selection, time_limit, cache_directory))
+            try:
+                rows = list(pool.imap_unordered(_solve_instance, filenames))  # rows arrive as jobs complete
+            finally:
+                pool.terminate()
+                pool.join()
+        else:  # solve the instances in the current process
+            _initialize_worker(algorithm, backend_name, node_selection, time_limit, cache_directory)
+            rows = [_solve_instance(filename) for filename in filenames]
+
+        rows.sort(key=lambda row: row["instance"])  # sort the rows by instance name
+        BatchSolver.write_summary(rows, output_filename)  # write the summary file
+        return rows  # return the summary rows
+
+    @staticmethod
+    def find_instances(directory):
+        """
+        Given a directory, returns the sorted list of the instance files within the directory, leaving out
+        the reference tour files
+        """
+        return \
+            sorted([
+                filename
+                for pattern in BatchSolver.PATTERNS
+                for filename in glob(path.join(directory, pattern))
+                if not filename.endswith(BatchSolver.TOUR_SUFFIX)
+            ])
+
+    @staticmethod
+    def write_summary(rows, filename):
+        """
+        Given a list of summary rows and a filename, writes the rows to the file as CSV, or as JSON lines if
+        the filename ends with .jsonl
+        """
+        with open(filename, 'w') as file:  # open the file
+            if filename.endswith(".jsonl"):  # write one JSON object per line
+                for row in rows:
+                    file.write(json.dumps(dict({field: row.get(field) for field in BatchSolver.FIELDS})) + "\n")
+            else:  # write a header followed by one line per row
+                writer = csv.DictWriter(file, fieldnames=BatchSolver.FIELDS, lineterminator="\n")
+                writer.writeheader()
+                writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:  # if the arguments are missing
+        print("Usage: BatchSolver.py <directory> <summary.csv|summary.jsonl> [algorithm] [backend] [processes]")
+        sys.exit(1)
+    BatchSolver.apply(
+        sys.argv[1],
+        sys.argv[2],
+        sys.argv[3] if len(sys.argv) > 3 else "auto",
+        sys.argv[4] if len(sys.argv) > 4 else "gurobi",
+        int(sys.argv[5]) if len(sys.argv) > 5 else None
+    )
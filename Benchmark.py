@@ -0,0 +1,246 @@
+import CommandLine  # puts the package directories on the path
+import json
+import sys
+import platform
+from os import path
+from time import time
+from argparse import ArgumentParser
+from DataIO import DataIO
+from TourSolver import TourSolver
+from ModelBuilder import ModelBuilder
+from StoerWagner import StoerWagner
+from SubtourSeparation import SubtourSeparation
+from SolverBackend import SolverBackend
+
+
+class Benchmark:
+    """
+    Class containing implementation of functions used to benchmark the solver configurations over a directory
+    of instances. The wall time of every run is split into the phases of the cutting-plane loop, the cost of
+    every tour is checked against the reference tour file of the instance, and the results can be stored as
+    a JSON baseline and compared against an earlier baseline to flag regressions
+    """
+
+    CONFIGURATIONS = {
+        "cutting-plane-gurobi": tuple(("cutting-plane", "gurobi", True)),
+        "cutting-plane-highs": tuple(("cutting-plane", "highs", True)),
+        "branch-and-cut-gurobi": tuple(("branch-and-cut", "gurobi", True)),
+        "branch-and-cut-highs": tuple(("branch-and-cut", "highs", True)),
+        "held-karp": tuple(("held-karp", None, True)),
+        "heuristic": tuple(("heuristic", None, False))
+    }  # registry of the solver configurations, mapping configuration names to algorithms, backends and exactness
+
+    # configurations run by default - the dynamic program takes minutes on the instances with over 20 nodes
+    DEFAULT_CONFIGURATIONS = tuple(("cutting-plane-gurobi", "cutting-plane-highs", "branch-and-cut-highs", "heuristic"))
+
+    # phases of a run - the parse phase covers reading the instance, the build phase constructing the model, the
+    # solve phase every LP/MIP solve, the conversion phase constructing every support graph and the separation
+    # phase every Stoer-Wagner minimum cut computation
+    PHASES = tuple(("parse", "build", "solve", "conversion", "separation"))
+
+    TOLERANCE = 1e-6  # numerical tolerance used for comparing tour costs
+
+    SLOWDOWN_TOLERANCE = 0.25  # relative increase of the wall time reported as a regression
+
+    NOISE_FLOOR = 0.05  # number of seconds below which changes of the wall time are ignored
+
+    @staticmethod
+    def apply(instance_directory, reference_directory, configuration_names, time_limit=None, num_repeats=1,
+              cache_directory=None):
+        """
+        Given the directory of the instances, the directory of the reference tour files, the names of the solver
+        configurations, the time limit per run in seconds (if any), the number of repetitions per run and the
+        directory of the binary instance cache (if any, in which case the parse phase reads the cache), runs
+        every configuration on every instance and returns the results as a dictionary mapping configuration
+        names to dictionaries mapping instance names to the result of the fastest repetition
+        """
+        from BatchSolver import BatchSolver
+
+        environments = dict()  # solver environments, created once per backend so that license checks are not timed
+        results = dict()
+        for configuration_name in configuration_names:
+            if configuration_name not in Benchmark.CONFIGURATIONS:  # if the configuration is unknown
+                raise Exception("Error: Unknown benchmark configuration " + str(configuration_name))
+            algorithm, backend_name, exact = Benchmark.CONFIGURATIONS[configuration_name]
+            if backend_name is not None and backend_name not in environments:
+                environments[backend_name] = SolverBackend.create_environment(backend_name, quiet=True)
+
+            results[configuration_name] = dict()
+            for filename in BatchSolver.find_instances(instance_directory):
+                instance_name = path.basename(filename).split(".").pop(0)  # retrieve the graph name
+                runs = [
+                    Benchmark.run(filename, algorithm, backend_name, environments.get(backend_name), time_limit,
+                                  cache_directory)
+                    for repeat in range(num_repeats)
+                ]  # repeat the run, keeping the fastest repetition
+                result = min(runs, key=lambda run: run["time"])
+
+                reference_filename = path.join(reference_directory, instance_name + "_tour.txt")
+                result["reference"] = \
+                    DataIO.read_tour_cost(reference_filename) if path.isfile(reference_filename) else None
+                # exact configurations must match the reference tour, heuristic ones must not beat it
+                result["correct"] = \
+                    None if result["cost"] is None or result["reference"] is None else \
+                    abs(result["cost"] - result["reference"]) <= Benchmark.TOLERANCE if exact else \
+                    result["cost"] >= result["reference"] - Benchmark.TOLERANCE
+                results[configuration_name][instance_name] = result
+        return results  # return the results
+
+    @staticmethod
+    def run(filename, algorithm, backend_name, environment, time_limit, cache_directory=None):
+        """
+        Given the name of a file containing a graph, the name of the algorithm and of the backend, the solver
+        environment (if any), the time limit in seconds (if any) and the directory of the binary instance cache
+        (if any), solves the instance once and returns a dictionary holding the wall time, the time spent in
+        every phase, the cost, the number of iterations and of cuts, the per-iteration events emitted by the
+        solver and the error message if the run failed
+        """
+        phase_times = dict({phase: 0.0 for phase in Benchmark.PHASES})
+        result = dict({"time": 0.0, "phases": phase_times, "cost": None, "iterations": None, "cuts": None,
+                       "trace": list(), "error": None})
+        timed_functions = [
+            tuple((ModelBuilder, "build_model", "build")),
+            tuple((SubtourSeparation, "construct_support_graph", "conversion")),
+            tuple((StoerWagner, "compute_minimum_cut", "separation"))
+        ]  # functions whose time is attributed to a phase
+        if backend_name is not None:
+            timed_functions.append(tuple((SolverBackend.get_backend_class(backend_name), "optimize", "solve")))
+
+        originals = [Benchmark.__install_timer(cls, name, phase, phase_times) for cls, name, phase in timed_functions]
+        t0 = time()  # start recording
+        try:
+            if cache_directory is None:  # read the graph
+                graph = DataIO.read_graph(filename)
+            else:  # read the graph through the binary cache
+                from InstanceCache import InstanceCache
+                graph = InstanceCache.read_graph(filename, cache_directory)
+            phase_times["parse"] = time() - t0
+            solution = TourSolver.solve(graph, algorithm, backend_name or "gurobi", environment, "best-first",
+                                        False, time_limit, result["trace"].append)
+            result["cost"] = float(solution["cost"])
+            result["iterations"], result["cuts"] = solution["iterations"], solution["cuts"]
+        except Exception as exception:  # record the failure instead of aborting the benchmark
+            result["error"] = str(exception)
+        finally:
+            result["time"] = time() - t0  # stop recording the time
+            for (cls, name, phase), original in zip(timed_functions, originals):  # remove the timers
+                setattr(cls, name, original)
+        return result  # return the result
+
+    @staticmethod
+    def compare(results, baseline, slowdown_tolerance=SLOWDOWN_TOLERANCE):
+        """
+        Given the results of a benchmark, a baseline produced by an earlier benchmark and the relative slowdown
+        tolerated, returns the list of regressions as strings - runs that failed although they succeeded in the
+        baseline, runs whose cost no longer matches the reference or increased, and runs that became slower by
+        more than the slowdown tolerance
+        """
+        regressions = list()
+        for configuration_name in sorted(results.keys()):
+            for instance_name in sorted(results[configuration_name].keys()):
+                result = results[configuration_name][instance_name]
+                expected = baseline.get(configuration_name, dict()).get(instance_name)
+                if expected is None:  # if the run is not part of the baseline
+                    continue
+                label = configuration_name + " on " + instance_name + ": "
+                if result["error"] is not None and expected["error"] is None:
+                    regressions.append(label + "failed with " + result["error"])
+                elif result["correct"] is False and expected["correct"] is not False:
+                    regressions.append(label + "cost " + str(result["cost"]) + " differs from the reference " +
+                                       str(result["reference"]))
+                elif result["error"] is None and expected["error"] is None and \
+                        result["cost"] > expected["cost"] + Benchmark.TOLERANCE:
+                    regressions.append(label + "cost increased from " + str(expected["cost"]) + " to " +
+                                       str(result["cost"]))
+                elif result["error"] is None and expected["error"] is None and \
+                        result["time"] - expected["time"] > Benchmark.NOISE_FLOOR and \
+                        result["time"] > (1 + slowdown_tolerance) * expected["time"]:
+                    regressions.append(label + "time increased from " + "%.3f" % expected["time"] + " to " +
+                                       "%.3f" % result["time"] + " seconds")
+        return regressions  # return the regressions
+
+    @staticmethod
+    def format_table(results):
+        """
+        Given the results of a benchmark, returns a table with one line per run, listing the wall time, the
+        time spent in every phase and whether the cost matches the reference
+        """
+        header = ["configuration", "instance", "time"] + list(Benchmark.PHASES) + ["cost", "status"]
+        lines = ["".join([column.ljust(24 if index < 2 else 12) for index, column in enumerate(header)])]
+        for configuration_name in sorted(results.keys()):
+            for instance_name in sorted(results[configuration_name].keys()):
+                result = results[configuration_name][instance_name]
+                if result["error"] is not None:
+                    status = "error"
+                else:
+                    status = dict({True: "ok", False: "WRONG", None: "unchecked"})[result["correct"]]
+                columns = [configuration_name, instance_name, "%.3f" % result["time"]] + \
+                          ["%.3f" % result["phases"][phase] for phase in Benchmark.PHASES] + \
+                          [str(result["cost"]), status]
+                lines.append("".join([column.ljust(24 if index < 2 else 12) for index, column in enumerate(columns)]))
+        return "\n".join(lines)  # return the table
+
+    @staticmethod
+    def __install_timer(cls, name, phase, phase_times):
+        """
+        Helper function that replaces the function of the input class by a wrapper that adds the time spent in
+        the function to the input phase, and returns the original attribute so that it can be restored
+        """
+        original = cls.__dict__[name]
+        static = isinstance(original, staticmethod)
+        function = original.__func__ if static else original
+
+        def timed_function(*args, **kwargs):
+            t0 = time()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                phase_times[phase] += time() - t0
+
+        setattr(cls, name, staticmethod(timed_function) if static else timed_function)
+        return original  # return the original attribute
+
+
+def main(argv=None):
+    """
+    Entry point of the benchmark - given the command line arguments (defaults to sys.argv), runs the benchmark,
+    prints the results, optionally stores them as a baseline and compares them against a baseline. Returns
+    the exit status, which is non-zero if a regression was found
+    """
+    parser = ArgumentParser(description="Benchmarks the solver configurations over a directory of instances.")
+    parser.add_argument("-c", "--configurations", default=",".join(Benchmark.DEFAULT_CONFIGURATIONS),
+                        help="comma-separated configuration names among " +
+                             ", ".join(sorted(Benchmark.CONFIGURATIONS.keys())))
+    parser.add_argument("-i", "--instances", default="Data", help="directory of the instances (default: Data)")
+    parser.add_argument("-r", "--references", default=".",
+                        help="directory of the reference tour files (default: .)")
+    parser.add_argument("-t", "--time-limit", type=float, default=None, help="time limit per run in seconds")
+    parser.add_argument("-n", "--repeats", type=int, default=1, help="repetitions per run (default: 1)")
+    parser.add_argument("--cache", help="directory of the binary instance cache used to read the instances")
+    parser.add_argument("-s", "--save", help="file to which the results are stored as a baseline")
+    parser.add_argument("-b", "--baseline", help="baseline file against which the results are compared")
+    parser.add_argument("--slowdown", type=float, default=Benchmark.SLOWDOWN_TOLERANCE,
+                        help="relative slowdown reported as a regression (default: " +
+                             str(Benchmark.SLOWDOWN_TOLERANCE) + ")")
+    arguments = parser.parse_args(argv)
+
+    results = Benchmark.apply(arguments.instances, arguments.references, arguments.configurations.split(","),
+                              arguments.time_limit, arguments.repeats, arguments.cache)
+    print(Benchmark.format_table(results))
+
+    if arguments.save:  # store the results as a baseline
+        with open(arguments.save, 'w') as file:
+            json.dump(dict({"platform": platform.platform(), "python": platform.python_version(),
+                            "results": results}), file, indent=2, sort_keys=True)
+
+    if arguments.baseline:  # compare the results against the baseline
+        with open(arguments.baseline, 'r') as file:
+            regressions = Benchmark.compare(results, json.load(file)["results"], arguments.slowdown)
+        for regression in regressions:
+            print("REGRESSION: " + regression)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
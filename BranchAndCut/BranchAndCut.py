@@ -0,0 +1,230 @@
+from time import time
+from heapq import heappush, heappop
+from CutPool import CutPool
+from ModelBuilder import ModelBuilder
+from SolverBackend import SolverBackend
+from SubtourSeparation import SubtourSeparation
+from NearestNeighborAlgorithm import NearestNeighborAlgorithm
+
+
+class BranchAndCut:
+    """
+    Class that houses a self-contained branch-and-cut engine for the TSP. The LP relaxation is solved by a
+    SolverBackend (HiGHS by default), subtour-elimination constraints are separated at every node of the
+    tree using the Stoer-Wagner algorithm, the tree branches on fractional edges and nodes are pruned
+    against the best known tour, starting from a nearest neighbor tour
+
+    NOTE: Subtour-elimination constraints are valid for every node of the tree, so all cuts are added to
+    the one LP shared by the whole tree and branching decisions are applied as variable bounds. The cuts are
+    managed by a CutPool, which removes cuts that stay slack and adds them back once they are violated again
+    """
+
+    BEST_FIRST = "best-first"  # node selection rules
+    DEPTH_FIRST = "depth-first"
+
+    TOLERANCE = 1e-6  # numerical tolerance used for integrality and pruning
+
+    @staticmethod
+    def apply(graph, node_selection=BEST_FIRST, backend_name="highs", incumbent=None, environment=None,
+              statistics=None, deadline=None, callback=None, checkpoint=None, max_age=CutPool.MAX_AGE):
+        """
+        Given a graph represented as a dictionary, the node selection rule and the name of the LP backend,
+        solves the TSP over the input graph and returns the optimal tour as a list of node pairs along with
+        its cost. If a SharedIncumbent object is given, tours found by other processes are used for pruning
+        and the tours found by the tree are published to it. The LP is created within the environment of the
+        backend, if given, and the number of LP solves, of subtour-elimination constraints added and of tree
+        nodes explored are recorded in the statistics dictionary, if given. If a deadline is given, an
+        exception is raised once it has passed. If a callback is given, it is called with an event dictionary
+        after every LP solve - see Telemetry for the fields of the events, to which the number of the tree node
+        and the cost of the incumbent tour are added. If a Checkpoint object is given, its cuts are added to the
+        LP and its tour is adopted before the root is solved, and the cuts, the lower bound of the tree and the
+        best tour are saved to it periodically and when the tree is done, also if it fails with an exception.
+        Cuts that are slack for max_age consecutive LP solves are removed from the LP (never if max_age is None)
+        """
+        if node_selection not in (BranchAndCut.BEST_FIRST, BranchAndCut.DEPTH_FIRST):  # if the rule is unknown
+            raise Exception("Error: Unknown node selection rule " + str(node_selection))
+
+        backend = SolverBackend.create(backend_name, "TSP", relaxed=True, environment=environment)  # create the LP
+        backend.set_deadline(deadline)
+        variables = ModelBuilder.build_model(graph, backend)  # add the variables and degree-2 constraints
+        pairs = sorted(variables.keys())  # fix the order of the decision variables
+        cut_pool = CutPool(backend, variables, max_age)
+
+        best_tour, upper_bound = BranchAndCut.__construct_initial_tour(graph)  # initialize the incumbent
+        if checkpoint is not None:  # resume from the cuts and the tour of a previous run
+            for partition in checkpoint.get_partitions():
+                cut_pool.add(partition)
+            if checkpoint.tour_cost < upper_bound:
+                best_tour, upper_bound = checkpoint.tour, checkpoint.tour_cost
+            elif best_tour is not None:  # record the initial tour
+                checkpoint.update_tour(best_tour, upper_bound)
+        if incumbent is not None and best_tour is not None:  # publish the initial tour
+            incumbent.update(best_tour, upper_bound)
+
+        counters = dict({"iterations": 0, "cuts": 0, "nodes": 0})  # statistics of the solve
+        try:
+            best_tour, upper_bound = \
+                BranchAndCut.__explore_tree(graph, node_selection, incumbent, backend, variables, pairs, cut_pool,
+                                            best_tour, upper_bound, counters, callback, checkpoint)
+        finally:
+            if checkpoint is not None:  # keep the cuts if the tree fails, e.g. when the time limit is reached
+                checkpoint.save()
+
+        if statistics is not None:  # record the statistics of the solve
+            statistics.update(counters)
+        if best_tour is None:  # if no tour was found
+            raise Exception("Error: The input graph does not contain a tour")
+        return best_tour, upper_bound  # return the optimal tour and its cost
+
+    @staticmethod
+    def __explore_tree(graph, node_selection, incumbent, backend, variables, pairs, cut_pool, best_tour, upper_bound,
+                       counters, callback, checkpoint):
+        """
+        Helper function that explores the branch-and-cut tree starting from the root and returns the optimal
+        tour and its cost, or None and an infinite cost if the graph contains no tour
+        """
+        open_nodes = list()  # priority queue of the unexplored nodes of the tree
+        num_nodes = 0  # number of nodes pushed onto the queue so far
+        BranchAndCut.__push_node(open_nodes, node_selection, num_nodes, float('-inf'), 0, dict())
+
+        while open_nodes:  # while unexplored nodes remain
+            priority, bound, depth, fixings = heappop(open_nodes)  # select the next node
+            if incumbent is not None and incumbent.get_cost() < upper_bound:  # adopt a better shared tour
+                best_tour, upper_bound = incumbent.get()
+            if bound >= upper_bound - BranchAndCut.TOLERANCE:  # if the node cannot improve the incumbent
+                continue  # prune the node
+            if checkpoint is not None:  # every tour is either the incumbent or a tour within an unexplored node
+                checkpoint.update_lower_bound(min([open_node[1] for open_node in open_nodes] + [bound, upper_bound]))
+                checkpoint.save_if_due()
+
+            # solve the LP relaxation of the node
+            counters["nodes"] += 1
+            # the lowest bound of the other unexplored nodes bounds the cost of the tours outside the node
+            lower_bound = min([open_node[1] for open_node in open_nodes] + [upper_bound]) if callback else None
+            solution = BranchAndCut.__solve_node(graph, backend, variables, pairs, cut_pool, fixings, upper_bound,
+                                                 counters, callback, lower_bound, checkpoint)
+            if solution is None:  # if the node is infeasible or cannot improve the incumbent
+                continue  # prune the node
+            lp_value, values = solution
+
+            # determine the fractional edge closest to one half
+            fractional_edges = [
+                tuple((abs(value - 0.5), pair))
+                for pair, value in zip(pairs, values)
+                if BranchAndCut.TOLERANCE < value < 1 - BranchAndCut.TOLERANCE
+            ]
+            if not fractional_edges:  # if the solution is integral, it is a better tour
+                best_tour = [pair for pair, value in zip(pairs, values) if value > 0.5]
+                upper_bound = lp_value
+                if incumbent is not None:  # publish the tour
+                    incumbent.update(best_tour, upper_bound)
+                if checkpoint is not None:  # record the tour
+                    checkpoint.update_tour(best_tour, upper_bound)
+                continue
+
+            branching_edge = min(fractional_edges)[1]
+            for value in (0, 1):  # branch on the edge - the last child is explored first by depth-first search
+                child_fixings = dict(fixings)
+                child_fixings[branching_edge] = value
+                num_nodes += 1
+                BranchAndCut.__push_node(open_nodes, node_selection, num_nodes, lp_value, depth + 1, child_fixings)
+
+        if checkpoint is not None and best_tour is not None:  # the explored tree proves the tour optimal
+            checkpoint.update_tour(best_tour, upper_bound)
+            checkpoint.update_lower_bound(upper_bound)
+        return best_tour, upper_bound  # return the optimal tour and its cost
+
+    @staticmethod
+    def __solve_node(graph, backend, variables, pairs, cut_pool, fixings, upper_bound, counters, callback,
+                     lower_bound, checkpoint):
+        """
+        Helper function that applies the branching decisions of a node as variable bounds and alternates
+        between solving the LP relaxation and adding violated subtour-elimination constraints - the violated
+        cuts of the pool that were removed from the LP, if any, or else the minimum cut of the solution -
+        counting both in the counters dictionary and reporting every solve to the callback (if any) along with
+        the lower bound of the tree outside the node, and recording the cuts in the checkpoint (if any).
+        Returns the LP value and the values of the decision variables, or None if the node can be pruned
+        """
+        handles = [variables[pair] for pair in pairs]
+        backend.set_variable_bounds(
+            handles,
+            [fixings.get(pair, 0) for pair in pairs],
+            [fixings.get(pair, 1) for pair in pairs]
+        )  # fix the variables branched on
+
+        while True:  # enter infinite loop - see below for termination criterion
+            counters["iterations"] += 1
+            t0 = time()
+            feasible = backend.optimize()  # solve the LP relaxation
+            lp_value = backend.get_objective_value() if feasible else None
+            # if the LP relaxation is infeasible or the node cannot improve the incumbent
+            if not feasible or lp_value >= upper_bound - BranchAndCut.TOLERANCE:
+                BranchAndCut.__report(callback, backend, counters, lp_value, lower_bound, upper_bound, None,
+                                      time() - t0, 0.0)
+                return None
+            values = backend.get_values(handles)  # read all values in a single call
+            t1 = time()
+
+            num_restored = cut_pool.restore(values)  # add back the violated cuts of the pool
+            if num_restored:  # if removed cuts are violated, solve again before separating new cuts
+                BranchAndCut.__report(callback, backend, counters, lp_value, lower_bound, upper_bound, None,
+                                      t1 - t0, time() - t1, num_restored)
+                cut_pool.age(values)
+                continue
+
+            # look for a violated subtour-elimination constraint
+            partition, minimum_cut_weight = SubtourSeparation.apply(graph.keys(), dict(zip(pairs, values)))
+            BranchAndCut.__report(callback, backend, counters, lp_value, lower_bound, upper_bound,
+                                  minimum_cut_weight, t1 - t0, time() - t1, 0 if partition is None else 1)
+            if partition is None:  # if no constraint is violated
+                return lp_value, values
+
+            # add the subtour-elimination constraint to the LP shared by all nodes
+            cut_pool.age(values)
+            cut_pool.add(partition)
+            counters["cuts"] += 1
+            if checkpoint is not None:  # record the cut
+                checkpoint.add_cut(partition)
+
+    @staticmethod
+    def __report(callback, backend, counters, lp_value, lower_bound, upper_bound, minimum_cut_weight, solve_time,
+                 separation_time, num_cuts_added=0):
+        """
+        Helper function that calls the callback (if any) with the event of the last LP solve
+        """
+        if callback is None:  # if no callback is given
+            return
+        num_variables, num_constraints = backend.get_model_size()
+        if lp_value is not None:  # the LP value bounds the cost of the tours within the node
+            lower_bound = min(lower_bound, lp_value)
+        callback(dict({
+            "event": "iteration", "algorithm": "branch-and-cut", "iteration": counters["iterations"],
+            "node": counters["nodes"], "objective": lp_value, "bound": lower_bound, "incumbent": upper_bound,
+            "cuts_added": num_cuts_added, "min_cut_weight": minimum_cut_weight,
+            "solve_time": solve_time, "separation_time": separation_time,
+            "num_variables": num_variables, "num_constraints": num_constraints
+        }))
+
+    @staticmethod
+    def __push_node(open_nodes, node_selection, sequence_number, bound, depth, fixings):
+        """
+        Helper function that pushes a node onto the priority queue. Best-first search orders the nodes by
+        their LP bound and depth-first search by decreasing depth, most recent node first
+        """
+        if node_selection == BranchAndCut.BEST_FIRST:
+            priority = tuple((bound, sequence_number))
+        else:
+            priority = tuple((-depth, -sequence_number))
+        heappush(open_nodes, tuple((priority, bound, depth, fixings)))
+
+    @staticmethod
+    def __construct_initial_tour(graph):
+        """
+        Helper function that returns a nearest neighbor tour as a list of node pairs along with its cost, or
+        None and an infinite cost if no such tour exists
+        """
+        ordering = NearestNeighborAlgorithm.apply_dictionary_form(graph, min(graph.keys()))
+        if ordering is None:  # if no tour was found
+            return None, float('inf')
+        tour = [tuple((min(i, j), max(i, j))) for i, j in zip(ordering, ordering[1:] + ordering[:1])]
+        return tour, float(sum([graph[i][j] for i, j in tour]))  # return the tour and its cost
@@ -0,0 +1,128 @@
+import json
+from os import path
+try:
+    from os import replace
+except ImportError:  # python 2 has no os.replace - its rename already overwrites the target on POSIX
+    from os import rename as replace
+from time import time
+from zlib import crc32
+
+
+class Checkpoint:
+    """
+    Class that houses the checkpoint of a long-running solve - the subtour-elimination constraints generated so
+    far, the best known tour and the best known lower bound. Every cut is stored as the bitmap of one side of its
+    vertex partition over the sorted node names, so that a resumed solve can rebuild its model with all prior cuts
+    before the first solve instead of repeating the separation rounds that found them
+
+    NOTE: Node names must be integers, as produced by DataIO.read_graph. The checkpoint records a fingerprint of
+    the instance and refuses to resume a different instance
+    """
+
+    INTERVAL = 60.0  # default number of seconds between periodic saves
+
+    def __init__(self, filename, graph, interval=INTERVAL):
+        """
+        Constructor for the Checkpoint class - used to initialize all necessary fields of the Checkpoint object.
+        Given the name of the checkpoint file, a graph represented as a dictionary and the number of seconds
+        between periodic saves, creates an empty checkpoint of the instance
+        """
+        self.filename = filename  # initialize all necessary fields
+        self.interval = interval
+        self.node_names = sorted(graph.keys())  # the bit of every node is its position in the sorted order
+        self.node_bits = dict({node_name: 1 << index for index, node_name in enumerate(self.node_names)})
+        self.fingerprint = Checkpoint.compute_fingerprint(graph)
+        self.cuts = list()  # bitmaps of the sides of the cuts, in the order in which the cuts were added
+        self.tour = None  # best known tour as a list of node pairs
+        self.tour_cost = float('inf')  # cost of the best known tour
+        self.lower_bound = float('-inf')  # best known lower bound on the cost of a tour
+        self.last_save_time = time()
+
+    @staticmethod
+    def compute_fingerprint(graph):
+        """
+        Given a graph represented as a dictionary, returns a checksum of its nodes, edges and weights
+        """
+        edges = sorted([tuple((i, j, graph[i][j])) for i in graph.keys() for j in graph[i].keys() if i < j])
+        return "%d:%08x" % (len(graph.keys()), crc32(repr(edges).encode("ascii")) & 0xffffffff)
+
+    def add_cut(self, partition):
+        """
+        Given one side of the vertex partition of a subtour-elimination constraint as a collection of node names,
+        records the cut. Both sides of a partition describe the same cut, so the side holding the first node is
+        stored as its complement
+        """
+        bitmap = 0
+        for node_name in partition:  # set the bits of the nodes on the side
+            bitmap |= self.node_bits[node_name]
+        if bitmap & 1:  # store the side without the first node
+            bitmap ^= (1 << len(self.node_names)) - 1
+        self.cuts.append(bitmap)
+
+    def get_partitions(self):
+        """
+        Returns the recorded cuts as a list of frozensets of node names, one side of the partition per cut
+        """
+        return \
+            [
+                frozenset({node_name for node_name in self.node_names if bitmap & self.node_bits[node_name]})
+                for bitmap in self.cuts
+            ]
+
+    def update_tour(self, tour, cost):
+        """
+        Given a tour as a list of node pairs and its cost, records the tour if it is cheaper than the best
+        known tour
+        """
+        if cost < self.tour_cost:  # if the tour improves the best known tour
+            self.tour, self.tour_cost = [tuple((i, j)) for i, j in tour], float(cost)
+
+    def update_lower_bound(self, lower_bound):
+        """
+        Given a lower bound on the cost of a tour, records the bound if it is tighter than the best known bound
+        """
+        self.lower_bound = max(self.lower_bound, float(lower_bound))
+
+    def save_if_due(self):
+        """
+        Saves the checkpoint if the interval between periodic saves has elapsed since the last save
+        """
+        if time() - self.last_save_time >= self.interval:
+            self.save()
+
+    def save(self):
+        """
+        Writes the checkpoint to its file. The file is replaced atomically, so that a crash during the save
+        leaves the previous checkpoint intact
+        """
+        content = dict({
+            "fingerprint": self.fingerprint,
+            "num_nodes": len(self.node_names),
+            "cuts": [format(bitmap, "x") for bitmap in self.cuts],  # bitmaps as hexadecimal strings
+            "tour": self.tour,
+            "tour_cost": self.tour_cost if self.tour is not None else None,
+            "lower_bound": self.lower_bound if self.lower_bound != float('-inf') else None
+        })
+        temporary_filename = self.filename + ".tmp"
+        with open(temporary_filename, 'w') as file:
+            json.dump(content, file, separators=(",", ":"))
+        replace(temporary_filename, self.filename)  # atomically replace the previous checkpoint, also on Windows
+        self.last_save_time = time()
+
+    def load(self):
+        """
+        Reads the checkpoint from its file, if the file exists. Returns True if a checkpoint was read and False
+        if there is none. Raises an exception if the checkpoint belongs to a different instance
+        """
+        if not path.isfile(self.filename):  # if no checkpoint was saved
+            return False
+        with open(self.filename, 'r') as file:
+            content = json.load(file)
+        if content["fingerprint"] != self.fingerprint:  # if the checkpoint belongs to a different instance
+            raise Exception("Error: The checkpoint " + self.filename + " belongs to a different instance")
+        self.cuts = [int(bitmap, 16) for bitmap in content["cuts"]]
+        if content["tour"] is not None:
+            self.tour, self.tour_cost = [tuple((i, j)) for i, j in content["tour"]], float(content["tour_cost"])
+        if content["lower_bound"] is not None:
+            self.lower_bound = float(content["lower_bound"])
+        return True
@@ -0,0 +1,129 @@
+from SolverBackend import SolverBackend
+
+
+class CutPool:
+    """
+    Class that houses the pool of subtour-elimination constraints of a model. Every cut is stored under a
+    canonical key - the bitmap of the smaller side of its vertex partition over the sorted node names - so that
+    both sides of a partition and repeated separations of the same partition map to the same cut. Cuts that
+    stay slack for a number of consecutive solves are removed from the model but kept in the pool, and are
+    added back once a solution violates them again, so that the model only holds the cuts that are binding
+
+    NOTE: A cut that was added back is never removed again, so that cuts cannot cycle in and out of the model
+    """
+
+    MAX_AGE = 10  # default number of consecutive slack solves after which a cut is removed from the model
+
+    TOLERANCE = 1e-6  # numerical tolerance used for deciding whether a cut is slack or violated
+
+    def __init__(self, backend, variables, max_age=MAX_AGE, lazy=False):
+        """
+        Constructor for the CutPool class - used to initialize all necessary fields of the CutPool object.
+        Given a SolverBackend object, the dictionary of its decision variables keyed by node pairs, the number
+        of consecutive slack solves after which a cut is removed from the model (None to never remove cuts)
+        and whether the cuts are added as lazy cuts, creates an empty pool
+        """
+        self.backend = backend  # initialize all necessary fields
+        self.max_age = max_age
+        self.lazy = lazy
+        self.pairs = sorted(variables.keys())  # the values passed to restore and age are ordered like the pairs
+        self.handles = [variables[pair] for pair in self.pairs]
+        node_names = sorted({node_name for pair in self.pairs for node_name in pair})
+        self.node_bits = dict({node_name: 1 << index for index, node_name in enumerate(node_names)})
+        self.num_nodes = len(node_names)
+        self.columns = dict()  # positions of the variables of every cut within the pairs, keyed by cut key
+        self.constraints = dict()  # handles of the cuts in the model, keyed by cut key
+        self.ages = dict()  # number of consecutive slack solves of the cuts in the model, keyed by cut key
+        self.permanent = set()  # keys of the cuts that are never removed from the model
+        self.num_removed = 0  # number of times a cut was removed from the model
+        self.num_restored = 0  # number of times a removed cut was added back to the model
+
+    def get_key(self, partition):
+        """
+        Given one side of a vertex partition as a collection of node names, returns the canonical key of its
+        cut - the bitmap of the side with fewer nodes, or of the side without the first node if both sides
+        have the same size
+        """
+        bitmap = 0
+        for node_name in partition:  # set the bits of the nodes on the side
+            bitmap |= self.node_bits[node_name]
+        size = bin(bitmap).count("1")
+        if 2 * size > self.num_nodes or (2 * size == self.num_nodes and bitmap & 1):  # take the other side
+            bitmap ^= (1 << self.num_nodes) - 1
+        return bitmap  # return the key
+
+    def add(self, partition):
+        """
+        Given one side of a vertex partition as a collection of node names, adds its subtour-elimination
+        constraint to the pool and the model. Returns True if the cut was added to the model and False if the
+        model already holds it
+        """
+        key = self.get_key(partition)
+        if key in self.constraints:  # if the model already holds the cut
+            return False
+        if key not in self.columns:  # if the cut is new, find the edges crossing the partition
+            self.columns[key] = [
+                index
+                for index, (i, j) in enumerate(self.pairs)
+                if bool(key & self.node_bits[i]) != bool(key & self.node_bits[j])
+            ]
+        self.__activate(key)
+        return True
+
+    def restore(self, values):
+        """
+        Given the values of the decision variables in the order of the sorted node pairs, adds the removed cuts
+        violated by the solution back to the model. Returns the number of cuts added back
+        """
+        violated_keys = [
+            key
+            for key in self.columns.keys()
+            if key not in self.constraints and
+            sum([values[index] for index in self.columns[key]]) < 2 - CutPool.TOLERANCE
+        ]  # removed cuts violated by the solution
+        for key in violated_keys:  # add the violated cuts back
+            self.__activate(key)
+            self.permanent.add(key)
+            self.num_restored += 1
+        return len(violated_keys)  # return the number of cuts added back
+
+    def age(self, values):
+        """
+        Given the values of the decision variables in the order of the sorted node pairs, ages the cuts of the
+        model and removes those that have been slack for too many consecutive solves. Removing a cut discards
+        the solution of some backends, so cuts are aged only once the solution is no longer needed
+        """
+        if self.max_age is None:  # if cuts are never removed
+            return
+        for key in list(self.constraints.keys()):  # age the cuts of the model
+            if key in self.permanent:
+                continue
+            if sum([values[index] for index in self.columns[key]]) > 2 + CutPool.TOLERANCE:  # if the cut is slack
+                self.ages[key] += 1
+            else:
+                self.ages[key] = 0
+            if self.ages[key] >= self.max_age:  # remove the cut from the model
+                self.backend.remove_constraint(self.constraints.pop(key))
+                del self.ages[key]
+                self.num_removed += 1
+
+    def get_num_cuts(self):
+        """
+        Returns the number of distinct cuts in the pool
+        """
+        return len(self.columns)
+
+    def get_num_active_cuts(self):
+        """
+        Returns the number of cuts in the model
+        """
+        return len(self.constraints)
+
+    def __activate(self, key):
+        """
+        Helper function that adds the subtour-elimination constraint of the input key to the model
+        """
+        sec_variables = [self.handles[index] for index in self.columns[key]]
+        add_cut = self.backend.add_lazy_cut if self.lazy else self.backend.add_constraint
+        self.constraints[key] = add_cut(sec_variables, [1] * len(sec_variables), SolverBackend.GREATER_EQUAL, 2)
+        self.ages[key] = 0
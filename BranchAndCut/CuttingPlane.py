@@ -0,0 +1,108 @@
+from time import time
+from ModelBuilder import ModelBuilder
+from CutPool import CutPool
+from SubtourSeparation import SubtourSeparation
+from GraphProcessing import GraphProcessing
+
+
+class CuttingPlane:
+    """
+    Class that houses the cutting-plane loop for the TSP. The integer program with only the degree-2
+    constraints is solved repeatedly, and after every solve the subtour-elimination constraint of the
+    minimum cut of the solution is added to the model, until the solution is a single tour. The cuts are
+    managed by a CutPool, which removes cuts that stay slack and adds them back once they are violated again
+    """
+
+    @staticmethod
+    def apply(graph, backend, statistics=None, verbose=False, callback=None, checkpoint=None,
+              max_age=CutPool.MAX_AGE):
+        """
+        Given a graph represented as a dictionary (with integer node names) and an empty SolverBackend object,
+        builds the model of the TSP on the backend, with twice the weight of the minimum spanning tree as an
+        upper bound on the objective, and solves it to optimality. Returns the dictionary of decision variables
+        keyed by node pairs. If a statistics dictionary is given, the number of iterations and the number of
+        subtour-elimination constraints added are recorded in it. If a callback is given, it is called with an
+        event dictionary after every iteration - see Telemetry for the fields of the events. If a Checkpoint
+        object is given, its cuts are added to the model before the first solve, and the cuts, the bound and
+        the final tour are saved to it periodically and when the loop ends, also if it ends with an exception.
+        Cuts that are slack for max_age consecutive solves are removed from the model (never if max_age is None)
+        """
+        mst, mst_weight = GraphProcessing.compute_minimum_spanning_tree(graph)  # compute the mst weight
+
+        # add the variables and constraints with an upper bound of 2 * MST weight
+        variables = ModelBuilder.build_model(graph, backend, 2 * mst_weight)
+        pairs = sorted(variables.keys())  # fix the order of the decision variables
+        cut_pool = CutPool(backend, variables, max_age, lazy=True)
+
+        if checkpoint is not None:  # rebuild the cuts of a previous run
+            for partition in checkpoint.get_partitions():
+                cut_pool.add(partition)
+
+        try:
+            CuttingPlane.__run(graph, backend, variables, pairs, cut_pool, statistics, verbose, callback, checkpoint)
+        finally:
+            if checkpoint is not None:  # keep the cuts if the loop fails, e.g. when the time limit is reached
+                checkpoint.save()
+        return variables  # return the decision variables
+
+    @staticmethod
+    def __run(graph, backend, variables, pairs, cut_pool, statistics, verbose, callback, checkpoint):
+        """
+        Helper function that alternates between solving the model and adding violated subtour-elimination
+        constraints until the solution is a tour. If the solution violates cuts of the pool that were removed
+        from the model, these are added back instead of separating a new cut
+        """
+        handles = [variables[pair] for pair in pairs]
+        iter_index = 1  # initialize iteration index
+        num_cuts = 0  # initialize the number of subtour-elimination constraints
+
+        while True:  # enter infinite loop - see below for termination criterion
+
+            if verbose:
+                print("\nIteration Count: " + str(iter_index) + "\n")  # print the iteration count
+
+            t0 = time()
+            if not backend.optimize():  # solve the program - the model only becomes infeasible without a tour
+                raise Exception("Error: The input graph does not contain a tour")
+
+            values = backend.get_values(handles)  # read the values of all decision variables in a single call
+            t1 = time()
+
+            num_restored = cut_pool.restore(values)  # add back the violated cuts of the pool
+            # get one side of the minimum cut of the solution, if its weight is below 2
+            partition, minimum_cut_weight = \
+                tuple((None, None)) if num_restored else SubtourSeparation.apply(graph.keys(), dict(zip(pairs, values)))
+
+            if callback is not None:  # report the iteration
+                num_variables, num_constraints = backend.get_model_size()
+                callback(dict({
+                    "event": "iteration", "algorithm": "cutting-plane", "iteration": iter_index,
+                    "objective": backend.get_objective_value(), "bound": backend.get_objective_bound(),
+                    "cuts_added": num_restored + (0 if partition is None else 1),
+                    "min_cut_weight": minimum_cut_weight,
+                    "solve_time": t1 - t0, "separation_time": time() - t1,
+                    "num_variables": num_variables, "num_constraints": num_constraints
+                }))
+
+            if checkpoint is not None:  # every solve bounds the cost of a tour
+                checkpoint.update_lower_bound(backend.get_objective_bound())
+
+            if partition is None and not num_restored:  # if the minimum cut weight is greater than or equal to 2
+                break  # break from infinite loop
+
+            cut_pool.age(values)  # remove the cuts that stayed slack
+            if partition is not None:  # add the subtour-elimination constraint of the minimum cut to the model
+                cut_pool.add(partition)
+                num_cuts += 1
+                if checkpoint is not None:  # record the cut
+                    checkpoint.add_cut(partition)
+                    checkpoint.save_if_due()
+
+            iter_index += 1  # update the iteration counter
+
+        if checkpoint is not None:  # record the optimal tour
+            checkpoint.update_tour([pair for pair, value in zip(pairs, values) if value > 0.5],
+                                   backend.get_objective_value())
+        if statistics is not None:  # record the statistics of the solve
+            statistics["iterations"] = iter_index
+            statistics["cuts"] = num_cuts
@@ -0,0 +1,4 @@
+from BranchAndCut import BranchAndCut
+from Checkpoint import Checkpoint
+from CutPool import CutPool
+from CuttingPlane import CuttingPlane
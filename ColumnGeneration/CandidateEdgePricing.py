@@ -0,0 +1,238 @@
+from time import time
+from gurobipy import *
+from ModelBuilder import ModelBuilder
+from GurobiBackend import GurobiBackend
+from SolverBackend import SolverBackend
+from GraphProcessing import GraphProcessing
+from SubtourSeparation import SubtourSeparation
+from NearestNeighborAlgorithm import NearestNeighborAlgorithm
+
+
+class CandidateEdgePricing:
+    """
+    Class that houses a sparse variant of the TSP cutting-plane loop. The model starts with only a
+    candidate edge set (the nearest neighbors of every node plus the edges of a heuristic tour) and
+    the omitted edges are priced into the model using the LP duals, so that the final tour is proven
+    optimal over the complete graph while the model only ever holds a fraction of its edges
+    """
+
+    NUM_NEIGHBORS = 10  # default number of nearest neighbors of every node in the candidate edge set
+
+    MAX_PRICED_EDGES = 100  # maximum number of omitted edges priced into the model per round
+
+    TOLERANCE = 1e-6  # numerical tolerance used for reduced costs
+
+    @staticmethod
+    def apply(graph, num_neighbors=NUM_NEIGHBORS, environment=None, statistics=None, deadline=None, callback=None):
+        """
+        Given a graph represented as a dictionary and the number of nearest neighbors per node, solves the
+        TSP over the input graph starting from the sparse candidate edge set and returns the GurobiBackend
+        object holding the solved model along with the dictionary of decision variables keyed by node pairs.
+        The model is created within the gurobi environment, if given, and the number of solves and of
+        subtour-elimination constraints added are recorded in the statistics dictionary, if given. If a
+        deadline is given, an exception is raised once it has passed. If a callback is given, it is called with
+        an event dictionary after every solve - see Telemetry for the fields of the events, to which the stage
+        of the solve is added
+
+        The solve proceeds in two stages:
+        (1) The LP relaxation is solved with subtour-elimination constraints separated on the fractional
+            support graph and omitted edges priced in whenever their reduced cost is negative
+        (2) The decision variables are made binary and the usual cutting-plane loop is run on the
+            integral solutions. Any omitted edge whose reduced cost is smaller than the gap between
+            the integral and the LP objective could still improve the tour, so such edges are added and
+            the stage is repeated until no omitted edge remains that could do so
+        """
+        # create the model - pricing relies on gurobi duals
+        backend = GurobiBackend("TSP", relaxed=True, environment=environment)
+        backend.set_deadline(deadline)
+
+        variables = {}  # decision variables keyed by node pairs
+        degree_constraints = {}  # degree-2 constraints keyed by node
+        subtour_constraints = []  # subtour-elimination constraints paired with one side of their cut
+
+        # create the continuous decision variables of the candidate edges
+        for i, j in sorted(CandidateEdgePricing.construct_candidate_edges(graph, num_neighbors)):
+            CandidateEdgePricing.__add_variable(graph, backend, variables, degree_constraints, subtour_constraints,
+                                                tuple((i, j)))
+
+        # add the degree-2 constraints
+        incidence_index = ModelBuilder.construct_incidence_index(variables.keys())
+        for node in graph.keys():
+            pairs = incidence_index.get(node, list())
+            degree_constraints[node] = \
+                backend.add_constraint([variables[pair] for pair in pairs], [1.0] * len(pairs), SolverBackend.EQUAL, 2)
+
+        num_iterations = 0  # number of solves so far
+
+        # stage (1): solve the LP relaxation over the complete graph
+        while True:
+            t0 = time()
+            backend.optimize()  # solve the LP relaxation
+            num_iterations += 1
+            t1 = time()
+            # look for a violated cut
+            partition, minimum_cut_weight = CandidateEdgePricing.__separate(graph, backend, variables)
+            # the LP value only bounds the tour cost once no omitted edge can be priced in
+            CandidateEdgePricing.__report(callback, backend, 1, num_iterations, None, partition, minimum_cut_weight,
+                                          t1 - t0, time() - t1)
+            if partition is not None:  # if a subtour-elimination constraint is violated
+                CandidateEdgePricing.__add_subtour_elimination_constraint(backend, variables, subtour_constraints,
+                                                                          partition)
+                continue
+            # price the omitted edges using the duals of the current LP
+            reduced_costs = CandidateEdgePricing.__compute_reduced_costs(graph, variables, degree_constraints,
+                                                                         subtour_constraints)
+            priced_edges = sorted(
+                [pair for pair, reduced_cost in reduced_costs.items()
+                 if reduced_cost < -CandidateEdgePricing.TOLERANCE],
+                key=reduced_costs.get
+            )[:CandidateEdgePricing.MAX_PRICED_EDGES]  # select the edges with the most negative reduced costs
+            if not priced_edges:  # if no omitted edge has a negative reduced cost, the LP bound is global
+                break
+            for pair in priced_edges:  # add the priced edges to the model
+                CandidateEdgePricing.__add_variable(graph, backend, variables, degree_constraints, subtour_constraints,
+                                                    pair)
+
+        lower_bound = backend.get_objective_value()  # record the LP bound over the complete graph
+
+        backend.set_relaxed(False)  # make the decision variables binary
+
+        # stage (2): solve the integer program and close the gap to the complete graph
+        while True:
+            t0 = time()
+            backend.optimize()  # solve the integer program
+            num_iterations += 1
+            t1 = time()
+            # look for a subtour
+            partition, minimum_cut_weight = CandidateEdgePricing.__separate(graph, backend, variables)
+            CandidateEdgePricing.__report(callback, backend, 2, num_iterations, lower_bound, partition,
+                                          minimum_cut_weight, t1 - t0, time() - t1)
+            if partition is not None:  # if a subtour-elimination constraint is violated
+                CandidateEdgePricing.__add_subtour_elimination_constraint(backend, variables, subtour_constraints,
+                                                                          partition)
+                continue
+            upper_bound = backend.get_objective_value()  # record the cost of the tour
+            # omitted edges that are still able to improve the tour
+            improving_edges = [
+                pair for pair, reduced_cost in reduced_costs.items()
+                if pair not in variables and reduced_cost < upper_bound - lower_bound - CandidateEdgePricing.TOLERANCE
+            ]
+            if not improving_edges:  # if no such edge exists, the tour is optimal over the complete graph
+                break
+            for pair in improving_edges:  # otherwise add the edges to the model
+                CandidateEdgePricing.__add_variable(graph, backend, variables, degree_constraints, subtour_constraints,
+                                                    pair)
+
+        if statistics is not None:  # record the statistics of the solve
+            statistics["iterations"] = num_iterations
+            statistics["cuts"] = len(subtour_constraints)
+        return backend, variables  # return the backend and the decision variables
+
+    @staticmethod
+    def construct_candidate_edges(graph, num_neighbors):
+        """
+        Given a graph represented as a dictionary and the number of nearest neighbors per node, returns the
+        set of candidate edges (as ordered node pairs) made up of the edges to the nearest neighbors of every
+        node and the edges of a nearest neighbor tour. If no such tour exists, all edges are returned so
+        that the initial model remains feasible
+        """
+        candidate_edges = set()  # initialize the candidate edge set
+        nearest_neighbors = GraphProcessing.compute_nearest_neighbors(graph, num_neighbors)
+        for node, neighbors in nearest_neighbors.items():  # add the edges to the nearest neighbors
+            for neighbor in neighbors:
+                candidate_edges.add(tuple((min(node, neighbor), max(node, neighbor))))
+
+        # compute a heuristic tour that guarantees the feasibility of the sparse model
+        tour = NearestNeighborAlgorithm.apply_dictionary_form(graph, min(graph.keys()))
+        if tour is None:  # if no tour could be found, fall back to the complete edge set
+            return \
+                set({
+                    tuple((i, j))
+                    for i in graph.keys()
+                    for j in graph[i].keys()
+                    if i < j
+                })
+        for i, j in zip(tour, tour[1:] + tour[:1]):  # add the edges of the tour
+            candidate_edges.add(tuple((min(i, j), max(i, j))))
+        return candidate_edges  # return the candidate edge set
+
+    @staticmethod
+    def __add_variable(graph, backend, variables, degree_constraints, subtour_constraints, pair):
+        """
+        Helper function that adds the decision variable of the input edge to the model of the backend, including
+        its coefficients in all degree-2 and subtour-elimination constraints that already exist in the model. The
+        variable is continuous while the backend is relaxed and binary otherwise
+        """
+        i, j = pair  # unpack the node pair
+        column = Column()  # collect the coefficients of the new variable
+        for node in pair:
+            if node in degree_constraints:
+                column.addTerms(1.0, degree_constraints[node])
+        for constraint, partition in subtour_constraints:
+            if (i in partition) != (j in partition):  # if the edge crosses the cut
+                column.addTerms(1.0, constraint)
+        variables[pair] = \
+            backend.get_model().addVar(lb=0.0, ub=1.0, obj=graph[i][j],
+                                       vtype=GRB.CONTINUOUS if backend.is_relaxed() else GRB.BINARY,
+                                       name=str(i) + '_' + str(j), column=column)
+
+    @staticmethod
+    def __add_subtour_elimination_constraint(backend, variables, subtour_constraints, partition):
+        """
+        Helper function that adds the subtour-elimination constraint of the input vertex partition to the
+        model of the backend and records it along with the partition
+        """
+        # the variables of the edges crossing the cut
+        crossing_variables = [var for (i, j), var in variables.items() if (i in partition) != (j in partition)]
+        constraint = backend.add_constraint(crossing_variables, [1.0] * len(crossing_variables),
+                                            SolverBackend.GREATER_EQUAL, 2)
+        subtour_constraints.append(tuple((constraint, partition)))
+
+    @staticmethod
+    def __separate(graph, backend, variables):
+        """
+        Helper function that computes the minimum cut of the support graph of the current solution and
+        returns one side of the cut as a set of nodes if its weight is below two (and None otherwise) along
+        with the weight of the cut
+        """
+        pairs = list(variables.keys())  # read the values of all decision variables in a single call
+        values = backend.get_values([variables[pair] for pair in pairs])
+        # return one side of the violated cut and the weight of the cut
+        return SubtourSeparation.apply(graph.keys(), dict(zip(pairs, values)))
+
+    @staticmethod
+    def __report(callback, backend, stage, iteration, bound, partition, minimum_cut_weight, solve_time,
+                 separation_time):
+        """
+        Helper function that calls the callback (if any) with the event of the last solve
+        """
+        if callback is None:  # if no callback is given
+            return
+        num_variables, num_constraints = backend.get_model_size()
+        callback(dict({
+            "event": "iteration", "algorithm": "edge-pricing", "stage": stage, "iteration": iteration,
+            "objective": backend.get_objective_value(), "bound": bound,
+            "cuts_added": 0 if partition is None else 1, "min_cut_weight": minimum_cut_weight,
+            "solve_time": solve_time, "separation_time": separation_time,
+            "num_variables": num_variables, "num_constraints": num_constraints
+        }))
+
+    @staticmethod
+    def __compute_reduced_costs(graph, variables, degree_constraints, subtour_constraints):
+        """
+        Helper function that computes and returns the reduced costs of all edges omitted from the model,
+        based on the duals of the degree-2 and subtour-elimination constraints of the current LP
+        """
+        node_duals = dict({node: constraint.getAttr("Pi") for node, constraint in degree_constraints.items()})
+        cut_duals = [tuple((constraint.getAttr("Pi"), partition)) for constraint, partition in subtour_constraints]
+
+        reduced_costs = {}  # initialize the reduced costs
+        for i in graph.keys():  # for every omitted edge
+            for j, weight in graph[i].items():
+                if i < j and tuple((i, j)) not in variables:
+                    reduced_cost = weight - node_duals[i] - node_duals[j]
+                    for dual, partition in cut_duals:
+                        if (i in partition) != (j in partition):  # if the edge crosses the cut
+                            reduced_cost -= dual
+                    reduced_costs[tuple((i, j))] = reduced_cost
+        return reduced_costs  # return the reduced costs
@@ -0,0 +1,2 @@
+from CandidateEdgePricing import CandidateEdgePricing
+
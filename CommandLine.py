@@ -0,0 +1,144 @@
+import sys
+from os import path
+
+# directories holding the packages, which import each other by module name
+SOURCE_ROOTS = tuple((
+    "BranchAndCut", "ColumnGeneration", "DynamicProgramming", "LocalSearch", "LowerBound", "MinimumCutProblem",
+    "NearestNeighborAlgorithm", "Portfolio", "Profiling", "SolverBackend", "UndirectedGraph"
+))
+
+# put the package directories on the path, both in the repository and when installed next to this module
+sys.path[:0] = [
+    path.join(path.dirname(path.abspath(__file__)), source_root)
+    for source_root in SOURCE_ROOTS
+    if path.join(path.dirname(path.abspath(__file__)), source_root) not in sys.path
+]
+
+from argparse import ArgumentParser
+from time import time
+from DataIO import DataIO
+from Profiler import Profiler
+from Telemetry import Telemetry
+from TourSolver import TourSolver
+
+
+class CommandLine:
+    """
+    Class containing implementation of functions used to run the solver non-interactively from the command
+    line. Solver backends are only imported once an instance is solved by an algorithm that needs them, so
+    that the help text and the heuristic and dynamic programming algorithms start without loading a solver
+    """
+
+    @staticmethod
+    def create_parser():
+        """
+        Returns the argument parser of the command line interface
+        """
+        parser = ArgumentParser(description="Solves instances of the Traveling Salesman Problem.")
+        parser.add_argument("instances", nargs="+",
+                            help="files containing graphs, or directories whose instance files are all solved")
+        parser.add_argument("-a", "--algorithm", default="auto", choices=TourSolver.ALGORITHMS,
+                            help="solution algorithm (default: auto)")
+        parser.add_argument("-b", "--backend", default="gurobi", choices=("gurobi", "highs"),
+                            help="LP/MIP backend of the model-based algorithms (default: gurobi)")
+        parser.add_argument("-n", "--node-selection", default="best-first", choices=("best-first", "depth-first"),
+                            help="node selection rule of the branch-and-cut tree (default: best-first)")
+        parser.add_argument("-t", "--time-limit", type=float, default=None,
+                            help="time limit per instance in seconds (default: none)")
+        parser.add_argument("-o", "--output-dir", default=".",
+                            help="directory to which the tours and models are written (default: .)")
+        parser.add_argument("-v", "--verbose", action="store_true", help="print the progress of the solvers")
+        parser.add_argument("--checkpoint-interval", type=float, default=None, metavar="SECONDS",
+                            help="save the cuts and the best tour to <output-dir>/<instance>_checkpoint.json "
+                                 "every SECONDS seconds and when the solve ends")
+        parser.add_argument("--resume", action="store_true",
+                            help="rebuild the model from the cuts of the checkpoint of every instance, if any, "
+                                 "before the first solve")
+        parser.add_argument("--cache", nargs="?", const="", default=None, metavar="DIR",
+                            help="read the instances from a binary cache, written on their first load (default "
+                                 "directory: .tsp_cache next to the instances)")
+        parser.add_argument("--telemetry", metavar="FILE.jsonl",
+                            help="file to which one JSON line is appended per solver iteration")
+        parser.add_argument("-p", "--profile", nargs="?", const="", default=None, metavar="FILE.prof",
+                            help="print the profiling counters and timers, and store cProfile statistics if a "
+                                 "file is given")
+        return parser
+
+    @staticmethod
+    def apply(arguments):
+        """
+        Given the parsed command line arguments, solves every instance, writes its tour (and the model and
+        solution files of the model-based algorithms) to the output directory and prints one line per
+        instance. Returns the number of instances that could not be solved
+        """
+        filenames = list()  # collect the instance files, expanding the directories
+        for instance in arguments.instances:
+            if path.isdir(instance):
+                from BatchSolver import BatchSolver
+                filenames.extend(BatchSolver.find_instances(instance))
+            else:
+                filenames.append(instance)
+
+        environment = None  # solver environment, created once the first instance needs it
+        telemetry_file = open(arguments.telemetry, 'a') if arguments.telemetry else None
+        num_failures = 0
+        for filename in filenames:  # solve the instances one after the other
+            graph_prefix = path.basename(filename).split(".").pop(0)  # retrieve the graph name
+            output_prefix = path.join(arguments.output_dir, graph_prefix)
+            # tag the events of the instance with its name
+            callback = Telemetry(telemetry_file, dict({"instance": graph_prefix})) if telemetry_file else None
+            t0 = time()  # start recording
+            try:
+                if arguments.cache is None:  # read the graph
+                    weights = DataIO.read_graph(filename)
+                else:  # read the graph through the binary cache
+                    from InstanceCache import InstanceCache
+                    weights = InstanceCache.read_graph(filename, arguments.cache or None)
+                algorithm = TourSolver.resolve_algorithm(arguments.algorithm, len(weights.keys()))
+                if environment is None and algorithm in TourSolver.SOLVER_ALGORITHMS:  # import the backend
+                    from SolverBackend import SolverBackend
+                    environment = SolverBackend.create_environment(arguments.backend, not arguments.verbose)
+                checkpoint = None  # checkpoint of the cutting-plane loop and the branch-and-cut tree
+                if algorithm in TourSolver.SOLVER_ALGORITHMS and \
+                        (arguments.resume or arguments.checkpoint_interval is not None):
+                    from Checkpoint import Checkpoint
+                    checkpoint = Checkpoint(output_prefix + "_checkpoint.json", weights,
+                                            arguments.checkpoint_interval or Checkpoint.INTERVAL)
+                    if arguments.resume and checkpoint.load() and arguments.verbose:
+                        print(graph_prefix + ": resuming from " + str(len(checkpoint.cuts)) + " cuts")
+                result = TourSolver.solve(weights, algorithm, arguments.backend, environment,
+                                          arguments.node_selection, arguments.verbose, arguments.time_limit,
+                                          callback, checkpoint)
+                if result["backend"] is None:  # these algorithms have no single model to output
+                    DataIO.write_tour_edges(weights, result["tour"], result["cost"], output_prefix + "_tour.txt")
+                else:
+                    result["backend"].write(output_prefix + "_out.lp")  # output the lp and sol files
+                    result["backend"].write(output_prefix + "_out.sol")
+                    DataIO.write_tour(weights, result["variables"], result["backend"], output_prefix + "_tour.txt")
+            except Exception as exception:  # report the failure and move on to the next instance
+                print(graph_prefix + ": " + str(exception))
+                num_failures += 1
+                continue
+            print(graph_prefix + ": cost " + str(float(result["cost"])) + " (" + result["algorithm"] + ") in " +
+                  str(time() - t0) + " seconds")
+        if telemetry_file is not None:
+            telemetry_file.close()
+        return num_failures  # return the number of failures
+
+
+def main(argv=None):
+    """
+    Entry point of the command line interface - given the command line arguments (defaults to sys.argv),
+    solves the instances and returns the exit status
+    """
+    arguments = CommandLine.create_parser().parse_args(argv)
+    if arguments.profile is None:  # if profiling is not requested
+        return 1 if CommandLine.apply(arguments) else 0
+    with Profiler.profile(arguments.profile or None):  # profile the solves
+        num_failures = CommandLine.apply(arguments)
+    print(Profiler.format_summary())
+    return 1 if num_failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
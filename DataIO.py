@@ -1,3 +1,4 @@
+from itertools import islice
 from GraphProcessing import GraphProcessing
 
 
@@ -5,23 +6,92 @@ class DataIO:
     """
     Class containing implementation of functions used to read and graphs from textfiles
     """
+
+    CHUNK_SIZE = 65536  # number of lines of an edge list parsed at once
+
     @staticmethod
     def read_graph(filename):
         """
-        Given a filename containing a graph, opens and reads the graph as a dictionary and returns it
+        Given a filename containing a graph, opens and reads the graph as a dictionary and returns it. Files
+        ending in .tsp or .tsp.gz are read as TSPLIB instances
+        """
+        if filename.lower().endswith((".tsp", ".tsp.gz")):  # if the file is a TSPLIB instance
+            from TSPLIB import TSPLIB  # imported on demand, since the reader depends on numpy
+            return TSPLIB.read_graph(filename)
+        try:
+            num_nodes, edges = DataIO.read_edge_array(filename)  # parse the edge list in bulk
+            # convert the columns to python integers at once
+            edges = zip(edges[:, 0].tolist(), edges[:, 1].tolist(), edges[:, 2].tolist())
+        except ImportError:  # without numpy, parse the edge list line by line
+            num_nodes, edges = DataIO.read_edge_list(filename)
+        graph = GraphProcessing.construct_null_graph(num_nodes)  # construct a null graph
+        for source_node, terminal_node, weight in edges:  # for every edge
+            graph[source_node][terminal_node] = weight
+            graph[terminal_node][source_node] = weight
+        return graph  # return the final graph
+
+    @staticmethod
+    def read_edge_array(filename, chunk_size=CHUNK_SIZE):
+        """
+        Given a filename containing a graph as an edge list, returns the number of nodes and the edges as an
+        integer array with one row of first node, second node and edge weight per edge. The file is streamed
+        in chunks of lines, every chunk being converted by a single numpy call, so that at most one chunk of
+        text is held in memory
+        """
+        import numpy as np
+
+        with open(filename, 'r') as file:  # open the file
+            # read the number of nodes and number of edges
+            num_nodes, num_edges = DataIO.__preprocess_line(file.readline())
+            chunks = list()  # parsed chunks of edges
+            while True:
+                lines = list(islice(file, chunk_size))  # read the next chunk of lines
+                if not lines:  # if the file is exhausted
+                    break
+                values = np.array(" ".join(lines).split(), dtype=np.int64)  # convert the whole chunk at once
+                if len(values) % 3:  # every line must hold two nodes and a weight
+                    raise Exception("Error: Malformed edge list in " + filename)
+                chunks.append(values.reshape((-1, 3)))
+        return num_nodes, np.concatenate(chunks) if chunks else np.zeros((0, 3), dtype=np.int64)
+
+    @staticmethod
+    def read_edge_list(filename):
+        """
+        Given a filename containing a graph as an edge list, returns the number of nodes and the list of edges
+        as triples of first node, second node and edge weight. Unlike read_edge_array, the file is parsed line
+        by line in pure python, which does not require numpy
         """
         with open(filename, 'r') as file:  # open the file
             # read the number of nodes and number of edges
             num_nodes, num_edges = DataIO.__preprocess_line(file.readline())
-            graph = GraphProcessing.construct_null_graph(num_nodes)  # construct a null graph
-            for line in file.readlines():  # for every line in the file
-                preprocessed_line = DataIO.__preprocess_line(line)  # preprocess the line
-                if preprocessed_line:  # if the preprocessed line is not a null string
-                    # read the first and second node and the edge weight
-                    source_node, terminal_node, weight = preprocessed_line
-                    graph[source_node][terminal_node] = weight
-                    graph[terminal_node][source_node] = weight
-            return graph  # return the final graph
+            edges = list()
+            for line in file:  # for every nonempty line of the file
+                values = DataIO.__preprocess_line(line)
+                if not values:
+                    continue
+                if len(values) != 3:  # every line must hold two nodes and a weight
+                    raise Exception("Error: Malformed edge list in " + filename)
+                edges.append(tuple(values))
+        return num_nodes, edges
+
+    @staticmethod
+    def read_distance_matrix(filename):
+        """
+        Given a filename containing a graph, returns its symmetric distance matrix as a floating-point array
+        indexed by node names, with NaN for the missing edges and on the diagonal
+        """
+        import numpy as np
+
+        if filename.lower().endswith((".tsp", ".tsp.gz")):  # if the file is a TSPLIB instance
+            from TSPLIB import TSPLIB
+            matrix = TSPLIB.compute_distance_matrix(TSPLIB.read_instance(filename)).astype(float)
+        else:  # scatter the edges into the matrix
+            num_nodes, edges = DataIO.read_edge_array(filename)
+            matrix = np.full((num_nodes, num_nodes), np.nan)
+            matrix[edges[:, 0], edges[:, 1]] = edges[:, 2]
+            matrix[edges[:, 1], edges[:, 0]] = edges[:, 2]
+        np.fill_diagonal(matrix, np.nan)  # graphs have no loops
+        return matrix  # return the matrix
 
     @staticmethod
     def write_graph(graph, filename):
@@ -40,19 +110,42 @@ class DataIO:
                     file.write(" ".join(list([str(source_node), str(terminal_node), str(weight)])) + "\n")
 
     @staticmethod
-    def write_tour(graph, tsp_model, filename):
+    def write_tour(graph, variables, backend, filename):
         """
-        Given a graph represented as a dictionary, a gurobi model object and a filename, stores the optimal tour
-        as computed by the input gurobi model to a textfile
+        Given a graph represented as a dictionary, the decision variables keyed by node pairs, a SolverBackend
+        object and a filename, stores the optimal tour as computed by the model of the backend to a textfile
+        """
+        pairs = sorted(variables.keys())  # fix the order in which the edges are written
+        values = backend.get_values([variables[pair] for pair in pairs])  # read the values in a single call
+        # store the edges whose decision variables are true
+        DataIO.write_tour_edges(
+            graph,
+            [pair for pair, value in zip(pairs, values) if value > 0.5],
+            backend.get_objective_value(),
+            filename
+        )
+
+    @staticmethod
+    def write_tour_edges(graph, tour, cost, filename):
+        """
+        Given a graph represented as a dictionary, the list of tour edges represented as node pairs, the cost
+        of the tour and a filename, stores the tour to a textfile
         """
         with open(filename, 'w') as file:  # open the textfile
-            for decision_variable in tsp_model.getVars():  # for every decision variable in the model
-                if decision_variable.getAttr("X"):  # if the value is true
-                    variable_name = decision_variable.getAttr("VarName")  # get the variable name
-                    i, j = (int(num) for num in variable_name.split("_"))  # retrieve the node names
-                    file.write(" ".join([str(i), str(j), str(graph[i][j])]) + "\n")  # store the edge in a new line
-            # store the cost of the optimal tour as the final line
-            file.write("The cost of the best tour is: " + str(tsp_model.getAttr("ObjVal")) + "\n")
+            for i, j in tour:  # for every edge in the tour
+                file.write(" ".join([str(i), str(j), str(graph[i][j])]) + "\n")  # store the edge in a new line
+            # store the cost of the tour as the final line
+            file.write("The cost of the best tour is: " + str(float(cost)) + "\n")
+
+    @staticmethod
+    def read_tour_cost(filename):
+        """
+        Given the name of a textfile written by write_tour_edges, reads and returns the cost of the tour stored
+        in its final line
+        """
+        with open(filename, 'r') as file:  # open the textfile
+            lines = [line for line in file.readlines() if line.strip()]  # skip the blank lines
+        return float(lines.pop().split(":").pop())  # return the cost stored after the colon
 
     @staticmethod
     def __preprocess_line(line):
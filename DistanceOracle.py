@@ -0,0 +1,129 @@
+import numpy as np
+from collections import OrderedDict
+from TSPLIB import TSPLIB
+
+
+class DistanceOracle:
+    """
+    Class that houses the distances of a coordinate-based instance without storing them. Distances are computed
+    from the node coordinates whenever they are queried - one pair at a time as oracle(i, j), with the most
+    recently used pairs kept in a bounded cache, or whole rows and blocks of rows at once as numpy arrays. The
+    oracle takes O(n) space, so that heuristics, minimum spanning trees and candidate lists can be computed for
+    instances whose distance matrix would not fit into memory
+
+    NOTE: The nodes are numbered from 0 in the order of the coordinates, as in the graphs read by DataIO
+    """
+
+    CACHE_SIZE = 65536  # default number of pairs kept in the cache
+
+    BLOCK_ENTRIES = 1 << 20  # number of distances computed at once by the functions processing all rows
+
+    def __init__(self, coordinates, edge_weight_type, cache_size=CACHE_SIZE):
+        """
+        Constructor for the DistanceOracle class - used to initialize all necessary fields of the DistanceOracle
+        object. Given an array of node coordinates with one row per node, the TSPLIB edge weight type of the
+        distances and the number of pairs kept in the cache (0 disables the cache), creates the oracle
+        """
+        self.coordinates = np.asarray(coordinates, dtype=float)  # initialize all necessary fields
+        self.edge_weight_type = edge_weight_type
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # distances of the recently queried pairs, least recently used first
+        self.num_hits = 0  # number of queries answered by the cache
+        self.num_misses = 0  # number of queries computed from the coordinates
+
+    @staticmethod
+    def from_file(filename, cache_size=CACHE_SIZE):
+        """
+        Given the name of a TSPLIB file of a coordinate-based instance and the number of pairs kept in the cache,
+        reads the coordinates and returns the distance oracle of the instance
+        """
+        instance = TSPLIB.read_instance(filename)
+        if instance["coordinates"] is None:  # if the instance lists its distances explicitly
+            raise Exception("Error: " + filename + " does not define node coordinates")
+        return DistanceOracle(instance["coordinates"], instance["EDGE_WEIGHT_TYPE"], cache_size)
+
+    def __call__(self, i, j):
+        """
+        Given two node names, returns the distance between the nodes
+        """
+        key = tuple((i, j)) if i < j else tuple((j, i))
+        distance = self.cache.pop(key, None)  # remove the pair, so that it is reinserted as most recently used
+        if distance is None:  # if the pair is not cached, compute its distance
+            self.num_misses += 1
+            distance = int(TSPLIB.compute_distances(self.edge_weight_type, self.coordinates[i], self.coordinates[j]))
+        else:
+            self.num_hits += 1
+        if self.cache_size > 0:  # cache the pair, evicting the least recently used pair if the cache is full
+            self.cache[key] = distance
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return distance  # return the distance
+
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes of the instance
+        """
+        return self.coordinates.shape[0]
+
+    def get_row(self, i, others=None):
+        """
+        Given a node name and an array of node names (defaults to all nodes), returns the array of the distances
+        from the node to the other nodes
+        """
+        others_coordinates = self.coordinates if others is None else self.coordinates[others]
+        return TSPLIB.compute_distances(self.edge_weight_type, self.coordinates[i], others_coordinates)
+
+    def get_rows(self, nodes, others=None):
+        """
+        Given an array of node names and an array of other node names (defaults to all nodes), returns the matrix
+        of the distances between them, with one row per node
+        """
+        others_coordinates = self.coordinates if others is None else self.coordinates[others]
+        return TSPLIB.compute_distances(
+            self.edge_weight_type,
+            self.coordinates[nodes][:, None, :],
+            others_coordinates[None, :, :]
+        )  # return the block of distances
+
+    def compute_nearest_neighbors(self, num_neighbors):
+        """
+        Given the number of neighbors, returns a dictionary mapping every node to the list of its num_neighbors
+        nearest nodes, sorted by increasing distance, like GraphProcessing.compute_nearest_neighbors. The rows
+        are processed in blocks, so that only one block of distances is held in memory
+        """
+        num_nodes = self.get_num_nodes()
+        num_neighbors = min(num_neighbors, num_nodes - 1)
+        if num_neighbors < 1:  # if no neighbors are requested
+            return dict({node: list() for node in range(num_nodes)})
+        block_size = max(1, DistanceOracle.BLOCK_ENTRIES // num_nodes)
+        nearest_neighbors = dict()
+        for start in range(0, num_nodes, block_size):  # for every block of rows
+            nodes = np.arange(start, min(start + block_size, num_nodes))
+            distances = self.get_rows(nodes).astype(float)
+            distances[np.arange(len(nodes)), nodes] = np.inf  # a node is not its own neighbor
+            # distance of the num_neighbors-th nearest node of every row, found without sorting the rows
+            thresholds = np.partition(distances, num_neighbors - 1, axis=1)[:, num_neighbors - 1]
+            for row, node in enumerate(nodes.tolist()):  # sort the nodes within the threshold by distance and name
+                candidates = np.flatnonzero(distances[row] <= thresholds[row])
+                neighbors = candidates[np.lexsort((candidates, distances[row, candidates]))][:num_neighbors]
+                nearest_neighbors[node] = neighbors.tolist()
+        return nearest_neighbors  # return the nearest neighbor lists
+
+    def compute_minimum_spanning_tree(self):
+        """
+        Computes the minimum spanning tree of the complete graph over the nodes using Prim's algorithm, one
+        row of distances at a time, and returns the order in which the nodes were added along with the total
+        weight of the tree, like GraphProcessing.compute_minimum_spanning_tree
+        """
+        num_nodes = self.get_num_nodes()
+        in_tree = np.zeros(num_nodes, dtype=bool)
+        in_tree[0] = True
+        distances = self.get_row(0).astype(float)  # distance of every node to the tree
+        ordering, weight = [0], 0
+        for iteration in range(num_nodes - 1):  # add the node closest to the tree
+            node = int(np.argmin(np.where(in_tree, np.inf, distances)))
+            ordering.append(node)
+            weight += int(distances[node])
+            in_tree[node] = True
+            distances = np.minimum(distances, self.get_row(node))
+        return ordering, weight  # return the ordering and the total weight
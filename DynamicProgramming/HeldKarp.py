@@ -0,0 +1,113 @@
+import numpy as np
+from multiprocessing import Pool, RawArray
+
+
+_WORKER_STATE = {}  # state of the dynamic programming table shared with the worker processes
+
+
+def _initialize_worker(table_buffer, distances):
+    """
+    Given the buffer holding the dynamic programming table and the distance matrix between the nodes other
+    than the start node, wraps the table as a NumPy array and precomputes the subsets of every layer
+    """
+    num_nodes = distances.shape[0]
+    masks = np.arange(1 << num_nodes, dtype=np.int64)  # every subset as a bitmask
+    popcounts = np.zeros(1 << num_nodes, dtype=np.uint8)  # cardinality of every subset
+    for bit in range(num_nodes):
+        popcounts += ((masks >> bit) & 1).astype(np.uint8)
+    _WORKER_STATE["table"] = np.frombuffer(table_buffer, dtype=np.float64).reshape((1 << num_nodes, num_nodes))
+    _WORKER_STATE["distances"] = distances
+    _WORKER_STATE["layers"] = [np.flatnonzero(popcounts == size) for size in range(num_nodes + 1)]
+
+
+def _compute_layer_entries(layer_and_node):
+    """
+    Given a subset cardinality and a last node, fills in the table entries of all subsets of that cardinality
+    which contain the node, using the entries of the previous layer. Entries of different last nodes are
+    disjoint, so the nodes of one layer may be processed in parallel
+    """
+    size, last_node = layer_and_node
+    table, distances = _WORKER_STATE["table"], _WORKER_STATE["distances"]
+    layer = _WORKER_STATE["layers"][size]
+    subsets = layer[((layer >> last_node) & 1).astype(bool)]  # subsets of the layer containing the node
+    previous_subsets = subsets ^ (1 << last_node)  # the same subsets without the node
+    # entries of nodes outside a subset are infinite, so the minimum over all nodes is the minimum over the subset
+    table[subsets, last_node] = (table[previous_subsets] + distances[:, last_node]).min(axis=1)
+
+
+class HeldKarp:
+    """
+    Class that houses an exact dynamic programming algorithm for the TSP, as presented by Held & Karp
+    in their 1962 paper, "A Dynamic Programming Approach to Sequencing Problems".
+
+    The table holds, for every subset of the nodes other than the start node (indexed by its bitmask)
+    and every node in the subset, the cost of the cheapest path that leaves the start node, visits
+    exactly the subset and ends at that node. Layers of equal subset cardinality are computed one after
+    the other with NumPy, in O(2^n * n^2) time and O(2^n * n) memory
+    """
+
+    MAX_NUM_NODES = 21  # largest instance accepted - the table of 2^(n-1) * (n-1) doubles takes about 170 MB at 21
+
+    @staticmethod
+    def apply(graph, num_processes=1):
+        """
+        Given a graph represented as a dictionary and the number of worker processes, solves the TSP over
+        the input graph and returns the optimal tour as a list of node pairs along with its cost. If more
+        than one process is requested, the nodes of every layer are distributed across a process pool
+        """
+        node_names = sorted(graph.keys())  # fix the order of the nodes - the first node starts the tour
+        if len(node_names) < 3:  # if the graph is too small to contain a tour
+            raise Exception("Error: A tour requires at least three nodes")
+        if len(node_names) > HeldKarp.MAX_NUM_NODES:  # if the table would not fit in memory
+            raise Exception("Error: Held-Karp supports at most " + str(HeldKarp.MAX_NUM_NODES) + " nodes")
+
+        # construct the distance matrix - missing edges have infinite weight
+        D = np.full((len(node_names), len(node_names)), np.inf)
+        indices = dict({node_name: index for index, node_name in enumerate(node_names)})
+        for i in graph.keys():
+            for j, weight in graph[i].items():
+                D[indices[i], indices[j]] = weight
+        distances = np.array(D[1:, 1:])  # distances between the nodes other than the start node
+        num_nodes = distances.shape[0]
+
+        table_buffer = RawArray('d', (1 << num_nodes) * num_nodes)  # allocate the table in shared memory
+        pool = None
+        try:
+            # the current process computes the layers itself when it has no pool, through the same state as workers
+            _initialize_worker(table_buffer, distances)
+            table = _WORKER_STATE["table"]
+            table.fill(np.inf)
+            table[1 << np.arange(num_nodes), np.arange(num_nodes)] = D[0, 1:]  # paths visiting a single node
+
+            pool = Pool(num_processes, _initialize_worker, (table_buffer, distances)) if num_processes > 1 else None
+            for size in range(2, num_nodes + 1):  # for every layer, in order of increasing cardinality
+                tasks = [tuple((size, last_node)) for last_node in range(num_nodes)]
+                if pool is not None:  # distribute the nodes of the layer across the pool
+                    pool.map(_compute_layer_entries, tasks)
+                else:
+                    for task in tasks:
+                        _compute_layer_entries(task)
+        finally:
+            if pool is not None:
+                pool.terminate()
+            _WORKER_STATE.clear()  # release the table and the layers once the solve no longer needs them
+
+        full_subset = (1 << num_nodes) - 1
+        closing_costs = table[full_subset] + D[1:, 0]  # close every path by returning to the start node
+        last_node = int(np.argmin(closing_costs))
+        cost = float(closing_costs[last_node])
+        if np.isinf(cost):  # if no path can be closed
+            raise Exception("Error: The input graph does not contain a tour")
+
+        # walk back through the table to recover the order of the nodes
+        ordering = [last_node]
+        subset = full_subset
+        while subset != 1 << last_node:
+            subset ^= 1 << last_node
+            last_node = int(np.argmin(table[subset] + distances[:, last_node]))
+            ordering.append(last_node)
+        ordering = [node_names[0]] + [node_names[node + 1] for node in reversed(ordering)]
+
+        # return the tour edges and the cost of the tour
+        tour = [tuple((min(i, j), max(i, j))) for i, j in zip(ordering, ordering[1:] + ordering[:1])]
+        return tour, cost
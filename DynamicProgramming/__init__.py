@@ -0,0 +1,2 @@
+from HeldKarp import HeldKarp
+
@@ -0,0 +1,127 @@
+import json
+import hashlib
+import numpy as np
+from os import path, getpid, makedirs, stat
+try:
+    from os import replace
+except ImportError:  # python 2 has no os.replace - its rename already overwrites the target on POSIX
+    from os import rename as replace
+from zlib import crc32
+from DataIO import DataIO
+
+
+class InstanceCache:
+    """
+    Class containing implementation of functions used to cache instances in a binary format, so that repeated
+    loads of the same instance skip the parsing of its text file. The first load stores the distance matrix of
+    the instance as a .npy file, with missing edges as NaN, along with a small JSON header describing the source
+    file. Later loads memory-map the matrix, so that processes loading the same instance share its pages
+
+    The cache entry of an instance is reused as long as the size and modification time of the source file match
+    the header. If they do not, the SHA-1 digest of the source file decides - an unchanged file (e.g. one that was
+    copied or touched) only refreshes the header, whereas a changed file rebuilds the entry
+    """
+
+    DIRECTORY = ".tsp_cache"  # default cache directory, created next to the instance files
+
+    VERSION = 1  # version of the cache format - entries of other versions are rebuilt
+
+    @staticmethod
+    def read_graph(filename, cache_directory=None):
+        """
+        Given the name of a file containing a graph and the cache directory (defaults to a directory next to the
+        file), returns the graph as a dictionary, reading it from the cache if its entry is up to date
+        """
+        matrix, integral = InstanceCache.load_matrix(filename, cache_directory)
+        present = ~np.isnan(matrix)  # mask of the edges of the graph
+        weights = np.where(present, matrix, 0)
+        if integral:  # restore the integer weights of the source file
+            weights = weights.astype(np.int64)
+        graph = dict()
+        for i in range(matrix.shape[0]):  # for every node, gather its neighbors and their weights
+            neighbors = np.flatnonzero(present[i])
+            graph[i] = dict(zip(neighbors.tolist(), weights[i, neighbors].tolist()))
+        return graph  # return the graph
+
+    @staticmethod
+    def load_matrix(filename, cache_directory=None):
+        """
+        Given the name of a file containing a graph and the cache directory (defaults to a directory next to the
+        file), returns the read-only memory-mapped distance matrix of the graph, with NaN for missing edges, and
+        whether all weights are integers. The cache entry is created or rebuilt if it is not up to date
+        """
+        matrix_filename, header_filename = InstanceCache.__get_entry_filenames(filename, cache_directory)
+        source = stat(filename)
+        header = InstanceCache.__read_header(header_filename)
+        if header is not None and path.isfile(matrix_filename):  # if the instance was cached before
+            if header["size"] == source.st_size and header["mtime"] == source.st_mtime:  # if the file is unchanged
+                return np.load(matrix_filename, mmap_mode='r'), header["integral"]
+            if header["sha1"] == InstanceCache.compute_digest(filename):  # if only the metadata changed
+                header["size"], header["mtime"] = source.st_size, source.st_mtime
+                InstanceCache.__write_json(header, header_filename)
+                return np.load(matrix_filename, mmap_mode='r'), header["integral"]
+
+        matrix = DataIO.read_distance_matrix(filename)  # parse the file and build the entry
+        integral = bool(np.all(np.isnan(matrix) | (matrix == np.round(matrix))))
+        # write the matrix to a file of the process, then move it into place, as workers may build the same entry
+        temporary_filename = matrix_filename + ".%d.tmp" % getpid()
+        with open(temporary_filename, 'wb') as file:
+            np.save(file, matrix)
+        replace(temporary_filename, matrix_filename)
+        InstanceCache.__write_json(dict({
+            "version": InstanceCache.VERSION, "source": path.abspath(filename), "size": source.st_size,
+            "mtime": source.st_mtime, "sha1": InstanceCache.compute_digest(filename),
+            "num_nodes": matrix.shape[0], "integral": integral
+        }), header_filename)  # the header is written last, so that an entry without header is never used
+        return np.load(matrix_filename, mmap_mode='r'), integral
+
+    @staticmethod
+    def compute_digest(filename):
+        """
+        Given the name of a file, returns the SHA-1 digest of its content as a hexadecimal string
+        """
+        digest = hashlib.sha1()
+        with open(filename, 'rb') as file:  # hash the file in blocks
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()  # return the digest
+
+    @staticmethod
+    def __get_entry_filenames(filename, cache_directory):
+        """
+        Helper function that returns the names of the matrix and header files of the cache entry of the input
+        file, creating the cache directory if needed. The entry is named after the file and its absolute path,
+        so that files of the same name in different directories can share a cache directory
+        """
+        if cache_directory is None:  # default to a directory next to the file
+            cache_directory = path.join(path.dirname(path.abspath(filename)), InstanceCache.DIRECTORY)
+        if not path.isdir(cache_directory):
+            try:
+                makedirs(cache_directory)
+            except OSError:  # another process may have created the directory in the meantime
+                if not path.isdir(cache_directory):
+                    raise
+        entry_name = path.basename(filename) + "-%08x" % (crc32(path.abspath(filename).encode("utf-8")) & 0xffffffff)
+        return path.join(cache_directory, entry_name + ".npy"), path.join(cache_directory, entry_name + ".json")
+
+    @staticmethod
+    def __read_header(header_filename):
+        """
+        Helper function that returns the header of a cache entry as a dictionary, or None if the entry does not
+        exist or has another version
+        """
+        if not path.isfile(header_filename):  # if the entry does not exist
+            return None
+        with open(header_filename, 'r') as file:
+            header = json.load(file)
+        return header if header.get("version") == InstanceCache.VERSION else None
+
+    @staticmethod
+    def __write_json(content, filename):
+        """
+        Helper function that writes the input dictionary to a JSON file, replacing the file atomically
+        """
+        temporary_filename = filename + ".%d.tmp" % getpid()
+        with open(temporary_filename, 'w') as file:
+            json.dump(content, file, sort_keys=True)
+        replace(temporary_filename, filename)
@@ -0,0 +1,37 @@
+class TwoOpt:
+    """
+    Class that houses the 2-opt local search for the TSP, as presented by Croes in his 1958 paper,
+    "A Method for Solving Traveling-Salesman Problems". Two edges of the tour are repeatedly replaced
+    by the two edges that reconnect the tour the other way around, as long as doing so shortens it
+    """
+
+    @staticmethod
+    def apply(G, induced_ordering):
+        """
+        Given a graph represented as a dictionary and the induced ordering of the nodes of a tour, applies
+        2-opt moves until none improves the tour and returns the improved ordering
+        """
+        ordering = list(induced_ordering)  # create a copy of the ordering
+        num_nodes = len(ordering)
+        improved = True
+        while improved:  # while the last pass improved the tour
+            improved = False
+            for i in range(num_nodes - 1):
+                for j in range(i + 2, num_nodes if i > 0 else num_nodes - 1):
+                    # the move replaces edges (a, b) and (c, d) with edges (a, c) and (b, d)
+                    a, b, c, d = ordering[i], ordering[i + 1], ordering[j], ordering[(j + 1) % num_nodes]
+                    delta = \
+                        TwoOpt.__get_weight(G, a, c) + TwoOpt.__get_weight(G, b, d) - \
+                        TwoOpt.__get_weight(G, a, b) - TwoOpt.__get_weight(G, c, d)
+                    if delta < 0:  # if the move shortens the tour
+                        ordering[i + 1:j + 1] = reversed(ordering[i + 1:j + 1])  # reverse the segment
+                        improved = True
+        return ordering  # return the improved ordering
+
+    @staticmethod
+    def __get_weight(G, node, other_node):
+        """
+        Helper function that returns the weight of the edge between the two nodes, or infinity if the nodes
+        are not adjacent
+        """
+        return G[node].get(other_node, float('inf'))  # return the edge weight
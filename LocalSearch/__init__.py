@@ -0,0 +1,2 @@
+from TwoOpt import TwoOpt
+
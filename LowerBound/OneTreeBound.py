@@ -0,0 +1,96 @@
+import numpy as np
+
+
+class OneTreeBound:
+    """
+    Class that houses the Held-Karp lower bound on the cost of a tour, as presented by Held & Karp in
+    their 1970 paper, "The Traveling-Salesman Problem and Minimum Spanning Trees".
+
+    A 1-tree is a spanning tree on all nodes but the first, plus the two cheapest edges incident to the
+    first node. Every tour is a 1-tree, so the cheapest 1-tree bounds the cost of a tour from below.
+    Node penalties are adjusted by subgradient optimization to push every node towards degree two,
+    which tightens the bound
+    """
+
+    NUM_ITERATIONS = 200  # default number of subgradient iterations
+
+    STEP_SCALE = 2.0  # initial scale of the subgradient step size
+
+    STEP_PATIENCE = 10  # number of iterations without improvement after which the step scale is halved
+
+    @staticmethod
+    def apply(graph, upper_bound=None, num_iterations=NUM_ITERATIONS):
+        """
+        Given a graph represented as a dictionary, the cost of a known tour (if any) and the number of
+        subgradient iterations, computes and returns the best 1-tree lower bound found. Returns negative
+        infinity if the graph is disconnected
+        """
+        node_names = sorted(graph.keys())  # fix the order of the nodes - the first node is the special node
+        num_nodes = len(node_names)
+        if num_nodes < 3:  # if the graph is too small to contain a tour
+            return float('-inf')
+
+        # construct the distance matrix - missing edges have infinite weight
+        W = np.full((num_nodes, num_nodes), np.inf)
+        indices = dict({node_name: index for index, node_name in enumerate(node_names)})
+        for i in graph.keys():
+            for j, weight in graph[i].items():
+                W[indices[i], indices[j]] = weight
+
+        penalties = np.zeros(num_nodes)  # node penalties
+        best_bound = float('-inf')  # best bound found so far
+        step_scale = OneTreeBound.STEP_SCALE
+        iterations_without_improvement = 0
+
+        for iteration in range(num_iterations):
+            # compute the cheapest 1-tree under the penalized weights
+            weight, degrees = OneTreeBound.__compute_one_tree(W + penalties[:, None] + penalties[None, :])
+            if np.isinf(weight):  # if the graph is disconnected
+                return float('-inf')
+            bound = weight - 2 * penalties.sum()  # remove the penalties from the weight of the 1-tree
+
+            if bound > best_bound:  # record the best bound
+                best_bound, iterations_without_improvement = bound, 0
+            else:
+                iterations_without_improvement += 1
+                if iterations_without_improvement >= OneTreeBound.STEP_PATIENCE:  # shrink the step
+                    step_scale, iterations_without_improvement = step_scale / 2, 0
+
+            subgradient = degrees - 2  # every node of a tour has degree two
+            norm = float((subgradient ** 2).sum())
+            if norm == 0:  # if the 1-tree is a tour, the bound is exact
+                break
+            # step towards the known tour cost, or by a fraction of the bound if no tour is known
+            gap = upper_bound - bound if upper_bound is not None else 0.01 * abs(bound) + 1
+            penalties += step_scale * max(gap, 0) / norm * subgradient
+
+        return float(best_bound)  # return the best bound
+
+    @staticmethod
+    def __compute_one_tree(W):
+        """
+        Given a dense matrix of edge weights, computes the cheapest 1-tree rooted at the first node using
+        Prim's algorithm and returns its weight along with the degrees of the nodes
+        """
+        num_nodes = W.shape[0]
+        degrees = np.zeros(num_nodes)
+        in_tree = np.zeros(num_nodes, dtype=bool)  # spanning tree on the nodes other than the first node
+        in_tree[0] = in_tree[1] = True
+        distances, parents = np.array(W[1]), np.ones(num_nodes, dtype=int)
+        weight = 0.0
+        for step in range(num_nodes - 2):  # add the remaining nodes one at a time
+            node = int(np.argmin(np.where(in_tree, np.inf, distances)))  # closest node outside the tree
+            weight += distances[node]
+            degrees[node] += 1
+            degrees[parents[node]] += 1
+            in_tree[node] = True
+            closer = W[node] < distances  # update the distances to the tree
+            distances = np.where(closer, W[node], distances)
+            parents = np.where(closer, node, parents)
+
+        # connect the first node through its two cheapest edges
+        cheapest = np.argsort(W[0, 1:])[:2] + 1
+        weight += W[0, cheapest].sum()
+        degrees[0] += 2
+        degrees[cheapest] += 1
+        return weight, degrees  # return the weight and the degrees
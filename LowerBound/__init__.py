@@ -0,0 +1,2 @@
+from OneTreeBound import OneTreeBound
+
@@ -0,0 +1,252 @@
+from math import ceil, log, sqrt
+from random import Random
+from multiprocessing import Pool
+from time import time
+from ProfilerHooks import Profiler  # disabled stand-in if the Profiling package is not available
+
+
+def _run_trials(job):
+    """
+    Given a job holding the number of vertices, the edge list and the vertex bitmasks of a graph, the number of
+    trials, the seed of the random number generator and the factor bounding the weights of the near-minimum cuts,
+    runs the trials of the Karger-Stein algorithm in the current (worker) process and returns the dictionary of
+    the cuts found, mapping their canonical bitmasks to their weights
+    """
+    num_vertices, edges, groups, num_trials, seed, factor = job
+    generator = Random(seed)
+    full_bitmask = 0
+    for group in groups:
+        full_bitmask |= group
+    cuts = dict()
+    for trial in range(num_trials):  # run independent recursive contractions
+        for bitmask, weight in KargerStein.recursive_contraction(num_vertices, edges, groups, generator, factor):
+            if bitmask & 1:  # name every cut by the side without the first node
+                bitmask ^= full_bitmask
+            if weight < cuts.get(bitmask, float('inf')):
+                cuts[bitmask] = weight
+    return cuts  # return the cuts found
+
+
+class KargerStein:
+    """
+    Class that houses Python implementation of the randomized global minimum cut algorithm on undirected
+    weighted graphs, as presented by Karger & Stein in their 1996 paper, "A New Approach to the Minimum Cut
+    Problem". Every trial contracts random edges, chosen with probability proportional to their weights, down
+    to about n / sqrt(2) vertices twice independently and recurses on both contracted graphs, so that a given
+    minimum cut survives a trial with probability Omega(1 / log n). Trials are independent and may be spread
+    over a pool of worker processes, and every trial also yields the near-minimum cuts it comes across, which
+    make for additional subtour-elimination constraint candidates
+
+    Link to paper: https://doi.org/10.1145/234533.234534
+    """
+
+    BASE_SIZE = 6  # number of vertices up to which the cuts of a graph are enumerated exhaustively
+
+    FAILURE_PROBABILITY = 0.01  # default probability of missing a given minimum cut over all trials
+
+    NEAR_MINIMUM_FACTOR = 1.5  # default bound on the weights of the reported cuts, relative to the minimum cut
+
+    TOLERANCE = 1e-9  # numerical tolerance used for comparing cut weights
+
+    @staticmethod
+    def apply(G, num_trials=None, num_processes=1, seed=None):
+        """
+        Given an UndirectedGraph object, the number of trials (defaults to the number of trials missing a given
+        minimum cut with probability FAILURE_PROBABILITY at most), the number of worker processes and the seed
+        of the random number generator, applies the Karger-Stein algorithm and returns the smallest cut found as
+        a pair of sets of node names, its weight and the probability bound of it being a minimum cut
+        """
+        cuts, success_probability, node_names = \
+            KargerStein.compute_minimum_cuts(G.snapshot(), num_trials, num_processes, seed)
+        left_partition = set({
+            node_name
+            for index, node_name in enumerate(node_names)
+            if cuts[0][0] >> index & 1
+        })  # convert the smallest cut to node names
+        right_partition = set(node_names).difference(left_partition)
+        return tuple((left_partition, right_partition)), float(cuts[0][1]), success_probability
+
+    @staticmethod
+    def compute_minimum_cuts(G, num_trials=None, num_processes=1, seed=None, factor=NEAR_MINIMUM_FACTOR):
+        """
+        Given a GraphSnapshot object with at least two nodes, the number of trials (defaults to the number of
+        trials missing a given minimum cut with probability FAILURE_PROBABILITY at most), the number of worker
+        processes, the seed of the random number generator and the factor bounding the weights of the reported
+        cuts, applies the Karger-Stein algorithm. Returns the list of distinct cuts found whose weights are
+        within the factor of the smallest one, as pairs of a bitmask and a weight sorted by increasing weight,
+        where bit i of the bitmask is set if the i-th node is on the side of the cut without the first node,
+        along with the probability bound of the first cut being a minimum cut and the list of node names
+        """
+        node_names = list(G.get_node_names())  # order of the nodes in the bitmasks
+        if len(node_names) < 2:  # a cut needs two nonempty sides
+            raise Exception("Error: The graph has fewer than two nodes")
+        indices = dict({node_name: index for index, node_name in enumerate(node_names)})
+        edges = [
+            tuple((indices[node_name], indices[other_node_name], weight))
+            for node_name in node_names
+            for other_node_name, weight in G.get_neighbors(node_name).items()
+            if indices[node_name] < indices[other_node_name] and weight > 0
+        ]  # edges of positive weight, listed once
+        groups = [1 << index for index in range(len(node_names))]
+        if num_trials is None:
+            num_trials = KargerStein.compute_num_trials(len(node_names), KargerStein.FAILURE_PROBABILITY)
+
+        t0 = time() if Profiler.enabled else None
+        generator = Random(seed)  # spread the trials over the jobs, each seeded from the generator
+        num_jobs = max(1, min(num_processes, num_trials))
+        jobs = [
+            tuple((len(node_names), edges, groups, num_trials // num_jobs + (1 if job < num_trials % num_jobs else 0),
+                   generator.getrandbits(64), factor))
+            for job in range(num_jobs)
+        ]
+        if num_jobs > 1:  # run the trials in parallel
+            pool = Pool(num_jobs)
+            try:
+                results = pool.map(_run_trials, jobs)
+            finally:
+                pool.terminate()
+                pool.join()
+        else:  # run the trials in the current process
+            results = [_run_trials(jobs[0])]
+        if t0 is not None:
+            Profiler.record("karger_stein", t0)
+
+        cuts = dict()  # merge the cuts of the jobs
+        for result in results:
+            for bitmask, weight in result.items():
+                if weight < cuts.get(bitmask, float('inf')):
+                    cuts[bitmask] = weight
+        minimum_cut_weight = min(cuts.values())
+        near_minimum_cuts = sorted(
+            [
+                tuple((bitmask, weight))
+                for bitmask, weight in cuts.items()
+                if weight <= factor * minimum_cut_weight + KargerStein.TOLERANCE
+            ],
+            key=lambda cut: tuple((cut[1], cut[0]))
+        )  # cuts within the factor of the smallest one
+        return near_minimum_cuts, KargerStein.compute_success_probability(len(node_names), num_trials), node_names
+
+    @staticmethod
+    def recursive_contraction(num_vertices, edges, groups, generator, factor=NEAR_MINIMUM_FACTOR):
+        """
+        Given the number of vertices of a graph, its edges as triples of vertex indices and a positive weight,
+        the bitmasks of the nodes merged into every vertex, a random number generator and the factor bounding
+        the weights of the returned cuts, performs a single trial of the Karger-Stein algorithm and returns the
+        list of the cuts it found, as pairs of a bitmask and a weight, whose weights are within the factor of
+        the smallest one
+        """
+        if not edges:  # a graph without edges is cut by separating any vertex at no cost
+            return [tuple((groups[0], 0.0))]
+        if num_vertices <= KargerStein.BASE_SIZE:  # enumerate the cuts of small graphs
+            cuts = KargerStein.__enumerate_cuts(num_vertices, edges, groups)
+        else:  # contract the graph twice independently and recurse on both contracted graphs
+            target_size = KargerStein.__get_target_size(num_vertices)
+            cuts = list()
+            for branch in range(2):
+                contracted_num_vertices, contracted_edges, contracted_groups = \
+                    KargerStein.__contract(num_vertices, edges, groups, target_size, generator)
+                cuts.extend(KargerStein.recursive_contraction(contracted_num_vertices, contracted_edges,
+                                                              contracted_groups, generator, factor))
+        minimum_cut_weight = min([weight for bitmask, weight in cuts])
+        # only pass on the cuts within the factor of the smallest one
+        return [cut for cut in cuts if cut[1] <= factor * minimum_cut_weight + KargerStein.TOLERANCE]
+
+    @staticmethod
+    def compute_success_probability(num_nodes, num_trials=1):
+        """
+        Given the number of nodes of a graph and the number of trials, returns the lower bound on the probability
+        that the trials find a given minimum cut of the graph. A single trial finds it with probability
+        P(n) = 1 - (1 - q * P(t))^2, where t is the number of vertices after a contraction and q = t(t - 1) / n(n - 1)
+        bounds the probability that the contraction preserves the cut, and P(n) = 1 once cuts are enumerated
+        """
+        sizes = [num_nodes]  # sizes of the graphs along one branch of the recursion
+        while sizes[-1] > KargerStein.BASE_SIZE:
+            sizes.append(KargerStein.__get_target_size(sizes[-1]))
+        probability = 1.0
+        for size, target_size in reversed(list(zip(sizes[:-1], sizes[1:]))):  # evaluate the recurrence bottom-up
+            preservation_probability = float(target_size * (target_size - 1)) / (size * (size - 1))
+            probability = 1 - (1 - preservation_probability * probability) ** 2
+        return 1 - (1 - probability) ** num_trials  # return the probability bound over all trials
+
+    @staticmethod
+    def compute_num_trials(num_nodes, failure_probability=FAILURE_PROBABILITY):
+        """
+        Given the number of nodes of a graph and a failure probability, returns the number of trials needed to
+        miss a given minimum cut of the graph with the failure probability at most
+        """
+        probability = KargerStein.compute_success_probability(num_nodes)
+        if probability >= 1:  # a single trial enumerates all cuts
+            return 1
+        return max(1, int(ceil(log(failure_probability) / log(1 - probability))))
+
+    @staticmethod
+    def __get_target_size(num_vertices):
+        """
+        Helper function that returns the number of vertices to which a graph with the input number of vertices is
+        contracted before recursing
+        """
+        return int(ceil(1 + num_vertices / sqrt(2)))
+
+    @staticmethod
+    def __contract(num_vertices, edges, groups, target_size, generator):
+        """
+        Helper function that contracts random edges of the input graph, chosen with probability proportional to
+        their weights, until the graph has the target number of vertices (or no edges are left), and returns the
+        number of vertices, the edges and the vertex bitmasks of the contracted graph. Contracting the edges in
+        increasing order of exponential keys with rates equal to their weights samples them without replacement
+        with probabilities proportional to their weights, and skipping the edges within a merged vertex amounts
+        to removing the self-loops
+        """
+        parents = list(range(num_vertices))  # union-find forest of the merged vertices
+
+        def find(vertex):
+            while parents[vertex] != vertex:  # halve the path on the way to the root
+                parents[vertex] = parents[parents[vertex]]
+                vertex = parents[vertex]
+            return vertex
+
+        num_components = num_vertices
+        for first_vertex, second_vertex, weight in sorted(edges, key=lambda edge: generator.expovariate(edge[2])):
+            if num_components <= target_size:  # stop once the target size is reached
+                break
+            first_root, second_root = find(first_vertex), find(second_vertex)
+            if first_root != second_root:  # contract the edge
+                parents[second_root] = first_root
+                num_components -= 1
+
+        roots = dict()  # map from the roots of the forest to the vertices of the contracted graph
+        contracted_groups = list()
+        for vertex in range(num_vertices):  # merge the bitmasks of the contracted vertices
+            root = find(vertex)
+            if root not in roots:
+                roots[root] = len(contracted_groups)
+                contracted_groups.append(0)
+            contracted_groups[roots[root]] |= groups[vertex]
+        weights = dict()  # merge the parallel edges and remove the self-loops
+        for first_vertex, second_vertex, weight in edges:
+            first_vertex, second_vertex = roots[find(first_vertex)], roots[find(second_vertex)]
+            if first_vertex != second_vertex:
+                key = tuple((min(first_vertex, second_vertex), max(first_vertex, second_vertex)))
+                weights[key] = weights.get(key, 0) + weight
+        contracted_edges = [tuple((first_vertex, second_vertex, weight))
+                            for (first_vertex, second_vertex), weight in weights.items()]
+        return len(contracted_groups), contracted_edges, contracted_groups
+
+    @staticmethod
+    def __enumerate_cuts(num_vertices, edges, groups):
+        """
+        Helper function that returns every cut of a small graph as a pair of the bitmask of the side without the
+        first vertex and the weight of the cut
+        """
+        cuts = list()
+        for side in range(1, 1 << (num_vertices - 1)):  # for every nonempty side without the first vertex
+            side <<= 1
+            weight = sum([edge_weight for first_vertex, second_vertex, edge_weight in edges
+                          if (side >> first_vertex & 1) != (side >> second_vertex & 1)])
+            bitmask = 0
+            for vertex in range(num_vertices):
+                if side >> vertex & 1:
+                    bitmask |= groups[vertex]
+            cuts.append(tuple((bitmask, weight)))
+        return cuts  # return the cuts
@@ -1,4 +1,4 @@
-from GraphProcessing import GraphProcessing
+from ProfilerHooks import Profiler  # disabled stand-in if the Profiling package is not available
 from time import time
 
 
@@ -11,142 +11,125 @@ class StoerWagner:
     Link to paper: https://fktpm.ru/file/204-stoer-wagner-a-simple-min-cut-algorithm.pdf
     """
 
-    CONNECTION_STRENGTH_ATTRIBUTE = "connection strength"  # attribute key for connection strength
-
-    MERGED_NODE_NAME_DELIMITER = ","  # delimiter for merged node names
-
     @staticmethod
     def apply(G, initial_node_name):
         """
         Given an UndirectedGraph object and the initial node name, applies the Stoer-Wagner algorithm to
-        compute the minimum cut of the graph
+        compute the minimum cut of the graph and returns the cut as a pair of sets of node names along with
+        its weight
         """
-        minimum_cut = tuple()  # initialize the minimum cut and its corresponding weight
+        minimum_cut, minimum_cut_weight, node_names = \
+            StoerWagner.compute_minimum_cut(G.snapshot(), initial_node_name)  # run on the adjacency rows
+        left_partition = StoerWagner.unpack_bitmask(minimum_cut, node_names)  # convert the cut to node names
+        right_partition = set(node_names).difference(left_partition)
+        return tuple((left_partition, right_partition)), float(minimum_cut_weight)
+
+    @staticmethod
+    def compute_minimum_cut(G, initial_node_name):
+        """
+        Given a GraphSnapshot object and the initial node name, applies the Stoer-Wagner algorithm to compute
+        the minimum cut of the graph. Returns one side of the cut as a bitmask over the list of node names,
+        in which bit i is set if the i-th node is on that side, the weight of the cut and the list of node
+        names. Merged vertices are tracked as bitmasks throughout, so that recording the cut of every phase
+        takes O(1) time
+        """
+        node_names = list(G.get_node_names())  # order of the nodes in the bitmasks
+        # map from the names of the vertices of the contracted graph to the bitmasks of the nodes they merge
+        groups = dict({node_name: 1 << index for index, node_name in enumerate(node_names)})
+        minimum_cut = 0  # initialize the minimum cut and its corresponding weight
         minimum_cut_weight = float('inf')  # initialized to a very large positive number
-        G_prime = G.__deepcopy__()  # construct a deepcopy of the input graph
-        while len(G_prime.get_nodeset()) > 1:  # while the cardinality of the vertex set is greater than one
+        G_prime = G.fork()  # construct the working copy of the input graph, contracted by every phase
+        while G_prime.get_num_nodes() > 1:  # while the cardinality of the vertex set is greater than one
             # perform a single iteration of the minimum cut phase
-            G_prime, current_cut = StoerWagner.__minimum_cut_phase(G_prime, initial_node_name)
-            # evaluate the weight of the current cut
-            current_cut_weight = StoerWagner.evaluate_cut_weight(G, current_cut)
+            t0 = time() if Profiler.enabled else None
+            current_cut, current_cut_weight = StoerWagner.__minimum_cut_phase(G_prime, groups, initial_node_name)
+            if t0 is not None:
+                Profiler.record("minimum_cut_phase", t0)
             if current_cut_weight < minimum_cut_weight:  # if the weight is lower than the stored weight
                 minimum_cut = current_cut  # store the current cut and its weight as the stored cut and weight
                 minimum_cut_weight = current_cut_weight
-        return tuple(minimum_cut), float(minimum_cut_weight)  # return the minimum cut and its corresponding weight
-
-    @staticmethod
-    def __minimum_cut_phase(G, initial_node_name):
-        """
-        Given an UndirectedGraph object and the initial node name, performs a single minimum cut phase
-        iteration and returns the resulting contracted graph and the current cut of the phase
-        """
-        # initialize the induced ordering, connections strengths and the next vertex to be added to the induced ordering
-        induced_ordering = list([initial_node_name])
-        G_prime = StoerWagner.__initialize_connection_strengths(G)
-        next_vertex = GraphProcessing.search_node_names(G_prime.get_nodeset(), initial_node_name).pop()
-        while set(induced_ordering) != G_prime.get_node_names():  # while not all vertices have been ordered
-            # determine the next vertex in the ordering
-            next_vertex = StoerWagner.__determine_most_tightly_connected_vertex(G_prime, induced_ordering, next_vertex)
-            induced_ordering.append(next_vertex.get_name())  # add the vertex to the ordering
-        # construct the set of vertices to be merged
-        merge_nodelist = StoerWagner.__get_merge_nodelist(induced_ordering)
-        current_cut = StoerWagner.__construct_current_cut(induced_ordering)  # construct the cut partitions
-        G_prime.contract_graph(
-            merge_nodelist,
-            StoerWagner.MERGED_NODE_NAME_DELIMITER.join(merge_nodelist)
-        )  # perform graph contraction based on the list of vertices to be merged
-        return G_prime, current_cut  # return the contracted graph and the current cut of the phase
-
-    @staticmethod
-    def __determine_most_tightly_connected_vertex(G, induced_ordering, previous_vertex):
-        """
-        Given an UndirectedGraph object, the list of the induced ordering of vertices computed from a
-        single run of the minimum cut phase in the Stoer-Wagner algorithm, and the previous vertex added
-        to the induced ordering, determines the vertex not in the input ordering that is most strongly
-        connected to the vertices in the ordering
-        """
-        # compute the connection strengths
-        G_prime = StoerWagner.__compute_connection_strengths(G, induced_ordering, previous_vertex)
-
-        connection_strength_map = \
-            dict({
-                node: node.get_attribute_value(StoerWagner.CONNECTION_STRENGTH_ATTRIBUTE)
-                for node in G_prime.get_nodeset()
-                if node.get_name() not in induced_ordering
-            })  # obtain the connection map
-
-        # return the node with the strongest connection
-        return max(connection_strength_map, key=connection_strength_map.get)
+        return minimum_cut, float(minimum_cut_weight), node_names  # return the minimum cut and its weight
 
     @staticmethod
-    def __compute_connection_strengths(G, induced_ordering, previous_vertex):
+    def unpack_bitmask(bitmask, node_names):
         """
-        Given an UndirectedGraph object, the list of the induced ordering of vertices computed from a
-        single run of the minimum cut phase in the Stoer-Wagner algorithm and the previous vertex added
-        to the induced ordering, computes the connection strength of every vertex not in the induced ordering
-        to the vertices in the ordering
+        Given a bitmask over a list of node names and the list, returns the set of node names whose bits are set
         """
-        # for edges incident to the previous vertex added to the induced ordering
-        for edge in previous_vertex.get_incident_edges():
-            other_node = edge.get_other_node(previous_vertex.get_name())  # get the other node object
-            if other_node.get_name() not in induced_ordering:  # if the other node is not in the ordering
-                other_node.set_attribute_value(
-                    StoerWagner.CONNECTION_STRENGTH_ATTRIBUTE,
-                    other_node.get_attribute_value(StoerWagner.CONNECTION_STRENGTH_ATTRIBUTE) + edge.get_weight()
-                )  # add to the connection strength, the weight of the edge
-        return G  # return the graph with the connection strength information
+        return \
+            set({
+                node_name
+                for index, node_name in enumerate(node_names)
+                if bitmask >> index & 1
+            })  # create and return the set of node names
 
     @staticmethod
-    def __initialize_connection_strengths(G):
-        """
-        Given an UndirectedGraph object, initializes the connection strength of every vertex in the graph
-        to zero and returns the new graph
-        """
-        G_prime = G.__deepcopy__()  # construct a deepcopy of the graph
-        # for every vertex in the graph, initialize the connection strength to zero
-        for node in G_prime.get_nodeset(): node.add_attribute(StoerWagner.CONNECTION_STRENGTH_ATTRIBUTE, float(0))
-        return G_prime  # return the new graph
+    def __minimum_cut_phase(G, groups, initial_node_name):
+        """
+        Given a GraphSnapshot object, the bitmasks of the nodes merged into its vertices and the initial node
+        name, performs a single minimum cut phase iteration, contracting the graph and merging the bitmasks of
+        the last two vertices of the induced ordering in place. Returns the bitmask of the cut of the phase -
+        the nodes merged into the last vertex - along with its weight, which is the connection strength of the
+        last vertex when it was added to the ordering
+        """
+        # initialize the connection strengths and the last two vertices added to the induced ordering
+        connection_strengths = StoerWagner.__initialize_connection_strengths(G, initial_node_name)
+        previous_vertex, last_vertex, last_connection_strength = None, initial_node_name, float(0)
+        while connection_strengths:  # while not all vertices have been ordered
+            # determine the next vertex in the ordering
+            previous_vertex = last_vertex
+            last_vertex, last_connection_strength = \
+                StoerWagner.__determine_most_tightly_connected_vertex(G, connection_strengths, last_vertex)
+        current_cut = groups[last_vertex]  # the cut of the phase separates the last vertex from the others
+        t0 = time() if Profiler.enabled else None
+        # merge the last vertex into the previous one, which keeps its name
+        groups[previous_vertex] |= groups.pop(last_vertex)
+        G.contract({previous_vertex, last_vertex}, previous_vertex)
+        if t0 is not None:
+            Profiler.record("contraction", t0)
+        return current_cut, last_connection_strength  # return the cut of the phase and its weight
 
     @staticmethod
-    def __get_merge_nodelist(induced_ordering):
+    def __determine_most_tightly_connected_vertex(G, connection_strengths, previous_vertex):
         """
-        Given a list of the induced ordering of vertices computed from a single run of the minimum cut
-        phase in the Stoer-Wagner algorithm, creates a set of nodes that are to be contracted at the
-        end of the cut phase
+        Given a GraphSnapshot object, the connection strengths of the vertices not in the induced ordering
+        computed from a single run of the minimum cut phase in the Stoer-Wagner algorithm, keyed by node name,
+        and the name of the previous vertex added to the induced ordering, determines the name of the vertex
+        not in the ordering that is most strongly connected to the vertices in the ordering, removes it from
+        the connection strengths and returns it along with its connection strength
         """
-        duplicate = list(induced_ordering)  # create a copy of the list containing the induced ordering
-        return {duplicate.pop(), duplicate.pop()}  # return the vertices corresponding to the s-t cut
+        # update the connection strengths with the edges of the previous vertex
+        StoerWagner.__compute_connection_strengths(G, connection_strengths, previous_vertex)
+        # remove and return the node with the strongest connection
+        next_node_name = max(connection_strengths, key=connection_strengths.get)
+        return next_node_name, connection_strengths.pop(next_node_name)
 
     @staticmethod
-    def __construct_current_cut(induced_ordering):
+    def __compute_connection_strengths(G, connection_strengths, previous_vertex):
         """
-        Given a list of the induced ordering of vertices computed from a single run of the minimum cut
-        phase in the Stoer-Wagner algorithm, partitions and returns the vertices of the graph into two
-        sets to represent the corresponding cut of the phase
+        Given a GraphSnapshot object, the connection strengths of the vertices not in the induced ordering
+        computed from a single run of the minimum cut phase in the Stoer-Wagner algorithm, keyed by node name,
+        and the name of the previous vertex added to the induced ordering, adds the weights of the edges of the
+        previous vertex to the connection strengths of the vertices not in the ordering
         """
-        duplicate = list(induced_ordering)  # create a copy of the list containing the induced ordering
-        left_partition = {duplicate.pop()}  # create the left partition
-        right_partition = set(duplicate)  # create the right partition
-        return \
-            tuple(
-                (
-                    StoerWagner.__unpack_node_names(left_partition),
-                    StoerWagner.__unpack_node_names(right_partition)
-                )
-            )  # return the pair of partitions
+        # for edges incident to the previous vertex added to the induced ordering
+        for other_node_name, weight in G.get_neighbors(previous_vertex).items():
+            if other_node_name in connection_strengths:  # if the other node is not in the ordering
+                connection_strengths[other_node_name] += weight  # add the weight of the edge to the connection strength
+        return connection_strengths  # return the updated connection strengths
 
     @staticmethod
-    def __unpack_node_names(node_names):
+    def __initialize_connection_strengths(G, initial_node_name):
         """
-        Given a set of node names, creates and returns a new set of node names that have been post-process
-        to remove the effects of graph contraction
+        Given a GraphSnapshot object and the initial node name, returns a dictionary initializing the connection
+        strength of every other vertex of the graph to zero. The connection strengths are kept apart from the
+        graph, so that the graph need not be copied
         """
         return \
-            set({
-                unpacked_node_name
-                for node_name in node_names
-                for unpacked_node_name in node_name.split(StoerWagner.MERGED_NODE_NAME_DELIMITER)
-            })  # create and return the set of unpacked node names
+            dict({
+                node_name: float(0)
+                for node_name in G.get_node_names()
+                if node_name != initial_node_name
+            })  # return the connection strengths
 
     @staticmethod
     def evaluate_cut_weight(G, cut):
@@ -0,0 +1,42 @@
+from StoerWagner import StoerWagner
+from GraphSnapshot import GraphSnapshot
+
+
+class SubtourSeparation:
+    """
+    Class that houses the separation routine for the subtour-elimination constraints of the TSP. A
+    constraint is violated exactly when the global minimum cut of the support graph of the current
+    solution weighs less than two, so the routine is a thin wrapper around the Stoer-Wagner algorithm
+    """
+
+    TOLERANCE = 1e-6  # numerical tolerance used for the weight of the minimum cut
+
+    @staticmethod
+    def apply(nodes, values):
+        """
+        Given the nodes of a graph and the values of the decision variables keyed by node pairs, computes the
+        minimum cut of the support graph and returns one side of the cut as a frozenset of nodes (or None if
+        no subtour-elimination constraint is violated) along with the weight of the minimum cut
+        """
+        support_graph = SubtourSeparation.construct_support_graph(nodes, values)  # create the support graph
+        # get minimum cut, as a bitmask over the node names, and corresponding weight
+        minimum_cut, minimum_cut_weight, node_names = \
+            StoerWagner.compute_minimum_cut(support_graph, next(iter(support_graph.get_node_names())))
+        if minimum_cut_weight >= 2 - SubtourSeparation.TOLERANCE:  # if no constraint is violated
+            return None, minimum_cut_weight
+        # return one side of the cut and the weight of the cut
+        return frozenset(StoerWagner.unpack_bitmask(minimum_cut, node_names)), minimum_cut_weight
+
+    @staticmethod
+    def construct_support_graph(nodes, values):
+        """
+        Given the nodes of a graph and the values of the decision variables keyed by node pairs, returns the
+        support graph of the solution as a GraphSnapshot object, holding the edges of positive value
+        """
+        support_graph = GraphSnapshot()  # initialize the support graph
+        for node in nodes:
+            support_graph.add_node(node)
+        for (i, j), value in values.items():  # superimpose the positive decision variable values
+            if value > SubtourSeparation.TOLERANCE:
+                support_graph.add_edge(i, j, value)
+        return support_graph  # return the support graph
@@ -1,2 +1,4 @@
 from StoerWagner import StoerWagner
+from KargerStein import KargerStein
+from SubtourSeparation import SubtourSeparation
 
@@ -0,0 +1,73 @@
+from SolverBackend import SolverBackend
+
+
+class ModelBuilder:
+    """
+    Class containing implementation of functions used to construct the model of the TSP from a graph on
+    any SolverBackend. Decision variables are created in a single batched call and the degree-2 constraints
+    are built from a precomputed node-to-edge incidence index, so that model construction is linear in the
+    number of edges
+    """
+    @staticmethod
+    def build_model(graph, backend, objective_upper_bound=None):
+        """
+        Given a graph represented as a dictionary and a SolverBackend object, adds one binary decision variable
+        per edge and a degree-2 constraint per node to the model of the backend and returns the decision
+        variables as a dictionary keyed by node pairs. If an upper bound on the objective is given, it is
+        added as a constraint
+        """
+        edge_weights = ModelBuilder.extract_edge_weights(graph)  # retrieve the edges and their weights
+        pairs = sorted(edge_weights.keys())  # fix the order in which the variables are created
+
+        # create all decision variables at once
+        variables = \
+            dict(zip(
+                pairs,
+                backend.add_binary_variables(
+                    [edge_weights[pair] for pair in pairs],
+                    [str(i) + '_' + str(j) for i, j in pairs]
+                )
+            ))
+
+        incidence_index = ModelBuilder.construct_incidence_index(pairs)  # map every node to its incident edges
+
+        # add the degree-2 constraints
+        for node in graph.keys():
+            incident_variables = [variables[pair] for pair in incidence_index.get(node, list())]
+            backend.add_constraint(incident_variables, [1] * len(incident_variables), SolverBackend.EQUAL, 2)
+
+        if objective_upper_bound is not None:  # if an upper bound on the objective is given
+            backend.add_constraint(
+                [variables[pair] for pair in pairs],
+                [edge_weights[pair] for pair in pairs],
+                SolverBackend.LESS_EQUAL,
+                objective_upper_bound
+            )  # add the bound
+
+        return variables  # return the decision variables
+
+    @staticmethod
+    def extract_edge_weights(graph):
+        """
+        Given a graph represented as a dictionary, returns a dictionary mapping every edge, represented as an
+        ordered node pair, to its weight
+        """
+        # return the edge weights keyed by ordered node pairs
+        return \
+            dict({
+                tuple((min(i, j), max(i, j))): weight
+                for i in graph.keys()
+                for j, weight in graph[i].items()
+            })
+
+    @staticmethod
+    def construct_incidence_index(pairs):
+        """
+        Given an iterable of edges represented as node pairs, returns a dictionary mapping every node to the
+        list of edges incident to it
+        """
+        incidence_index = {}  # initialize the incidence index
+        for pair in pairs:  # for every edge
+            for node in pair:  # register the edge with both of its incident nodes
+                incidence_index.setdefault(node, list()).append(pair)
+        return incidence_index  # return the incidence index
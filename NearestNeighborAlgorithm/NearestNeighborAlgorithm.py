@@ -1,3 +1,4 @@
+import numpy as np
 from GraphProcessing import GraphProcessing
 
 
@@ -41,3 +42,51 @@ class NearestNeighborAlgorithm:
 
         return optimum_edge.get_other_node(current_vertex.get_name())
 
+    @staticmethod
+    def apply_dictionary_form(G, root_name):
+        """
+        Given a graph represented as a dictionary and the name of the root node, constructs a tour by
+        repeatedly moving to the nearest unvisited node and returns the induced ordering of the nodes.
+        Returns None if the greedy walk gets stuck or cannot return to the root node
+        """
+        if root_name not in G.keys():  # if the root node is not part of the graph
+            raise Exception("Error: The input root node is not contained in the input graph")
+        induced_ordering = list([root_name])  # initialize the ordering with the root node
+        visited = set({root_name})  # keep a set of the visited nodes for constant-time lookups
+        current_vertex = root_name
+        while len(induced_ordering) != len(G.keys()):  # while not all nodes have been visited
+            # collect the weights of the edges leading to unvisited nodes
+            weight_map = \
+                dict({
+                    other_node: weight
+                    for other_node, weight in G[current_vertex].items()
+                    if other_node not in visited
+                })
+            if not weight_map:  # if no unvisited node is adjacent, the walk is stuck
+                return None
+            current_vertex = min(weight_map, key=weight_map.get)  # move to the nearest unvisited node
+            induced_ordering.append(current_vertex)
+            visited.add(current_vertex)
+        if root_name not in G[current_vertex].keys():  # if the tour cannot be closed
+            return None
+        return induced_ordering  # return the induced ordering
+
+    @staticmethod
+    def apply_oracle_form(oracle, root_name):
+        """
+        Given a DistanceOracle object and the name of the root node, constructs a tour over the complete graph
+        by repeatedly moving to the nearest unvisited node and returns the induced ordering of the nodes. Only
+        the row of distances from the current node to the unvisited nodes is computed at every step
+        """
+        num_nodes = oracle.get_num_nodes()
+        if not 0 <= root_name < num_nodes:  # if the root node is not part of the graph
+            raise Exception("Error: The input root node is not contained in the input graph")
+        induced_ordering = list([root_name])  # initialize the ordering with the root node
+        unvisited = np.delete(np.arange(num_nodes), root_name)  # unvisited nodes in increasing order
+        current_vertex = root_name
+        while len(unvisited):  # while not all nodes have been visited
+            index = int(np.argmin(oracle.get_row(current_vertex, unvisited)))  # find the nearest unvisited node
+            current_vertex = int(unvisited[index])
+            induced_ordering.append(current_vertex)
+            unvisited = np.delete(unvisited, index)
+        return induced_ordering  # return the induced ordering
@@ -0,0 +1,179 @@
+from math import ceil
+from time import time
+from multiprocessing import Process, Queue
+from traceback import format_exc
+from SharedIncumbent import SharedIncumbent
+
+try:
+    from Queue import Empty  # Python 2
+except ImportError:
+    from queue import Empty  # Python 3
+
+
+def _run_strategy(strategy_name, graph, incumbent, results, backend_name):
+    """
+    Given the name of a strategy, a graph represented as a dictionary, the SharedIncumbent object, the
+    result queue and the name of the LP backend, runs the strategy in the current process and posts its
+    outcome to the queue as a tuple of the strategy name, the tour, its cost, whether the tour is proven
+    optimal and an error message
+    """
+    try:
+        strategy = getattr(Portfolio, Portfolio.STRATEGIES[strategy_name])
+        tour, cost, proven = strategy(graph, incumbent, backend_name)
+        results.put(tuple((strategy_name, tour, cost, proven, None)))
+    except Exception:  # report the failure instead of leaving the portfolio waiting
+        results.put(tuple((strategy_name, None, float('inf'), False, format_exc())))
+
+
+class Portfolio:
+    """
+    Class that houses a portfolio runner that attacks one instance with several strategies at once,
+    one process per strategy. The strategies share the best known tour through a SharedIncumbent
+    object, and the portfolio returns as soon as one of them proves a tour optimal, terminating the
+    others - the latency of the portfolio follows the best strategy for every instance
+    """
+
+    STRATEGIES = {
+        "held-karp": "run_held_karp",
+        "branch-and-cut": "run_branch_and_cut",
+        "heuristic": "run_heuristic"
+    }  # registry of the strategies, mapping strategy names to the static methods running them
+
+    DEFAULT_STRATEGIES = tuple(("held-karp", "branch-and-cut", "heuristic"))  # strategies run by default
+
+    POLL_INTERVAL = 0.1  # number of seconds between checks for crashed strategy processes
+
+    @staticmethod
+    def apply(graph, strategies=DEFAULT_STRATEGIES, time_limit=None, backend_name="gurobi"):
+        """
+        Given a graph represented as a dictionary (with integer node names), the names of the strategies, the
+        number of seconds the strategies may run (no limit by default) and the name of the LP backend of the
+        strategies solving LPs, runs the strategies in parallel
+        and returns the best tour as a list of node pairs, its cost, the name of the strategy that found it
+        and whether the tour is proven optimal
+        """
+        for strategy_name in strategies:  # check the strategy names before starting any process
+            if strategy_name not in Portfolio.STRATEGIES:
+                raise Exception("Error: Unknown portfolio strategy " + str(strategy_name))
+        if "held-karp" in strategies:  # the dynamic program would only fail on instances beyond its size limit
+            from HeldKarp import HeldKarp
+            if len(graph.keys()) > HeldKarp.MAX_NUM_NODES:
+                strategies = tuple([strategy_name for strategy_name in strategies if strategy_name != "held-karp"])
+
+        deadline = time() + time_limit if time_limit is not None else float('inf')  # point at which to stop
+        incumbent = SharedIncumbent(len(graph.keys()))  # create the shared incumbent slot
+        results = Queue()  # queue on which the strategies post their outcomes
+        processes = \
+            dict({
+                strategy_name:
+                    Process(target=_run_strategy, args=(strategy_name, graph, incumbent, results, backend_name))
+                for strategy_name in strategies
+            })  # create one process per strategy
+
+        best = tuple((None, float('inf'), None, False))  # best tour, its cost, its strategy and its proof
+        pending = set(strategies)  # strategies that have not posted their outcome yet
+        errors = list()  # error messages of the failed strategies
+        try:
+            for process in processes.values():  # launch the strategies
+                process.start()
+            while pending and time() < deadline:  # while some strategies are still running
+                try:
+                    strategy_name, tour, cost, proven, error = results.get(timeout=Portfolio.POLL_INTERVAL)
+                except Empty:
+                    # stop waiting once every pending strategy has exited without posting its outcome
+                    if all([not processes[name].is_alive() for name in pending]) and results.empty():
+                        break
+                    continue
+                pending.discard(strategy_name)
+                if error is not None:  # record the failure
+                    errors.append(strategy_name + ": " + error)
+                if error is None and (cost < best[1] or (cost == best[1] and proven and not best[3])):
+                    best = tuple((tour, cost, strategy_name, proven))  # record the better outcome
+                if best[3]:  # if the best tour is proven optimal, the remaining strategies are redundant
+                    break
+        finally:
+            for process in processes.values():  # terminate the remaining strategies
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        # a strategy may have published a better tour before exiting - the lock is not taken, since a strategy
+        # terminated while updating the incumbent would never release it, and no strategy is running anymore
+        shared_tour, shared_cost = incumbent.get(False)
+        # a strategy terminated while updating the incumbent may have left a partially written tour behind
+        if shared_cost < best[1] and Portfolio.__is_consistent(graph, shared_tour, shared_cost):
+            best = tuple((shared_tour, shared_cost, "incumbent", False))
+        if best[0] is None:  # if no strategy found a tour
+            raise Exception("Error: No portfolio strategy found a tour\n" + "\n".join(errors))
+        return best  # return the best tour, its cost, its strategy and whether it is proven optimal
+
+    @staticmethod
+    def __is_consistent(graph, tour, cost):
+        """
+        Helper function that returns True if the input list of node pairs is a tour of the graph of the input
+        cost and False otherwise
+        """
+        successors = dict()  # adjacency of the tour
+        for i, j in tour:
+            if i not in graph or j not in graph[i]:  # the pair must be an edge of the graph
+                return False
+            successors.setdefault(i, list()).append(j)
+            successors.setdefault(j, list()).append(i)
+        if len(successors) != len(graph.keys()) or any([len(nodes) != 2 for nodes in successors.values()]):
+            return False
+        previous_node, node, num_visited = None, tour[0][0], 0  # walk the tour to check that it is one cycle
+        while num_visited == 0 or node != tour[0][0]:
+            next_node = successors[node][0] if successors[node][0] != previous_node else successors[node][1]
+            previous_node, node, num_visited = node, next_node, num_visited + 1
+        return num_visited == len(graph.keys()) and abs(sum([graph[i][j] for i, j in tour]) - cost) < 1e-6
+
+    @staticmethod
+    def run_held_karp(graph, incumbent, backend_name):
+        """
+        Given a graph represented as a dictionary, the SharedIncumbent object and the name of the LP backend
+        (unused, as no LP is solved), solves the instance by dynamic programming and returns the tour, its
+        cost and True, since the tour is optimal
+        """
+        from HeldKarp import HeldKarp
+        tour, cost = HeldKarp.apply(graph)
+        incumbent.update(tour, cost)  # publish the tour
+        return tour, cost, True
+
+    @staticmethod
+    def run_branch_and_cut(graph, incumbent, backend_name):
+        """
+        Given a graph represented as a dictionary, the SharedIncumbent object and the name of the LP backend,
+        solves the instance using the native branch-and-cut tree with LPs of that backend, pruning against the
+        shared incumbent, and returns the tour, its cost and True, since the tour is optimal
+        """
+        from BranchAndCut import BranchAndCut
+        tour, cost = BranchAndCut.apply(graph, BranchAndCut.BEST_FIRST, backend_name, incumbent)
+        return tour, cost, True
+
+    @staticmethod
+    def run_heuristic(graph, incumbent, backend_name):
+        """
+        Given a graph represented as a dictionary, the SharedIncumbent object and the name of the LP backend
+        (unused, as no LP is solved), improves a nearest neighbor tour by 2-opt, publishes it and computes the
+        1-tree lower bound. Returns the incumbent tour, its cost and whether the bound closes the gap to the
+        incumbent, which proves the incumbent optimal
+        """
+        from NearestNeighborAlgorithm import NearestNeighborAlgorithm
+        from TwoOpt import TwoOpt
+        from OneTreeBound import OneTreeBound
+
+        ordering = NearestNeighborAlgorithm.apply_dictionary_form(graph, min(graph.keys()))
+        if ordering is not None:  # if a tour was found, improve and publish it
+            ordering = TwoOpt.apply(graph, ordering)
+            tour = [tuple((min(i, j), max(i, j))) for i, j in zip(ordering, ordering[1:] + ordering[:1])]
+            incumbent.update(tour, float(sum([graph[i][j] for i, j in tour])))
+
+        lower_bound = OneTreeBound.apply(graph, incumbent.get_cost() if ordering is not None else None)
+        integral = all([float(weight).is_integer() for i in graph.keys() for weight in graph[i].values()])
+        if integral and lower_bound != float('-inf'):  # tours of integral weights have integral costs
+            lower_bound = ceil(lower_bound - 1e-6)
+
+        tour, cost = incumbent.get()  # the incumbent may have been improved by another strategy
+        if tour is None:  # if no tour is known
+            raise Exception("Error: The heuristic did not find a tour")
+        return tour, cost, cost <= lower_bound + 1e-6
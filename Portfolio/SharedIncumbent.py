@@ -0,0 +1,54 @@
+from multiprocessing import Lock, RawArray, RawValue
+
+
+class SharedIncumbent:
+    """
+    Class that houses a shared-memory slot holding the best tour found so far by any of a number of
+    processes. The tour is stored as a flat array of node pairs next to its cost, and updates are
+    serialized by a lock so that only improving tours are ever recorded
+
+    NOTE: Node names must be integers, as produced by DataIO.read_graph
+    """
+
+    def __init__(self, num_nodes):
+        """
+        Constructor for the SharedIncumbent class - used to initialize all necessary fields of the
+        SharedIncumbent object. Must be called before the processes sharing the slot are started
+        """
+        self.lock = Lock()  # initialize all necessary fields
+        self.cost = RawValue('d', float('inf'))
+        self.tour = RawArray('l', 2 * num_nodes)
+
+    def get_cost(self):
+        """
+        Returns the cost of the incumbent tour, or infinity if no tour has been recorded
+        """
+        return self.cost.value  # return the cost
+
+    def get(self, locked=True):
+        """
+        Returns the incumbent tour as a list of node pairs along with its cost, or None and infinity if
+        no tour has been recorded. The lock is only skipped if locked is False, which is safe once no other
+        process can update the incumbent anymore (e.g. after terminating them)
+        """
+        if locked:  # read the tour and its cost consistently
+            with self.lock:
+                return self.get(False)
+        cost = self.cost.value
+        if cost == float('inf'):  # if no tour has been recorded
+            return None, cost
+        flat_tour = list(self.tour)
+        # return the tour and its cost
+        return [tuple((flat_tour[index], flat_tour[index + 1])) for index in range(0, len(flat_tour), 2)], cost
+
+    def update(self, tour, cost):
+        """
+        Given a tour as a list of node pairs and its cost, records the tour if it is cheaper than the
+        incumbent tour. Returns True if the tour was recorded and False otherwise
+        """
+        with self.lock:  # serialize the updates
+            if cost >= self.cost.value:  # if the tour does not improve the incumbent
+                return False
+            self.tour[:] = [node for pair in tour for node in pair]  # record the tour and its cost
+            self.cost.value = cost
+            return True
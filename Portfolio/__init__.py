@@ -0,0 +1,3 @@
+from SharedIncumbent import SharedIncumbent
+from Portfolio import Portfolio
+
@@ -0,0 +1,130 @@
+import sys
+import atexit
+from os import environ
+from time import time
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    Class that houses opt-in instrumentation of the hot paths of the graph and minimum cut code. Call sites
+    count calls and time sections only if the profiler is enabled, so that a disabled profiler costs a single
+    attribute lookup per call site. The profiler is enabled by the profile context manager, or for the whole
+    process by setting the TSP_PROFILE environment variable, in which case the summary table is printed to
+    stderr at exit. Setting TSP_PROFILE to a filename ending in .prof also runs cProfile and stores its
+    statistics in that file, which can be loaded by pstats or snakeviz
+
+    Usage at a call site:
+
+        if Profiler.enabled:
+            Profiler.count("get_edges")
+
+        t0 = time() if Profiler.enabled else None
+        ...
+        if t0 is not None:
+            Profiler.record("contraction", t0)
+    """
+
+    enabled = False  # whether the call sites record counts and timings
+
+    counters = dict()  # number of calls keyed by counter name
+
+    timers = dict()  # pairs of the number of timed sections and their total time keyed by timer name
+
+    ENVIRONMENT_VARIABLE = "TSP_PROFILE"  # environment variable enabling the profiler for the whole process
+
+    @staticmethod
+    def count(name):
+        """
+        Given the name of a counter, increments the counter
+        """
+        Profiler.counters[name] = Profiler.counters.get(name, 0) + 1
+
+    @staticmethod
+    def record(name, start_time):
+        """
+        Given the name of a timer and the start time of a section (as returned by time.time), adds the time
+        elapsed since the start of the section to the timer
+        """
+        elapsed_time = time() - start_time
+        num_sections, total_time = Profiler.timers.get(name, tuple((0, 0.0)))
+        Profiler.timers[name] = tuple((num_sections + 1, total_time + elapsed_time))
+
+    @staticmethod
+    def reset():
+        """
+        Resets all counters and timers
+        """
+        Profiler.counters.clear()
+        Profiler.timers.clear()
+
+    @staticmethod
+    @contextmanager
+    def profile(output_filename=None):
+        """
+        Given the name of a file (if any), returns a context manager that resets and enables the profiler for
+        the duration of the block, restoring the previous state afterwards. If a filename is given, the block
+        is also run under cProfile and its statistics are stored in the file
+        """
+        previously_enabled = Profiler.enabled
+        Profiler.reset()
+        Profiler.enabled = True
+        profile = Profiler.__start_cprofile() if output_filename is not None else None
+        try:
+            yield Profiler
+        finally:
+            Profiler.enabled = previously_enabled
+            if profile is not None:  # store the cProfile statistics
+                profile.disable()
+                profile.dump_stats(output_filename)
+
+    @staticmethod
+    def format_summary():
+        """
+        Returns a table listing every counter with its number of calls and every timer with its number of
+        timed sections, its total time and its mean time per section
+        """
+        lines = ["counter".ljust(32) + "calls".rjust(12)]
+        for name in sorted(Profiler.counters.keys()):
+            lines.append(name.ljust(32) + str(Profiler.counters[name]).rjust(12))
+        lines.append("")
+        lines.append("timer".ljust(32) + "sections".rjust(12) + "total [s]".rjust(14) + "mean [ms]".rjust(14))
+        for name in sorted(Profiler.timers.keys()):
+            num_sections, total_time = Profiler.timers[name]
+            lines.append(name.ljust(32) + str(num_sections).rjust(12) + ("%.4f" % total_time).rjust(14) +
+                         ("%.4f" % (1000 * total_time / num_sections)).rjust(14))
+        return "\n".join(lines)  # return the table
+
+    @staticmethod
+    def __start_cprofile():
+        """
+        Helper function that creates, enables and returns a cProfile.Profile object
+        """
+        from cProfile import Profile
+        profile = Profile()
+        profile.enable()
+        return profile
+
+    @staticmethod
+    def initialize_from_environment():
+        """
+        Enables the profiler for the whole process if the TSP_PROFILE environment variable is set (and not 0),
+        printing the summary table at exit and, if the variable holds a .prof filename, storing the cProfile
+        statistics of the process in that file
+        """
+        setting = environ.get(Profiler.ENVIRONMENT_VARIABLE, "")
+        if setting in ("", "0"):  # if the profiler is not requested
+            return
+        Profiler.enabled = True
+        profile = Profiler.__start_cprofile() if setting.endswith(".prof") else None
+
+        def report():
+            if profile is not None:  # store the cProfile statistics
+                profile.disable()
+                profile.dump_stats(setting)
+            sys.stderr.write(Profiler.format_summary() + "\n")
+
+        atexit.register(report)
+
+
+Profiler.initialize_from_environment()  # enable the profiler if requested by the environment
@@ -0,0 +1,43 @@
+import json
+from math import isinf, isnan
+
+
+class Telemetry:
+    """
+    Class that houses a sink for the per-iteration events emitted by the solver loops, writing every event
+    as one line of JSON. A Telemetry object is a callable and can be passed wherever a callback is expected
+
+    Every event is a dictionary holding at least the fields:
+    - event: "iteration"
+    - algorithm: name of the loop emitting the event
+    - iteration: number of the solve within the loop, starting at one
+    - objective: objective value of the solve
+    - bound: bound on the optimal tour cost known after the solve
+    - cuts_added: number of subtour-elimination constraints added after the solve
+    - min_cut_weight: weight of the minimum cut of the support graph of the solution
+    - solve_time: number of seconds spent solving the model
+    - separation_time: number of seconds spent separating subtour-elimination constraints
+    - num_variables, num_constraints: size of the model at the time of the solve
+    """
+
+    def __init__(self, file, fields=None):
+        """
+        Constructor for the Telemetry class - used to initialize all necessary fields of the Telemetry object.
+        Given an open file and a dictionary of fields (if any), every event is written to the file along with
+        the fields, e.g. the name of the instance
+        """
+        self.file = file  # initialize all necessary fields
+        self.fields = dict(fields) if fields is not None else dict()
+
+    def __call__(self, event):
+        """
+        Given an event represented as a dictionary, writes the event to the file as one line of JSON. Infinite
+        and undefined numbers are written as null, since JSON has no representation for them
+        """
+        record = dict(self.fields)
+        record.update(event)
+        for key, value in record.items():  # replace the numbers that JSON cannot represent
+            if isinstance(value, float) and (isinf(value) or isnan(value)):
+                record[key] = None
+        self.file.write(json.dumps(record, sort_keys=True) + "\n")
+        self.file.flush()  # make the event visible to readers following the file
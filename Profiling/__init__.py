@@ -0,0 +1,3 @@
+from Profiler import Profiler
+from Telemetry import Telemetry
+
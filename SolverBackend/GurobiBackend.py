@@ -0,0 +1,152 @@
+from gurobipy import *
+from SolverBackend import SolverBackend
+
+
+class GurobiBackend(SolverBackend):
+    """
+    Implementation of the SolverBackend interface on top of a gurobi model. Variable handles are the
+    gurobi Var objects themselves, so the underlying model may also be used directly
+    """
+
+    SENSES = {
+        SolverBackend.EQUAL: GRB.EQUAL,
+        SolverBackend.GREATER_EQUAL: GRB.GREATER_EQUAL,
+        SolverBackend.LESS_EQUAL: GRB.LESS_EQUAL
+    }  # mapping from the interface constraint senses to the gurobi constraint senses
+
+    LAZY_CUT_LEVEL = 1  # value of the Lazy attribute of cuts - the least aggressive lazy constraint level
+
+    def __init__(self, model_name, relaxed=False, environment=None):
+        """
+        Constructor for the GurobiBackend class - used to initialize all necessary fields of the
+        GurobiBackend object. The environment, if given, is a gurobi Env object
+        """
+        SolverBackend.__init__(self, model_name, relaxed, environment)  # initialize the common fields
+        # create the gurobi model, within the shared environment if one is given
+        self.model = Model(model_name) if environment is None else Model(model_name, env=environment)
+
+    @staticmethod
+    def initialize_environment(quiet=False):
+        """
+        Given whether solver output should be suppressed, creates, starts and returns a gurobi Env object
+        """
+        environment = Env(empty=True)  # create the environment
+        if quiet:  # suppress all solver output, including the license banner
+            environment.setParam("OutputFlag", 0)
+        environment.start()  # start the environment - checks out the license
+        return environment  # return the environment
+
+    def add_binary_variables(self, objective_coefficients, names):
+        """
+        Given a list of objective coefficients and a list of variable names, adds one binary decision
+        variable per coefficient to the model in a single batched call and returns the list of gurobi Var objects
+        """
+        variables = self.model.addVars(
+            len(names),
+            lb=0.0,
+            ub=1.0,
+            obj=list(objective_coefficients),
+            vtype=GRB.CONTINUOUS if self.relaxed else GRB.BINARY,
+            name=list(names)
+        )  # create all decision variables at once
+        return [variables[index] for index in range(len(names))]  # return the variables in order
+
+    def add_constraint(self, variables, coefficients, sense, rhs):
+        """
+        Given a list of gurobi Var objects, their coefficients, the constraint sense and the right-hand side,
+        adds the linear constraint to the model and returns the gurobi Constr object
+        """
+        return self.model.addLConstr(LinExpr(list(coefficients), list(variables)), GurobiBackend.SENSES[sense], rhs)
+
+    def add_lazy_cut(self, variables, coefficients, sense, rhs):
+        """
+        Given a list of gurobi Var objects, their coefficients, the constraint sense and the right-hand side,
+        adds the linear constraint to the model as a lazy constraint and returns the gurobi Constr object
+        """
+        constraint = self.add_constraint(variables, coefficients, sense, rhs)  # add the constraint
+        if not self.relaxed:  # lazy constraints are only supported for integer programs
+            constraint.setAttr("Lazy", GurobiBackend.LAZY_CUT_LEVEL)
+        return constraint  # return the constraint
+
+    def remove_constraint(self, constraint):
+        """
+        Given a gurobi Constr object, removes the constraint from the model
+        """
+        self.model.remove(constraint)
+
+    def set_variable_bounds(self, variables, lower_bounds, upper_bounds):
+        """
+        Given a list of gurobi Var objects and the lists of their lower and upper bounds, overwrites the
+        bounds of the variables
+        """
+        self.model.setAttr("LB", list(variables), list(lower_bounds))  # set all bounds in a single call each
+        self.model.setAttr("UB", list(variables), list(upper_bounds))
+
+    def set_relaxed(self, relaxed):
+        """
+        Given whether the model is relaxed, switches the type of all variables of the gurobi model to continuous
+        if relaxed is True and to binary otherwise
+        """
+        SolverBackend.set_relaxed(self, relaxed)  # record the state of the model
+        self.model.update()  # include the pending variables
+        variables = self.model.getVars()
+        # set the types of all variables in a single call
+        self.model.setAttr("VType", variables, [GRB.CONTINUOUS if relaxed else GRB.BINARY] * len(variables))
+
+    def optimize(self):
+        """
+        Solves the current model. Returns True if an optimal solution was found and False if the model is
+        infeasible. Raises an exception otherwise
+        """
+        remaining_time = self.get_remaining_time()  # limit the solve to the time left before the deadline
+        if remaining_time is not None:
+            self.model.setParam("TimeLimit", remaining_time)
+        self.model.update()  # update the model
+        self.model.optimize()  # solve the program
+        status = self.model.getAttr("Status")
+        if status in (GRB.INFEASIBLE, GRB.INF_OR_UNBD):  # if the model is infeasible
+            return False
+        if status == GRB.TIME_LIMIT:  # if the deadline was reached during the solve
+            raise Exception("Error: The time limit was reached")
+        if status != GRB.OPTIMAL:  # if the model was not solved to optimality
+            raise Exception("Error: Gurobi terminated with status " + str(status))
+        return True
+
+    def get_values(self, variables):
+        """
+        Given a list of gurobi Var objects, returns the list of their values in the current solution
+        """
+        return self.model.getAttr("X", list(variables))  # read all values in a single call
+
+    def get_objective_value(self):
+        """
+        Returns the objective value of the current solution
+        """
+        return self.model.getAttr("ObjVal")  # return the objective value
+
+    def get_objective_bound(self):
+        """
+        Returns the best bound on the objective value proven by the last solve
+        """
+        if self.model.getAttr("IsMIP"):  # the bound of an integer program is tracked by the branch-and-bound
+            return self.model.getAttr("ObjBound")
+        return self.model.getAttr("ObjVal")  # the bound of a linear program is its optimal value
+
+    def get_model_size(self):
+        """
+        Returns the number of variables and the number of constraints of the model
+        """
+        self.model.update()  # include the pending modifications
+        return self.model.getAttr("NumVars"), self.model.getAttr("NumConstrs")
+
+    def write(self, filename):
+        """
+        Given a filename ending in .lp or .sol, writes the model or the current solution to the file
+        """
+        self.model.write(filename)  # output the file using gurobi
+
+    def get_model(self):
+        """
+        Returns the underlying gurobi model
+        """
+        return self.model  # return the model
@@ -0,0 +1,233 @@
+import numpy as np
+from scipy.optimize import milp, Bounds, LinearConstraint
+from scipy.sparse import csr_matrix
+from SolverBackend import SolverBackend
+
+
+class HiGHSBackend(SolverBackend):
+    """
+    Implementation of the SolverBackend interface on top of the HiGHS solver shipped with SciPy
+    (scipy.optimize.milp). Does not require a solver license. Variable handles are column indices and
+    constraints are stored as sparse rows, so the model is rebuilt as a sparse matrix on every solve. Removed
+    constraints keep their rows, which are left out of the matrix, so that row indices remain valid handles
+    """
+
+    INFEASIBLE_STATUS = 2  # status reported by scipy.optimize.milp for infeasible models
+
+    LIMIT_STATUS = 1  # status reported by scipy.optimize.milp when an iteration or time limit was reached
+
+    def __init__(self, model_name, relaxed=False, environment=None):
+        """
+        Constructor for the HiGHSBackend class - used to initialize all necessary fields of the
+        HiGHSBackend object. HiGHS has no environment, so the environment is ignored
+        """
+        SolverBackend.__init__(self, model_name, relaxed, environment)  # initialize the common fields
+        self.names = []  # variable names and objective coefficients indexed by column
+        self.objective_coefficients = []
+        self.lower_bounds = []  # variable bounds indexed by column
+        self.upper_bounds = []
+        self.row_data = []  # constraint matrix in compressed sparse row format
+        self.row_indices = []
+        self.row_pointers = [0]
+        self.row_senses = []  # constraint senses and right-hand sides indexed by row
+        self.row_rhs = []
+        self.row_active = []  # whether every row is part of the model, i.e. has not been removed
+        self.num_active_rows = 0
+        self.solution = None  # values of the current solution
+        self.objective_value = None  # objective value of the current solution
+        self.objective_bound = None  # bound on the objective value proven by the last solve
+
+    def add_binary_variables(self, objective_coefficients, names):
+        """
+        Given a list of objective coefficients and a list of variable names, adds one binary decision
+        variable per coefficient to the model and returns the list of column indices
+        """
+        first_index = len(self.names)  # index of the first new column
+        self.names.extend(names)  # record the names and the objective coefficients
+        self.objective_coefficients.extend(objective_coefficients)
+        self.lower_bounds.extend([0.0] * len(names))  # binary variables are bounded by zero and one
+        self.upper_bounds.extend([1.0] * len(names))
+        return list(range(first_index, len(self.names)))  # return the new column indices
+
+    def add_constraint(self, variables, coefficients, sense, rhs):
+        """
+        Given a list of column indices, their coefficients, the constraint sense and the right-hand side,
+        adds the linear constraint to the model and returns its row index
+        """
+        if sense not in (SolverBackend.EQUAL, SolverBackend.GREATER_EQUAL, SolverBackend.LESS_EQUAL):
+            raise Exception("Error: Unknown constraint sense " + str(sense))
+        self.row_indices.extend(variables)  # append the row to the constraint matrix
+        self.row_data.extend(coefficients)
+        self.row_pointers.append(len(self.row_indices))
+        self.row_senses.append(sense)  # record the sense and the right-hand side
+        self.row_rhs.append(float(rhs))
+        self.row_active.append(True)
+        self.num_active_rows += 1
+        return len(self.row_senses) - 1  # return the row index
+
+    def remove_constraint(self, constraint):
+        """
+        Given a row index, removes the constraint from the model
+        """
+        if self.row_active[constraint]:
+            self.row_active[constraint] = False
+            self.num_active_rows -= 1
+
+    def set_variable_bounds(self, variables, lower_bounds, upper_bounds):
+        """
+        Given a list of column indices and the lists of their lower and upper bounds, overwrites the
+        bounds of the variables
+        """
+        for index, lower_bound, upper_bound in zip(variables, lower_bounds, upper_bounds):
+            self.lower_bounds[index] = float(lower_bound)
+            self.upper_bounds[index] = float(upper_bound)
+
+    def optimize(self):
+        """
+        Solves the current model using HiGHS. Returns True if an optimal solution was found and False if
+        the model is infeasible. Raises an exception otherwise
+        """
+        num_variables, num_constraints = len(self.names), len(self.row_senses)
+        active = np.array(self.row_active, dtype=bool)
+        rhs = np.array(self.row_rhs, dtype=float)[active]
+        senses = np.array(self.row_senses)[active]
+        # translate the senses into lower and upper bounds of the rows
+        lower_bounds = np.where(senses == SolverBackend.LESS_EQUAL, -np.inf, rhs)
+        upper_bounds = np.where(senses == SolverBackend.GREATER_EQUAL, np.inf, rhs)
+        constraints = list()
+        if self.num_active_rows:  # if the model has constraints
+            A = csr_matrix(
+                (
+                    np.array(self.row_data, dtype=float),
+                    np.array(self.row_indices, dtype=int),
+                    np.array(self.row_pointers, dtype=int)
+                ),
+                shape=(num_constraints, num_variables)
+            )  # assemble the sparse constraint matrix
+            if self.num_active_rows < num_constraints:  # leave out the removed rows
+                A = A[active]
+            constraints.append(LinearConstraint(A, lower_bounds, upper_bounds))
+
+        options = dict()  # limit the solve to the time left before the deadline
+        remaining_time = self.get_remaining_time()
+        if remaining_time is not None:
+            options["time_limit"] = remaining_time
+
+        result = milp(
+            np.array(self.objective_coefficients, dtype=float),
+            integrality=np.zeros(num_variables) if self.relaxed else np.ones(num_variables),
+            bounds=Bounds(np.array(self.lower_bounds, dtype=float), np.array(self.upper_bounds, dtype=float)),
+            constraints=constraints,
+            options=options
+        )  # solve the program
+
+        if result.status == HiGHSBackend.INFEASIBLE_STATUS:  # if the model is infeasible
+            self.solution, self.objective_value = None, None
+            return False
+        if result.status == HiGHSBackend.LIMIT_STATUS:  # if the deadline was reached during the solve
+            self.solution, self.objective_value = None, None
+            raise Exception("Error: The time limit was reached")
+        if not result.success:  # if the model was not solved to optimality
+            raise Exception("Error: HiGHS terminated with status " + str(result.status) + ": " + str(result.message))
+        self.solution = result.x  # record the solution
+        self.objective_value = float(result.fun)
+        # the dual bound is only reported for integer programs
+        mip_dual_bound = getattr(result, "mip_dual_bound", None)
+        self.objective_bound = float(mip_dual_bound) if mip_dual_bound is not None else self.objective_value
+        return True
+
+    def get_values(self, variables):
+        """
+        Given a list of column indices, returns the list of their values in the current solution
+        """
+        if self.solution is None:  # if the model has not been solved
+            raise Exception("Error: The model has not been solved")
+        values = self.solution[np.array(list(variables), dtype=int)]  # gather the values
+        if not self.relaxed:  # round off the integrality tolerance of the binary variables
+            values = np.round(values)
+        return values.tolist()  # return the values
+
+    def get_objective_value(self):
+        """
+        Returns the objective value of the current solution
+        """
+        if self.objective_value is None:  # if the model has not been solved
+            raise Exception("Error: The model has not been solved")
+        return self.objective_value  # return the objective value
+
+    def get_objective_bound(self):
+        """
+        Returns the best bound on the objective value proven by the last solve
+        """
+        if self.objective_bound is None:  # if the model has not been solved
+            raise Exception("Error: The model has not been solved")
+        return self.objective_bound  # return the bound
+
+    def get_model_size(self):
+        """
+        Returns the number of variables and the number of constraints of the model
+        """
+        return len(self.names), self.num_active_rows
+
+    def write(self, filename):
+        """
+        Given a filename ending in .lp or .sol, writes the model in CPLEX LP format or the current solution
+        as name-value pairs to the file
+        """
+        if filename.endswith(".sol"):  # if the solution is requested
+            with open(filename, 'w') as file:  # open the file
+                file.write("# Objective value = " + repr(self.get_objective_value()) + "\n")
+                for name, value in zip(self.names, self.solution.tolist()):  # write every variable value
+                    file.write(name + " " + repr(value + 0.0) + "\n")  # normalize negative zeros
+        elif filename.endswith(".lp"):  # if the model is requested
+            with open(filename, 'w') as file:  # open the file
+                file.write("\\ Model " + self.model_name + "\n")
+                file.write("Minimize\n  " + HiGHSBackend.__format_expression(
+                    self.objective_coefficients, self.names) + "\n")
+                file.write("Subject To\n")
+                for row in range(len(self.row_senses)):  # write every constraint
+                    if not self.row_active[row]:  # skip the removed constraints
+                        continue
+                    start, end = self.row_pointers[row], self.row_pointers[row + 1]
+                    expression = HiGHSBackend.__format_expression(
+                        self.row_data[start:end],
+                        [self.names[index] for index in self.row_indices[start:end]]
+                    )
+                    sense = "=" if self.row_senses[row] == SolverBackend.EQUAL else self.row_senses[row]
+                    file.write(" R" + str(row) + ": " + expression + " " + sense + " " + repr(self.row_rhs[row]) + "\n")
+                file.write("Bounds\n")
+                # declare the current variable bounds, including those overwritten by set_variable_bounds
+                for name, lower_bound, upper_bound in zip(self.names, self.lower_bounds, self.upper_bounds):
+                    if lower_bound == upper_bound:  # fixed variable
+                        file.write(" " + name + " = " + HiGHSBackend.__format_bound(lower_bound) + "\n")
+                    else:
+                        file.write(" " + HiGHSBackend.__format_bound(lower_bound) + " <= " + name + " <= " +
+                                   HiGHSBackend.__format_bound(upper_bound) + "\n")
+                if not self.relaxed:  # declare the integrality of the variables
+                    file.write("Binaries\n")
+                    for name in self.names:
+                        file.write(" " + name + "\n")
+                file.write("End\n")
+        else:  # otherwise the file type is not supported
+            raise Exception("Error: Unsupported file type " + filename)
+
+    @staticmethod
+    def __format_bound(bound):
+        """
+        Given a variable bound, returns the bound formatted as a string, writing infinite bounds as infinity
+        """
+        if bound in (float('inf'), -float('inf')):  # infinite bounds are spelled out in CPLEX LP format
+            return ("" if bound > 0 else "-") + "infinity"
+        return repr(float(bound))  # return the formatted bound
+
+    @staticmethod
+    def __format_expression(coefficients, names):
+        """
+        Given a list of coefficients and the corresponding variable names, returns the linear expression
+        formatted as a string
+        """
+        return \
+            " ".join([
+                ("+ " if coefficient >= 0 else "- ") + repr(abs(float(coefficient))) + " " + name
+                for coefficient, name in zip(coefficients, names)
+            ])  # return the formatted expression
@@ -0,0 +1,181 @@
+from time import time
+from importlib import import_module
+
+
+class SolverBackend:
+    """
+    General-purpose interface of the LP/MIP solvers used to solve the TSP formulations. Implementations
+    wrap a single model and refer to its decision variables through opaque handles returned by
+    add_binary_variables
+
+    NOTE: The package only exports this interface. Implementations are imported on demand by the
+    create method, so that a backend can be used on machines where the other solvers are not installed
+    """
+
+    EQUAL = "=="  # constraint senses
+    GREATER_EQUAL = ">="
+    LESS_EQUAL = "<="
+
+    BACKENDS = {
+        "gurobi": "GurobiBackend",
+        "highs": "HiGHSBackend"
+    }  # registry of the backend implementations keyed by backend name
+
+    def __init__(self, model_name, relaxed=False, environment=None):
+        """
+        Constructor for the SolverBackend class - used to initialize all necessary fields of the
+        SolverBackend object. If relaxed is True, the binary decision variables are relaxed to the
+        interval [0, 1] and the backend solves the LP relaxation instead. The environment, if given,
+        must have been created by create_environment for the same backend
+        """
+        self.model_name = model_name  # initialize all necessary fields
+        self.relaxed = relaxed
+        self.environment = environment
+        self.deadline = None
+
+    def add_binary_variables(self, objective_coefficients, names):
+        """
+        Given a list of objective coefficients and a list of variable names, adds one binary decision
+        variable per coefficient to the model and returns the list of variable handles
+        """
+        raise NotImplementedError("Error: add_binary_variables is not implemented by the backend")
+
+    def add_constraint(self, variables, coefficients, sense, rhs):
+        """
+        Given a list of variable handles, their coefficients, the constraint sense and the right-hand side,
+        adds the linear constraint to the model
+        """
+        raise NotImplementedError("Error: add_constraint is not implemented by the backend")
+
+    def add_lazy_cut(self, variables, coefficients, sense, rhs):
+        """
+        Given a list of variable handles, their coefficients, the constraint sense and the right-hand side,
+        adds the linear constraint to the model as a cut that the solver may enforce lazily and returns its handle
+        """
+        return self.add_constraint(variables, coefficients, sense, rhs)  # by default, cuts are regular constraints
+
+    def remove_constraint(self, constraint):
+        """
+        Given the handle of a constraint returned by add_constraint or add_lazy_cut, removes the constraint
+        from the model
+        """
+        raise NotImplementedError("Error: remove_constraint is not implemented by the backend")
+
+    def set_variable_bounds(self, variables, lower_bounds, upper_bounds):
+        """
+        Given a list of variable handles and the lists of their lower and upper bounds, overwrites the
+        bounds of the variables - used to fix variables when branching
+        """
+        raise NotImplementedError("Error: set_variable_bounds is not implemented by the backend")
+
+    def optimize(self):
+        """
+        Solves the current model. Returns True if an optimal solution was found and False if the model is
+        infeasible. Raises an exception otherwise
+        """
+        raise NotImplementedError("Error: optimize is not implemented by the backend")
+
+    def get_values(self, variables):
+        """
+        Given a list of variable handles, returns the list of their values in the current solution
+        """
+        raise NotImplementedError("Error: get_values is not implemented by the backend")
+
+    def get_objective_value(self):
+        """
+        Returns the objective value of the current solution
+        """
+        raise NotImplementedError("Error: get_objective_value is not implemented by the backend")
+
+    def get_objective_bound(self):
+        """
+        Returns the best bound on the objective value proven by the last solve
+        """
+        return self.get_objective_value()  # by default, solves are optimal and the bound is the objective value
+
+    def get_model_size(self):
+        """
+        Returns the number of variables and the number of constraints of the model
+        """
+        raise NotImplementedError("Error: get_model_size is not implemented by the backend")
+
+    def write(self, filename):
+        """
+        Given a filename ending in .lp or .sol, writes the model or the current solution to the file
+        """
+        raise NotImplementedError("Error: write is not implemented by the backend")
+
+    def get_model_name(self):
+        """
+        Returns the name of the model
+        """
+        return self.model_name  # return the model name
+
+    def is_relaxed(self):
+        """
+        Returns True if the backend solves the LP relaxation and False otherwise
+        """
+        return self.relaxed  # return whether the model is relaxed
+
+    def set_relaxed(self, relaxed):
+        """
+        Given whether the model is relaxed, switches all decision variables of the model to the interval [0, 1]
+        if relaxed is True and back to binary otherwise, so that the next solve of the model is an LP or an IP
+        """
+        self.relaxed = relaxed  # by default, the integrality of the variables is decided when the model is solved
+
+    def set_deadline(self, deadline):
+        """
+        Given a point in time (as returned by time.time) or None, sets the deadline after which optimize
+        raises an exception instead of solving the model. None removes the deadline
+        """
+        self.deadline = deadline  # record the deadline
+
+    def get_remaining_time(self):
+        """
+        Returns the number of seconds left before the deadline, or None if no deadline is set. Raises an
+        exception if the deadline has passed
+        """
+        if self.deadline is None:  # if no deadline is set
+            return None
+        remaining_time = self.deadline - time()
+        if remaining_time <= 0:  # if the deadline has passed
+            raise Exception("Error: The time limit was reached")
+        return remaining_time  # return the remaining time
+
+    @staticmethod
+    def initialize_environment(quiet=False):
+        """
+        Given whether solver output should be suppressed, creates and returns the environment shared by the
+        models of the backend, or None if the backend has no such notion
+        """
+        return None  # by default, backends have no environment
+
+    @staticmethod
+    def create(backend_name, model_name, relaxed=False, environment=None):
+        """
+        Given the name of a backend, the model name, whether the model is relaxed and an environment created
+        by create_environment (if any), imports the corresponding backend implementation and returns a new
+        backend object
+        """
+        # import the implementation and return the backend object
+        return SolverBackend.get_backend_class(backend_name)(model_name, relaxed, environment)
+
+    @staticmethod
+    def create_environment(backend_name, quiet=False):
+        """
+        Given the name of a backend and whether solver output should be suppressed, creates an environment
+        that can be reused by all models of the backend created in the current process - e.g. so that a
+        worker process checks out a solver license only once
+        """
+        return SolverBackend.get_backend_class(backend_name).initialize_environment(quiet)
+
+    @staticmethod
+    def get_backend_class(backend_name):
+        """
+        Given the name of a backend, imports and returns the backend implementation registered under the name
+        """
+        if backend_name not in SolverBackend.BACKENDS:  # if the backend is unknown
+            raise Exception("Error: Unknown solver backend " + str(backend_name))
+        module_name = SolverBackend.BACKENDS[backend_name]  # the implementation shares its module name
+        return getattr(import_module(module_name), module_name)  # import the implementation
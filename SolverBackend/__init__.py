@@ -0,0 +1,2 @@
+from SolverBackend import SolverBackend
+
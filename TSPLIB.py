@@ -0,0 +1,177 @@
+import gzip
+import numpy as np
+
+
+class TSPLIB:
+    """
+    Class containing implementation of functions used to read symmetric TSP instances in the TSPLIB format, as
+    specified by Reinelt in "TSPLIB 95". Node coordinates and explicit edge weights are read into numpy arrays,
+    and the distances of every EDGE_WEIGHT_TYPE are computed for whole arrays of node pairs at once. Files
+    ending in .gz are decompressed on the fly
+
+    NOTE: TSPLIB numbers the nodes from 1, whereas the graphs of this package number them from 0
+    """
+
+    # edge weight types whose distances are computed from node coordinates, mapped to the number of coordinates
+    COORDINATE_TYPES = dict({
+        "EUC_2D": 2, "EUC_3D": 3, "MAN_2D": 2, "MAN_3D": 3, "MAX_2D": 2, "MAX_3D": 3, "CEIL_2D": 2, "ATT": 2,
+        "GEO": 2
+    })
+
+    # layouts of the EDGE_WEIGHT_SECTION of explicit instances - a layout listing the columns of a triangle is
+    # the layout listing the rows of the opposite triangle, so both map to the same triangle and diagonal offset
+    MATRIX_FORMATS = dict({
+        "UPPER_ROW": tuple(("upper", 1)), "LOWER_COL": tuple(("upper", 1)),
+        "LOWER_ROW": tuple(("lower", -1)), "UPPER_COL": tuple(("lower", -1)),
+        "UPPER_DIAG_ROW": tuple(("upper", 0)), "LOWER_DIAG_COL": tuple(("upper", 0)),
+        "LOWER_DIAG_ROW": tuple(("lower", 0)), "UPPER_DIAG_COL": tuple(("lower", 0))
+    })
+
+    EARTH_RADIUS = 6378.388  # radius of the idealized sphere used by the GEO edge weight type, in kilometers
+
+    PI = 3.141592  # value of pi used by the GEO edge weight type
+
+    @staticmethod
+    def read_instance(filename):
+        """
+        Given the name of a TSPLIB file, reads the instance and returns it as a dictionary holding the
+        specification entries keyed by their names (e.g. NAME, DIMENSION and EDGE_WEIGHT_TYPE), the node
+        coordinates as an array with one row per node under "coordinates" and the explicit edge weights as a
+        symmetric matrix under "matrix" - whichever the instance does not define is None
+        """
+        opener = gzip.open if filename.lower().endswith(".gz") else open
+        with opener(filename, 'rb') as file:  # read the whole file, decompressing it if needed
+            lines = file.read().decode("ascii").splitlines()
+
+        instance = dict({"EDGE_WEIGHT_FORMAT": None, "coordinates": None, "matrix": None})
+        sections = dict()  # values of every data section as a flat array
+        line_index = 0
+        while line_index < len(lines):  # for every line of the file
+            line = lines[line_index].strip()
+            line_index += 1
+            if not line or line == "EOF":  # skip blank lines and the end marker
+                continue
+            if ":" in line:  # if the line is a specification entry
+                key, value = [part.strip() for part in line.split(":", 1)]
+                instance[key] = value
+                continue
+            # otherwise the line opens a data section, which extends to the next keyword
+            section_name, start_index = line, line_index
+            while line_index < len(lines) and not lines[line_index].strip()[:1].isalpha():
+                line_index += 1
+            sections[section_name] = np.array(" ".join(lines[start_index:line_index]).split(), dtype=float)
+
+        if instance.get("TYPE", "TSP").split().pop(0) != "TSP":  # only symmetric instances are supported
+            raise Exception("Error: Unsupported TSPLIB problem type " + str(instance["TYPE"]))
+        num_nodes = int(instance["DIMENSION"])
+        edge_weight_type = instance.get("EDGE_WEIGHT_TYPE")
+
+        if edge_weight_type in TSPLIB.COORDINATE_TYPES:  # if the distances are computed from coordinates
+            num_coordinates = TSPLIB.COORDINATE_TYPES[edge_weight_type]
+            data = sections.get("NODE_COORD_SECTION")
+            if data is None or len(data) != num_nodes * (num_coordinates + 1):
+                raise Exception("Error: The NODE_COORD_SECTION of " + filename + " does not match its DIMENSION")
+            data = data.reshape((num_nodes, num_coordinates + 1))  # rows of node number and coordinates
+            instance["coordinates"] = data[np.argsort(data[:, 0], kind="mergesort"), 1:]  # order the nodes
+        elif edge_weight_type == "EXPLICIT":  # if the edge weights are listed
+            data = sections.get("EDGE_WEIGHT_SECTION")
+            if data is None:
+                raise Exception("Error: " + filename + " has no EDGE_WEIGHT_SECTION")
+            instance["matrix"] = TSPLIB.__construct_matrix(data, num_nodes, instance["EDGE_WEIGHT_FORMAT"])
+        else:  # otherwise the edge weight type is not supported
+            raise Exception("Error: Unsupported TSPLIB edge weight type " + str(edge_weight_type))
+        return instance  # return the instance
+
+    @staticmethod
+    def compute_distances(edge_weight_type, first_coordinates, second_coordinates):
+        """
+        Given an edge weight type and two arrays of node coordinates whose last axis holds the coordinates of a
+        node, returns the array of the integer distances between the nodes, broadcasting the arrays against
+        each other - e.g. coordinates of shapes (n, 1, 2) and (1, n, 2) yield the (n, n) distance matrix
+        """
+        if edge_weight_type == "GEO":  # the coordinates are latitudes and longitudes in DDD.MM format
+            first_coordinates = TSPLIB.__convert_to_radians(first_coordinates)
+            second_coordinates = TSPLIB.__convert_to_radians(second_coordinates)
+            q1 = np.cos(first_coordinates[..., 1] - second_coordinates[..., 1])
+            q2 = np.cos(first_coordinates[..., 0] - second_coordinates[..., 0])
+            q3 = np.cos(first_coordinates[..., 0] + second_coordinates[..., 0])
+            return np.floor(
+                TSPLIB.EARTH_RADIUS * np.arccos(np.clip(0.5 * ((1 + q1) * q2 - (1 - q1) * q3), -1, 1)) + 1
+            ).astype(np.int64)
+
+        differences = first_coordinates - second_coordinates
+        if edge_weight_type.startswith("MAN"):  # Manhattan distances
+            return np.floor(np.abs(differences).sum(axis=-1) + 0.5).astype(np.int64)
+        if edge_weight_type.startswith("MAX"):  # maximum distances
+            return np.floor(np.abs(differences).max(axis=-1) + 0.5).astype(np.int64)
+
+        squared_distances = (differences ** 2).sum(axis=-1)
+        if edge_weight_type == "ATT":  # pseudo-Euclidean distances, rounded up
+            distances = np.sqrt(squared_distances / 10.0)
+            rounded_distances = np.floor(distances + 0.5)
+            return np.where(rounded_distances < distances, rounded_distances + 1, rounded_distances).astype(np.int64)
+        if edge_weight_type == "CEIL_2D":  # Euclidean distances, rounded up
+            return np.ceil(np.sqrt(squared_distances)).astype(np.int64)
+        if edge_weight_type in ("EUC_2D", "EUC_3D"):  # Euclidean distances, rounded to the nearest integer
+            return np.floor(np.sqrt(squared_distances) + 0.5).astype(np.int64)
+        raise Exception("Error: Unsupported TSPLIB edge weight type " + str(edge_weight_type))
+
+    @staticmethod
+    def compute_distance_matrix(instance):
+        """
+        Given an instance as returned by read_instance, returns the symmetric matrix of the distances between
+        all pairs of nodes
+        """
+        if instance["matrix"] is not None:  # if the edge weights are listed
+            return instance["matrix"]
+        coordinates, edge_weight_type = instance["coordinates"], instance["EDGE_WEIGHT_TYPE"]
+        matrix = TSPLIB.compute_distances(edge_weight_type, coordinates[:, None, :], coordinates[None, :, :])
+        np.fill_diagonal(matrix, 0)  # the GEO distance of a node to itself is the rounding offset
+        return matrix  # return the distance matrix
+
+    @staticmethod
+    def read_graph(filename):
+        """
+        Given the name of a TSPLIB file, reads the instance and returns the complete graph over its nodes as a
+        dictionary, numbering the nodes from 0
+        """
+        rows = TSPLIB.compute_distance_matrix(TSPLIB.read_instance(filename)).tolist()  # convert to integers once
+        return \
+            dict({
+                i: dict({j: weight for j, weight in enumerate(row) if j != i})
+                for i, row in enumerate(rows)
+            })  # return the graph
+
+    @staticmethod
+    def __construct_matrix(data, num_nodes, edge_weight_format):
+        """
+        Helper function that arranges the values of an EDGE_WEIGHT_SECTION in the input format into the
+        symmetric matrix of the edge weights
+        """
+        if edge_weight_format == "FULL_MATRIX":
+            if len(data) != num_nodes * num_nodes:
+                raise Exception("Error: The EDGE_WEIGHT_SECTION does not match the DIMENSION")
+            matrix = data.reshape((num_nodes, num_nodes))
+        elif edge_weight_format in TSPLIB.MATRIX_FORMATS:
+            triangle, offset = TSPLIB.MATRIX_FORMATS[edge_weight_format]
+            rows, columns = \
+                np.triu_indices(num_nodes, offset) if triangle == "upper" else np.tril_indices(num_nodes, offset)
+            if len(data) != len(rows):
+                raise Exception("Error: The EDGE_WEIGHT_SECTION does not match the DIMENSION")
+            matrix = np.zeros((num_nodes, num_nodes))
+            matrix[rows, columns] = data  # fill the triangle in row-major order and mirror it
+            matrix[columns, rows] = data
+        else:  # otherwise the format is not supported
+            raise Exception("Error: Unsupported TSPLIB edge weight format " + str(edge_weight_format))
+        matrix = np.array(matrix)
+        np.fill_diagonal(matrix, 0)  # the diagonal may hold placeholders
+        return matrix.astype(np.int64) if np.all(matrix == np.round(matrix)) else matrix
+
+    @staticmethod
+    def __convert_to_radians(coordinates):
+        """
+        Helper function that converts coordinates given in the DDD.MM (degrees and minutes) format of the GEO
+        edge weight type into radians
+        """
+        degrees = np.trunc(coordinates)
+        return TSPLIB.PI * (degrees + 5.0 * (coordinates - degrees) / 3.0) / 180.0
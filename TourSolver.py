@@ -0,0 +1,110 @@
+from time import time
+from SolverBackend import SolverBackend
+
+
+class TourSolver:
+    """
+    Class containing implementation of functions used to pick a solution algorithm for an instance and
+    run it, so that every driver (interactive or batch) solves instances the same way. Algorithms are
+    imported lazily, so that the heuristic and dynamic programming algorithms run without a solver
+    """
+
+    SPARSE_MODE_THRESHOLD = 150  # instances with at least this many nodes are solved using edge pricing
+
+    HELD_KARP_THRESHOLD = 16  # instances with at most this many nodes are solved by dynamic programming
+
+    # names of the algorithms - "cutting-plane" re-solves the integer program, "branch-and-cut" runs the native
+    # tree, "held-karp" runs the dynamic program, "portfolio" races all of them in parallel, "heuristic" returns
+    # a 2-opt tour without proof of optimality and "auto" picks the dynamic program for small instances
+    ALGORITHMS = tuple(("auto", "cutting-plane", "branch-and-cut", "held-karp", "portfolio", "heuristic"))
+
+    SOLVER_ALGORITHMS = tuple(("cutting-plane", "branch-and-cut"))  # algorithms run within a solver environment
+
+    @staticmethod
+    def resolve_algorithm(algorithm, num_nodes):
+        """
+        Given the name of an algorithm and the number of nodes of an instance, returns the name of the
+        algorithm actually run on the instance
+        """
+        if algorithm not in TourSolver.ALGORITHMS:  # if the algorithm is unknown
+            raise Exception("Error: Unknown algorithm " + str(algorithm))
+        if algorithm == "auto":  # pick the dynamic program for small instances
+            return "held-karp" if num_nodes <= TourSolver.HELD_KARP_THRESHOLD else "cutting-plane"
+        return algorithm
+
+    @staticmethod
+    def solve(graph, algorithm="auto", backend_name="gurobi", environment=None, node_selection="best-first",
+              verbose=False, time_limit=None, callback=None, checkpoint=None):
+        """
+        Given a graph represented as a dictionary (with integer node names), the name of the algorithm, the name
+        of the LP/MIP backend, an environment created by SolverBackend.create_environment (if any) and the node
+        selection rule of the native tree, solves the TSP over the input graph. Returns a dictionary holding the
+        name of the algorithm run, the tour as a list of node pairs, its cost, the number of solver iterations
+        and of subtour-elimination constraints added, and - for the algorithms solving a single model - the
+        backend and the decision variables keyed by node pairs. If a time limit (in seconds) is given, the
+        solver-based algorithms raise an exception once it is exceeded and the portfolio returns its best tour.
+        If a callback is given, the solver-based algorithms call it with an event dictionary after every solve.
+        If a Checkpoint object is given, the cutting-plane loop and the branch-and-cut tree resume from its cuts
+        and save their progress to it - the sparse edge pricing ignores it, since its model lacks most edges
+        """
+        algorithm = TourSolver.resolve_algorithm(algorithm, len(graph.keys()))  # resolve the algorithm
+        deadline = time() + time_limit if time_limit is not None else None  # point at which to give up
+        statistics = dict({"iterations": 0, "cuts": 0})  # statistics of the solve
+        result = dict({"algorithm": algorithm, "backend": None, "variables": None})
+
+        if algorithm == "held-karp":  # solve the instance by dynamic programming - no solver is required
+            from HeldKarp import HeldKarp
+            result["tour"], result["cost"] = HeldKarp.apply(graph)
+
+        elif algorithm == "portfolio":  # race the exact and heuristic strategies, keeping the first proven tour
+            from Portfolio import Portfolio
+            result["tour"], result["cost"], result["strategy"], result["proven"] = \
+                Portfolio.apply(graph, Portfolio.DEFAULT_STRATEGIES, time_limit, backend_name)
+
+        elif algorithm == "heuristic":  # improve a nearest neighbor tour by 2-opt - no solver is required
+            result["tour"], result["cost"] = TourSolver.construct_heuristic_tour(graph)
+
+        elif algorithm == "branch-and-cut":  # solve the instance using the native branch-and-cut tree
+            from BranchAndCut import BranchAndCut
+            result["tour"], result["cost"] = \
+                BranchAndCut.apply(graph, node_selection, backend_name, None, environment, statistics, deadline,
+                                   callback, checkpoint)
+
+        else:
+            # solve large instances over a sparse candidate edge set - the pricing relies on gurobi duals
+            if backend_name == "gurobi" and len(graph.keys()) >= TourSolver.SPARSE_MODE_THRESHOLD:
+                from CandidateEdgePricing import CandidateEdgePricing
+                backend, variables = CandidateEdgePricing.apply(graph, CandidateEdgePricing.NUM_NEIGHBORS,
+                                                                environment, statistics, deadline, callback)
+
+            else:  # otherwise solve the complete model
+                from CuttingPlane import CuttingPlane
+                backend = SolverBackend.create(backend_name, "TSP", environment=environment)  # create the model
+                backend.set_deadline(deadline)
+                variables = CuttingPlane.apply(graph, backend, statistics, verbose, callback, checkpoint)
+
+            # retrieve the tour from the solved model
+            pairs = sorted(variables.keys())
+            values = backend.get_values([variables[pair] for pair in pairs])
+            result["tour"] = [pair for pair, value in zip(pairs, values) if value > 0.5]
+            result["cost"] = backend.get_objective_value()
+            result["backend"], result["variables"] = backend, variables
+
+        result.update(statistics)  # record the statistics of the solve
+        return result  # return the result
+
+    @staticmethod
+    def construct_heuristic_tour(graph):
+        """
+        Given a graph represented as a dictionary, improves a nearest neighbor tour by 2-opt and returns the
+        tour as a list of node pairs along with its cost
+        """
+        from NearestNeighborAlgorithm import NearestNeighborAlgorithm
+        from TwoOpt import TwoOpt
+
+        ordering = NearestNeighborAlgorithm.apply_dictionary_form(graph, min(graph.keys()))
+        if ordering is None:  # if the nearest neighbor walk did not close a tour
+            raise Exception("Error: The heuristic did not find a tour")
+        ordering = TwoOpt.apply(graph, ordering)  # improve the tour
+        tour = [tuple((min(i, j), max(i, j))) for i, j in zip(ordering, ordering[1:] + ordering[:1])]
+        return tour, float(sum([graph[i][j] for i, j in tour]))  # return the tour and its cost
@@ -0,0 +1,128 @@
+class AttributeStore:
+    """
+    General-purpose columnar attribute store for the UndirectedGraph module. The attributes of a set of graph
+    elements (the nodes or the edges of a graph) are kept in one column per attribute key rather than in one
+    dictionary per element. A column holds a default value shared by every element, which makes setting an
+    attribute on all elements a single assignment, along with the values of the elements that override it.
+    Every column also keeps an index from values to the elements overriding the default with them, built on
+    the first search of the column, so that filtering on an attribute value does not scan the elements
+
+    NOTE: Elements are identified by hashable keys (e.g. node names) and attribute values must be hashable
+    """
+
+    def __init__(self):
+        """
+        Constructor for the AttributeStore class - used to initialize all necessary fields of the AttributeStore
+        object
+        """
+        self.defaults = dict()  # default value of every attribute key set on all elements
+        self.columns = dict()  # map from attribute keys to the values of the elements, keyed by element key
+        self.indexes = dict()  # map from attribute keys to the sets of element keys, keyed by value
+
+    def copy(self, element_keys=None):
+        """
+        Given a collection of element keys (defaults to all elements), returns a copy of the store restricted
+        to the input elements. The value indexes are rebuilt by the copy when it is first searched
+        """
+        store = AttributeStore()
+        store.defaults = dict(self.defaults)
+        if element_keys is None:  # copy every column entirely
+            store.columns = dict({key: dict(column) for key, column in self.columns.items()})
+        else:  # only copy the values of the input elements
+            element_keys = set(element_keys)
+            store.columns = \
+                dict({
+                    key: dict({
+                        element_key: value for element_key, value in column.items() if element_key in element_keys
+                    })
+                    for key, column in self.columns.items()
+                })
+        return store  # return the copy
+
+    def set_column(self, attribute_key, attribute_value):
+        """
+        Given an attribute key and the corresponding attribute value, sets the attribute of every element to
+        the input value, discarding the values of the individual elements
+        """
+        self.defaults[attribute_key] = attribute_value  # a single assignment covers all elements
+        self.columns[attribute_key] = dict()
+        self.indexes[attribute_key] = dict()
+
+    def set_value(self, element_key, attribute_key, attribute_value):
+        """
+        Given an element key and an attribute key-value pair, sets the attribute of the element to the input
+        value. If the element has a value for the key, the value is overwritten
+        """
+        column = self.columns.setdefault(attribute_key, dict())
+        index = self.indexes.get(attribute_key)
+        if index is not None and element_key in column:  # remove the element from the index of its old value
+            AttributeStore.__discard(index, column[element_key], element_key)
+        column[element_key] = attribute_value
+        if index is not None:  # add the element to the index of its new value
+            index.setdefault(attribute_value, set()).add(element_key)
+
+    def has_value(self, element_key, attribute_key):
+        """
+        Given an element key and an attribute key, returns True if the element has a value for the key and
+        False otherwise
+        """
+        return attribute_key in self.defaults or element_key in self.columns.get(attribute_key, dict())
+
+    def get_value(self, element_key, attribute_key):
+        """
+        Given an element key and an attribute key, returns the value of the attribute of the element. Raises
+        an exception if the element has no value for the key
+        """
+        column = self.columns.get(attribute_key, dict())
+        if element_key in column:  # if the element overrides the default
+            return column[element_key]
+        if attribute_key in self.defaults:  # otherwise fall back on the default
+            return self.defaults[attribute_key]
+        raise Exception("Error: Attribute " + str(attribute_key) + " is not set for " + str(element_key))
+
+    def get_attribute_keys(self):
+        """
+        Returns the set of attribute keys held by the store
+        """
+        return set(self.columns.keys())  # return the attribute keys
+
+    def remove_element(self, element_key):
+        """
+        Given an element key, removes the values of the element from every column of the store
+        """
+        for attribute_key, column in self.columns.items():  # remove the element from every column and index
+            if element_key in column:
+                value = column.pop(element_key)
+                if attribute_key in self.indexes:
+                    AttributeStore.__discard(self.indexes[attribute_key], value, element_key)
+
+    def search(self, attribute_key, attribute_value, get_element_keys):
+        """
+        Given an attribute key-value pair and a function returning the keys of all elements, returns the set of
+        keys of the elements whose attribute has the input value. The function is only called when the value is
+        the default of the column, in which case every element not overriding the default matches
+        """
+        if attribute_key not in self.columns:  # if no element has the attribute
+            return set()
+        column = self.columns[attribute_key]
+        if attribute_key not in self.indexes:  # build the index of the column on its first search
+            index = dict()
+            for element_key, value in column.items():
+                index.setdefault(value, set()).add(element_key)
+            self.indexes[attribute_key] = index
+        element_keys = set(self.indexes[attribute_key].get(attribute_value, set()))  # elements overriding the default
+        if attribute_key in self.defaults and self.defaults[attribute_key] == attribute_value:
+            element_keys.update({element_key for element_key in get_element_keys() if element_key not in column})
+        return element_keys  # return the matching element keys
+
+    @staticmethod
+    def __discard(index, value, element_key):
+        """
+        Helper function that removes an element key from the index entry of the input value, deleting the entry
+        once it is empty
+        """
+        element_keys = index.get(value)
+        if element_keys is not None:
+            element_keys.discard(element_key)
+            if not element_keys:
+                del index[value]
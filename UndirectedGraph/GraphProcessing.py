@@ -1,3 +1,7 @@
+from Node import Node
+from ProfilerHooks import Profiler  # disabled stand-in if the Profiling package is not available
+
+
 class GraphProcessing:
     """
     Class that houses static methods related to various graph processing algorithms
@@ -21,16 +25,42 @@ class GraphProcessing:
         return graph_element.get_attributes()[attribute_key] == attribute_value
 
     @staticmethod
-    def search_graph_elements(graph_element_set, attribute_key, attribute_value):
+    def search_graph_elements(graph_element_set, attribute_key, attribute_value, graph=None):
         """
-        Given a set of graph elements and an attribute key-value pair, returns a filtered set of graph
-        elements that possess the input key-value pair
+        Given a set of graph elements (all nodes or all edges), an attribute key-value pair and optionally the
+        UndirectedGraph object holding the elements, returns a filtered set of graph elements that possess the
+        input key-value pair. If the graph is given, the graph-level attributes of the elements are looked up in
+        the value index of the graph, and elements without a graph-level value fall back on their own attributes
         """
+        if graph is None:  # filter the elements on their own attributes
+            # return the filtered set of graph elements
+            return \
+                {
+                    graph_element for graph_element in graph_element_set
+                    if GraphProcessing.has_attribute_value(graph_element, attribute_key, attribute_value)
+                }
+        graph_element_set = set(graph_element_set)
+        if all(isinstance(graph_element, Node) for graph_element in graph_element_set):  # search the nodes
+            matching_keys = graph.search_nodes(attribute_key, attribute_value)
+            store = graph.node_attribute_store
+
+            def get_key(node):
+                return node.get_name()
+        else:  # search the edges
+            matching_keys = graph.search_edges(attribute_key, attribute_value)
+            store = graph.edge_attribute_store
+
+            def get_key(edge):
+                return graph.get_edge_key(edge.get_first_incident_node().get_name(),
+                                          edge.get_second_incident_node().get_name())
         # return the filtered set of graph elements
         return \
             {
                 graph_element for graph_element in graph_element_set
-                if GraphProcessing.has_attribute_value(graph_element, attribute_key, attribute_value)
+                if get_key(graph_element) in matching_keys or
+                (not store.has_value(get_key(graph_element), attribute_key) and
+                 GraphProcessing.has_attribute_key(graph_element, attribute_key) and
+                 GraphProcessing.has_attribute_value(graph_element, attribute_key, attribute_value))
             }
 
     @staticmethod
@@ -38,6 +68,8 @@ class GraphProcessing:
         """
         Given a set of nodes, returns a filtered set of nodes that have names identical to the input name
         """
+        if Profiler.enabled:
+            Profiler.count("search_node_names")
         # return the filtered set of nodes
         return \
             {
@@ -69,3 +101,41 @@ class GraphProcessing:
         # return the number of edges
         return sum([len(graph[source_node].keys()) for source_node in graph.keys()]) / 2
 
+    @staticmethod
+    def compute_nearest_neighbors(graph, num_neighbors):
+        """
+        Given a graph represented using dictionary format and the number of neighbors, returns a dictionary
+        mapping every node to the list of its (at most) num_neighbors nearest adjacent nodes, sorted by
+        increasing edge weight
+        """
+        # return the nearest neighbor lists
+        return \
+            dict({
+                node: sorted(graph[node].keys(), key=graph[node].get)[:num_neighbors]
+                for node in graph.keys()
+            })
+
+    @staticmethod
+    def compute_minimum_spanning_tree(graph):
+        """
+        Given a graph represented using dictionary format, computes the minimum spanning tree of the input
+        graph using Prim's algorithm and returns the order in which the nodes were added along with the total
+        weight of the tree
+        """
+        mst = []  # initialize a list to record the edges
+        weight = 0  # initialize the total weight to zero
+        mst.append(0)  # add 0 to the ordering of vertices
+        while len(mst) != len(graph):  # while all vertices have not been added yet
+            min2 = float('inf')  # initialize to negative infinity
+            node_add = 0
+            new_w = 0
+            for j in mst:  # for every node in the graph
+                inner_dict = graph[j]  # retrieve the inner dictionary
+                for k in inner_dict:  # for every node in the inner dictionary
+                    if inner_dict[k] < min2 and k not in mst:  # get the minimum edge
+                        min2 = inner_dict[k]
+                        new_w = min2
+                        node_add = k
+            mst.append(node_add)  # append the next node
+            weight += new_w  # add the weight to the tally
+        return mst, weight  # return the final ordering and the total weight
@@ -0,0 +1,165 @@
+class GraphSnapshot:
+    """
+    General-purpose copy-on-write adjacency representation of an undirected weighted graph for the UndirectedGraph
+    module. The graph is stored as a table of adjacency rows - one dictionary per node mapping its neighbors to
+    the weights of the connecting edges. Forking a snapshot takes O(1) time, as the fork shares the table and the
+    rows with its parent. Whichever snapshot mutates a shared row first duplicates that row (and the table, once),
+    so that a snapshot only pays for the rows it modifies and the other snapshots are left untouched
+
+    NOTE: Node names must be hashable and unique, and multiple edges and self-loops are not supported
+    """
+
+    def __init__(self, rows=None):
+        """
+        Constructor for the GraphSnapshot class - used to initialize all necessary fields of the GraphSnapshot
+        object. Given a graph represented as a dictionary (defaults to the null graph), creates a snapshot
+        holding a copy of the graph
+        """
+        self.rows = dict()  # map from node names to their adjacency rows
+        self.owns_table = True  # whether the table of rows is owned by this snapshot and no other
+        self.owned_rows = set()  # names of the nodes whose rows are owned by this snapshot and no other
+        self.num_edges = 0
+        for node_name, row in (rows if rows is not None else dict()).items():  # copy the rows of the input graph
+            self.add_node(node_name)
+            for other_node_name, weight in row.items():
+                self.add_edge(node_name, other_node_name, weight)
+
+    def fork(self):
+        """
+        Creates and returns a copy of the snapshot in O(1) time. The copy shares the table and the rows of the
+        snapshot until either of them mutates them
+        """
+        snapshot = GraphSnapshot()
+        snapshot.rows = self.rows  # share the structure of the graph
+        snapshot.owns_table = False
+        snapshot.num_edges = self.num_edges
+        self.owns_table = False  # the rows are shared from now on, so both snapshots must copy before writing
+        self.owned_rows = set()
+        return snapshot  # return the copy
+
+    def add_node(self, node_name):
+        """
+        Given a node name, adds a disconnected node of that name to the graph if the graph does not contain it
+        """
+        if node_name not in self.rows:
+            self.__get_writable_table()[node_name] = dict()
+            self.owned_rows.add(node_name)
+
+    def remove_node(self, node_name):
+        """
+        Given a node name, removes the node and its incident edges from the graph
+        """
+        for other_node_name in list(self.rows[node_name].keys()):  # remove the incident edges
+            self.remove_edge(node_name, other_node_name)
+        del self.__get_writable_table()[node_name]  # remove the node
+        self.owned_rows.discard(node_name)
+
+    def add_edge(self, first_node_name, second_node_name, weight):
+        """
+        Given the names of two nodes and a weight, connects the nodes using an edge of the input weight, adding
+        the nodes if needed. If the nodes are already connected, the weight of their edge is overwritten
+        """
+        if first_node_name == second_node_name:  # self-loops are not supported
+            raise Exception("Error: Self-loops are not supported")
+        self.add_node(first_node_name)
+        self.add_node(second_node_name)
+        if second_node_name not in self.rows[first_node_name]:  # if the edge is new
+            self.num_edges += 1
+        self.__get_writable_row(first_node_name)[second_node_name] = weight
+        self.__get_writable_row(second_node_name)[first_node_name] = weight
+
+    def remove_edge(self, first_node_name, second_node_name):
+        """
+        Given the names of two nodes, removes the edge connecting them, if any
+        """
+        if second_node_name in self.rows.get(first_node_name, dict()):
+            del self.__get_writable_row(first_node_name)[second_node_name]
+            del self.__get_writable_row(second_node_name)[first_node_name]
+            self.num_edges -= 1
+
+    def contract(self, node_names, merged_node_name):
+        """
+        Given a set of node names to merge and the final merged node name, contracts the nodes in the input set
+        to a single node. Edges between merged nodes are deleted, and edges from merged nodes to a remaining node
+        are replaced by a single edge weighted by the sum of their weights
+        """
+        merged_row = dict()  # accumulate the weights of the edges leaving the merged nodes
+        for node_name in node_names:
+            for other_node_name, weight in self.rows[node_name].items():
+                if other_node_name not in node_names:
+                    merged_row[other_node_name] = merged_row.get(other_node_name, 0) + weight
+        for node_name in node_names:  # remove the merged nodes and their edges
+            self.remove_node(node_name)
+        self.add_node(merged_node_name)  # connect the merged node to the remaining nodes
+        for other_node_name, weight in merged_row.items():
+            self.add_edge(merged_node_name, other_node_name, weight)
+
+    def contains_node(self, node_name):
+        """
+        Given a node name, returns True if the graph contains a node of that name and False otherwise
+        """
+        return node_name in self.rows
+
+    def contains_edge(self, first_node_name, second_node_name):
+        """
+        Given the names of two nodes, returns True if an edge connects them and False otherwise
+        """
+        return second_node_name in self.rows.get(first_node_name, dict())
+
+    def get_weight(self, first_node_name, second_node_name):
+        """
+        Given the names of two nodes, returns the weight of the edge connecting them. Raises an exception if such
+        an edge does not exist
+        """
+        if not self.contains_edge(first_node_name, second_node_name):
+            raise Exception("Invalid request: desired edge does not exist.")
+        return self.rows[first_node_name][second_node_name]  # return the weight
+
+    def get_neighbors(self, node_name):
+        """
+        Given a node name, returns a dictionary mapping the neighbors of the node to the weights of the edges
+        connecting them to the node
+        """
+        return dict(self.rows[node_name])  # return a copy, so that the shared row cannot be mutated
+
+    def get_node_names(self):
+        """
+        Returns the set of node names of the graph
+        """
+        return set(self.rows.keys())  # return the node names
+
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes of the graph
+        """
+        return len(self.rows)
+
+    def get_num_edges(self):
+        """
+        Returns the number of edges of the graph
+        """
+        return self.num_edges
+
+    def to_dictionary(self):
+        """
+        Returns the graph represented as a dictionary
+        """
+        return dict({node_name: dict(row) for node_name, row in self.rows.items()})  # copy every row
+
+    def __get_writable_table(self):
+        """
+        Helper function that returns the table of rows of the snapshot, duplicating it first if it is shared
+        """
+        if not self.owns_table:  # copy the table, but not the rows it refers to
+            self.rows = dict(self.rows)
+            self.owns_table = True
+        return self.rows
+
+    def __get_writable_row(self, node_name):
+        """
+        Helper function that returns the adjacency row of the input node, duplicating it first if it is shared
+        """
+        if node_name not in self.owned_rows:  # copy the row into the table of the snapshot
+            self.__get_writable_table()[node_name] = dict(self.rows[node_name])
+            self.owned_rows.add(node_name)
+        return self.rows[node_name]
@@ -0,0 +1,11 @@
+try:
+    from Profiler import Profiler
+except ImportError:  # the Profiling package is optional
+    class Profiler:
+        """
+        Disabled stand-in for the Profiler class of the Profiling package, used by the call sites of the graph
+        and minimum cut code when the package is not available. Call sites only count calls and time sections
+        if the profiler is enabled, so this stand-in needs nothing but the flag
+        """
+
+        enabled = False  # the call sites never record counts and timings
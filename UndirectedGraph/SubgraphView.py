@@ -0,0 +1,169 @@
+from Edge import Edge
+
+
+class SubgraphView:
+    """
+    General-purpose read-only view of an induced subgraph of an UndirectedGraph object. Rather than duplicating
+    the nodes and edges of the subgraph, the view holds a reference to the parent graph together with one mask
+    over the nodes and one over the edges of the parent, in which the bytes of the kept elements are set. Creating
+    a view evaluates the predicates in a single pass over the parent, and the subgraph is only built as a new
+    UndirectedGraph object when it is materialized
+
+    NOTE: The Node and Edge objects returned by a view belong to the parent graph, so their incident edges are
+          those of the parent. The view must not be used once the parent has been mutated
+    """
+
+    def __init__(self, graph, node_predicate=None, edge_predicate=None):
+        """
+        Constructor for the SubgraphView class - used to initialize all necessary fields of the SubgraphView
+        object. Given an UndirectedGraph object, a predicate that accepts Node objects and a predicate that
+        accepts Edge objects (each defaults to keeping every element), creates the view of the subgraph made of
+        the kept nodes and of the kept edges whose incident nodes are both kept
+        """
+        self.graph = graph  # initialize all necessary fields
+        self.nodes = list(graph.nodeset)  # elements of the parent, in the order of the masks
+        self.edges = list()
+        for node in self.nodes:  # list every edge once, from its first incident node, without copying the sets
+            for edge in node.incident_edges:
+                if edge.get_first_incident_node().get_name() == node.get_name():
+                    self.edges.append(edge)
+        # node mask, holding 1 at the position of every kept node
+        self.node_mask = bytearray([1]) * len(self.nodes) if node_predicate is None else \
+            bytearray([1 if node_predicate(node) else 0 for node in self.nodes])
+        kept_node_names = set({node.get_name() for node, kept in zip(self.nodes, self.node_mask) if kept})
+        # edge mask, holding 1 at the position of every kept edge
+        self.edge_mask = \
+            bytearray([
+                1 if (edge.get_first_incident_node().get_name() in kept_node_names and
+                      edge.get_second_incident_node().get_name() in kept_node_names and
+                      (edge_predicate is None or edge_predicate(edge))) else 0
+                for edge in self.edges
+            ])
+        self.edge_index = None  # map from edge keys to the kept edges, built on the first edge lookup
+
+    def __deepcopy__(self):
+        """
+        Creates and returns the subgraph of the view as a new UndirectedGraph object
+        """
+        return self.materialize()  # a deepcopy of a view is its materialized subgraph
+
+    def get_parent_graph(self):
+        """
+        Returns the UndirectedGraph object of which the view is a subgraph
+        """
+        return self.graph  # return the parent graph
+
+    def get_nodeset(self):
+        """
+        Returns the set of nodes of the subgraph
+        """
+        return set({node for node, kept in zip(self.nodes, self.node_mask) if kept})  # return the nodeset
+
+    def get_node_names(self):
+        """
+        Returns a set of names belonging to the nodes of the subgraph
+        """
+        return set({node.get_name() for node, kept in zip(self.nodes, self.node_mask) if kept})
+
+    def get_edges(self):
+        """
+        Returns a set of the edges of the subgraph
+        """
+        return set({edge for edge, kept in zip(self.edges, self.edge_mask) if kept})  # return the edges
+
+    def get_num_nodes(self):
+        """
+        Returns the number of nodes of the subgraph
+        """
+        return self.node_mask.count(b"\x01")
+
+    def get_num_edges(self):
+        """
+        Returns the number of edges of the subgraph
+        """
+        return self.edge_mask.count(b"\x01")
+
+    def contains_edge(self, node, other_node):
+        """
+        Given two node objects, returns true if there exists an edge between the two objects in the subgraph
+        and false otherwise
+        """
+        return self.graph.get_edge_key(node.get_name(), other_node.get_name()) in self.__get_edge_index()
+
+    def get_edge(self, node, other_node):
+        """
+        Given two nodes, returns the edge of the subgraph that connects them. Raises an exception if such an
+        edge does not exist
+        """
+        edge_key = self.graph.get_edge_key(node.get_name(), other_node.get_name())
+        if edge_key in self.__get_edge_index():  # if there exists an edge between the two input nodes
+            return self.__get_edge_index()[edge_key]  # return the edge
+        # otherwise raise an exception
+        raise Exception("Invalid request: desired edge does not exist.")
+
+    def get_node_attribute_value(self, node_name, attribute_key):
+        """
+        Given a node name and an attribute key, returns the value of the graph-level attribute of the node
+        """
+        return self.graph.get_node_attribute_value(node_name, attribute_key)
+
+    def get_edge_attribute_value(self, node_name_pair, attribute_key):
+        """
+        Given the pair of names of the incident nodes of an edge and an attribute key, returns the value of the
+        graph-level attribute of the edge
+        """
+        return self.graph.get_edge_attribute_value(node_name_pair, attribute_key)
+
+    def search_nodes(self, attribute_key, attribute_value):
+        """
+        Given an attribute key-value pair, returns the set of names of the nodes of the subgraph whose
+        graph-level attribute has the input value
+        """
+        return self.graph.search_nodes(attribute_key, attribute_value).intersection(self.get_node_names())
+
+    def search_edges(self, attribute_key, attribute_value):
+        """
+        Given an attribute key-value pair, returns the set of edge keys of the edges of the subgraph whose
+        graph-level attribute has the input value
+        """
+        return self.graph.search_edges(attribute_key, attribute_value).intersection(self.__get_edge_index().keys())
+
+    def materialize(self):
+        """
+        Creates and returns the subgraph of the view as a new UndirectedGraph object, made of disconnected
+        copies of the kept nodes connected by copies of the kept edges, along with the graph-level attributes
+        of the kept elements
+        """
+        # disconnected copies of the kept nodes, keyed by node name
+        nodes = \
+            dict({
+                node.get_name(): node.produce_duplicate_disconnected_node()
+                for node, kept in zip(self.nodes, self.node_mask) if kept
+            })
+        for edge, kept in zip(self.edges, self.edge_mask):  # for every kept edge
+            if kept:  # connect the copies of its incident nodes using a copy of the edge
+                first_incident_node = nodes[edge.get_first_incident_node().get_name()]
+                second_incident_node = nodes[edge.get_second_incident_node().get_name()]
+                duplicate_edge = Edge(edge.get_weight(), dict(edge.get_attributes()), first_incident_node,
+                                      second_incident_node)
+                first_incident_node.add_incident_edge(duplicate_edge)
+                second_incident_node.add_incident_edge(duplicate_edge)
+        subgraph = self.graph.__class__(set(nodes.values()))  # create the subgraph, validating it once
+        if self.graph.node_attribute_store.get_attribute_keys():  # copy the graph-level attributes, if any
+            subgraph.node_attribute_store = self.graph.node_attribute_store.copy(nodes.keys())
+        if self.graph.edge_attribute_store.get_attribute_keys():
+            subgraph.edge_attribute_store = self.graph.edge_attribute_store.copy(self.__get_edge_index().keys())
+        return subgraph  # return the subgraph
+
+    def __get_edge_index(self):
+        """
+        Helper function that returns the map from edge keys to the kept edges, building it on its first call
+        """
+        if self.edge_index is None:
+            self.edge_index = \
+                dict({
+                    self.graph.get_edge_key(edge.get_first_incident_node().get_name(),
+                                            edge.get_second_incident_node().get_name()): edge
+                    for edge, kept in zip(self.edges, self.edge_mask) if kept
+                })
+        return self.edge_index
@@ -1,11 +1,20 @@
 from Node import Node
 from Edge import Edge
+from AttributeStore import AttributeStore
+from SubgraphView import SubgraphView
+from GraphSnapshot import GraphSnapshot
 from GraphProcessing import GraphProcessing
+from ProfilerHooks import Profiler  # disabled stand-in if the Profiling package is not available
 
 
 class UndirectedGraph:
     """
     General-purpose UndirectedGraph class for the UndirectedGraph module
+
+    NOTE: Besides the attributes of the individual Node and Edge objects, the graph keeps graph-level attributes
+          in two columnar AttributeStore objects - one for the nodes, keyed by node name, and one for the edges,
+          keyed by the frozenset of their incident node names - which can be set on all elements at once and
+          searched by value without scanning the elements
     """
     def __init__(self, nodeset):
         """
@@ -13,6 +22,8 @@ class UndirectedGraph:
         UndirectedGraph object
         """
         self.nodeset = nodeset  # initialize all necessary fields
+        self.node_attribute_store = AttributeStore()  # graph-level attributes of the nodes and edges
+        self.edge_attribute_store = AttributeStore()
 
         self.__check_validity()  # check if graph is valid - throws exception if not
 
@@ -46,26 +57,49 @@ class UndirectedGraph:
         """
         return UndirectedGraph.extract_edge_induced_subgraph(self, lambda edge: True)  # copy all edges
 
+    def snapshot(self):
+        """
+        Returns a GraphSnapshot object holding the adjacency rows of the graph. Unlike a deepcopy, the snapshot
+        can be forked in O(1) time, each fork duplicating only the rows it mutates
+        """
+        snapshot = GraphSnapshot()
+        for node in self.nodeset:  # add every node, then every edge from both of its incident nodes
+            snapshot.add_node(node.get_name())
+        for node in self.nodeset:
+            for edge in node.get_incident_edges():
+                snapshot.add_edge(edge.get_first_incident_node().get_name(),
+                                  edge.get_second_incident_node().get_name(),
+                                  edge.get_weight())
+        return snapshot  # return the snapshot
+
     def add_node_attributes(self, attribute_key, attribute_value):
         """
         Given an attribute key and the corresponding attribute value, adds the key-value pair to the
         attributes registry of each of the nodes in the nodeset of the graph
+
+        NOTE: The graph is copied before setting the attribute. The attribute is also set as a graph-level
+              attribute of the copy (see set_node_attribute), so that search_nodes finds the nodes by its value
         """
         G_prime = self.__deepcopy__()  # create a deepcopy of the undirected graph
         for node in G_prime.get_nodeset():  # for every node in the graph
             # add the attribute key-value pair to the attributes registry of the node
             node.add_attribute(attribute_key, attribute_value)
+        G_prime.set_node_attribute(attribute_key, attribute_value)  # index the attribute in a single assignment
         return G_prime  # return the modified graph
 
     def add_edge_attributes(self, attribute_key, attribute_value):
         """
         Given an attribute key and the corresponding attribute value, adds the key-value pair to the
         attributes registry of each of the edges in the graph
+
+        NOTE: The graph is copied before setting the attribute. The attribute is also set as a graph-level
+              attribute of the copy (see set_edge_attribute), so that search_edges finds the edges by its value
         """
         G_prime = self.__deepcopy__()  # create a deepcopy of the undirected graph
         for edge in G_prime.get_edges():  # for every edge in the graph
             # add the attribute key-value pair to the attributes registry of the edge
             edge.add_attribute(attribute_key, attribute_value)
+        G_prime.set_edge_attribute(attribute_key, attribute_value)  # index the attribute in a single assignment
         return G_prime  # return the modified graph
 
     def add_node(self, node):
@@ -87,6 +121,7 @@ class UndirectedGraph:
                 other_node = edge.get_other_node(node.get_name())  # get the other incident node object
                 if other_node.get_name() in self.get_node_names():  # if the other node is a part of the graph
                     self.remove_edge(tuple((node, other_node)))  # remove the edge
+            self.node_attribute_store.remove_element(node.get_name())  # drop the graph-level attributes
             self.set_nodeset(
                 set({
                     vertex
@@ -127,6 +162,9 @@ class UndirectedGraph:
         if node.get_name() in self.get_node_names() and other_node.get_name() in self.get_node_names():
             node.remove_incident_edge(other_node.get_name())  # remove the incident edge object
             other_node.remove_incident_edge(node.get_name())  # references from both nodes
+            self.edge_attribute_store.remove_element(
+                UndirectedGraph.get_edge_key(node.get_name(), other_node.get_name())
+            )  # drop the graph-level attributes of the edge
 
     def contains_edge(self, node, other_node):
         """
@@ -143,6 +181,8 @@ class UndirectedGraph:
         """
         Returns the nodeset of the undirected graph
         """
+        if Profiler.enabled:
+            Profiler.count("get_nodeset")
         return set(self.nodeset)  # return the nodeset
 
     def get_node_names(self):
@@ -178,6 +218,8 @@ class UndirectedGraph:
         """
         Returns a set of the edges in the undirected graph
         """
+        if Profiler.enabled:
+            Profiler.count("get_edges")
         return \
             set({
                 edge
@@ -185,6 +227,81 @@ class UndirectedGraph:
                 for edge in node.get_incident_edges()
             })
 
+    def set_node_attribute(self, attribute_key, attribute_value):
+        """
+        Given an attribute key and the corresponding attribute value, sets the graph-level attribute of every
+        node of the graph to the input value in place
+        """
+        self.node_attribute_store.set_column(attribute_key, attribute_value)  # a single column assignment
+
+    def set_node_attribute_value(self, node_name, attribute_key, attribute_value):
+        """
+        Given a node name and an attribute key-value pair, sets the graph-level attribute of the node to the
+        input value
+        """
+        self.node_attribute_store.set_value(node_name, attribute_key, attribute_value)
+
+    def get_node_attribute_value(self, node_name, attribute_key):
+        """
+        Given a node name and an attribute key, returns the value of the graph-level attribute of the node
+        """
+        return self.node_attribute_store.get_value(node_name, attribute_key)
+
+    def search_nodes(self, attribute_key, attribute_value):
+        """
+        Given an attribute key-value pair, returns the set of names of the nodes whose graph-level attribute
+        has the input value, using the value index of the attribute
+        """
+        return self.node_attribute_store.search(attribute_key, attribute_value, self.get_node_names)
+
+    def set_edge_attribute(self, attribute_key, attribute_value):
+        """
+        Given an attribute key and the corresponding attribute value, sets the graph-level attribute of every
+        edge of the graph to the input value in place
+        """
+        self.edge_attribute_store.set_column(attribute_key, attribute_value)  # a single column assignment
+
+    def set_edge_attribute_value(self, node_name_pair, attribute_key, attribute_value):
+        """
+        Given the pair of names of the incident nodes of an edge and an attribute key-value pair, sets the
+        graph-level attribute of the edge to the input value
+        """
+        self.edge_attribute_store.set_value(UndirectedGraph.get_edge_key(*node_name_pair), attribute_key,
+                                            attribute_value)
+
+    def get_edge_attribute_value(self, node_name_pair, attribute_key):
+        """
+        Given the pair of names of the incident nodes of an edge and an attribute key, returns the value of the
+        graph-level attribute of the edge
+        """
+        return self.edge_attribute_store.get_value(UndirectedGraph.get_edge_key(*node_name_pair), attribute_key)
+
+    def search_edges(self, attribute_key, attribute_value):
+        """
+        Given an attribute key-value pair, returns the set of edge keys (see get_edge_key) of the edges whose
+        graph-level attribute has the input value, using the value index of the attribute
+        """
+        return self.edge_attribute_store.search(attribute_key, attribute_value, self.__get_edge_keys)
+
+    def __get_edge_keys(self):
+        """
+        Helper function that returns the set of edge keys of the edges of the graph
+        """
+        return \
+            set({
+                UndirectedGraph.get_edge_key(edge.get_first_incident_node().get_name(),
+                                             edge.get_second_incident_node().get_name())
+                for edge in self.get_edges()
+            })
+
+    @staticmethod
+    def get_edge_key(first_node_name, second_node_name):
+        """
+        Given the names of the incident nodes of an edge, returns the key identifying the edge in the
+        graph-level attribute store, which does not depend on the order of the nodes
+        """
+        return frozenset({first_node_name, second_node_name})
+
     def set_nodeset(self, nodeset):
         """
         Given a set of nodes, sets the current nodeset as the input
@@ -212,31 +329,69 @@ class UndirectedGraph:
         """
         Given a graph represented as a dictionary, returns the same graph as an UndirectedGraph object
         """
-        # produce a set of disconnected Node objects with node names from the input graph
-        nodeset = {Node(str(node_name), dict(), set()) for node_name in G.keys()}
-        G_prime = UndirectedGraph(nodeset)  # create the corresponding null graph
-
-        # for every node name
-        for first_incident_node_name in G.keys():
-            # for every adjacent node name
-            for second_incident_node_name, weight in G[first_incident_node_name].items():
-                first_incident_node_name = str(first_incident_node_name)
-                second_incident_node_name = str(second_incident_node_name)
-                # if the edge has not already been added
-                if {first_incident_node_name, second_incident_node_name} \
-                        not in [{edge.get_first_incident_node().get_name(), edge.get_second_incident_node().get_name()}
-                            for edge in G_prime.get_edges()]:
-                    # get the first node object
-                    first_incident_node = \
-                        GraphProcessing.search_node_names(G_prime.get_nodeset(), first_incident_node_name).pop()
-                    # get the second node object
-                    second_incident_node = \
-                        GraphProcessing.search_node_names(G_prime.get_nodeset(), second_incident_node_name).pop()
-
-                    # add the edge
-                    G_prime.add_edge(weight, dict(), first_incident_node, second_incident_node)
-
-        return G_prime  # return the UndirectedGraph object
+        first_node_names, second_node_names, weights = list(), list(), list()
+        for first_node_name in G.keys():  # gather the adjacencies of every node as parallel edge arrays
+            for second_node_name, weight in G[first_node_name].items():
+                first_node_names.append(first_node_name)
+                second_node_names.append(second_node_name)
+                weights.append(weight)
+        # build the graph in one pass, keeping the nodes without adjacencies
+        return UndirectedGraph.from_edge_arrays(first_node_names, second_node_names, weights, G.keys())
+
+    @staticmethod
+    def from_edge_arrays(first_node_names, second_node_names, weights, node_names=None):
+        """
+        Given three parallel sequences (e.g. lists or numpy arrays) holding the first and second incident node
+        names and the weight of every edge, along with the names of additional nodes that may have no incident
+        edges, returns the corresponding UndirectedGraph object. Node names are converted to strings, as in
+        dictionary_to_undirected_graph_form, and an edge listed more than once (in either orientation) is only
+        added the first time
+
+        NOTE: The nodes and edges are created in a single pass and the graph is validated once at the end,
+        rather than after every inserted edge as with add_edge
+        """
+        # convert numpy arrays into lists of python scalars
+        first_node_names, second_node_names, weights = \
+            [array.tolist() if hasattr(array, "tolist") else array
+             for array in (first_node_names, second_node_names, weights)]
+        nodes = dict()  # map from node names to the created Node objects
+        for node_name in (node_names if node_names is not None else list()):
+            node_name = str(node_name)
+            nodes[node_name] = Node(node_name, dict(), set())
+        edge_names = set()  # unordered node name pairs of the edges created so far
+        for first_node_name, second_node_name, weight in zip(first_node_names, second_node_names, weights):
+            first_node_name, second_node_name = str(first_node_name), str(second_node_name)
+            edge_name = frozenset({first_node_name, second_node_name})
+            if edge_name in edge_names:  # if the edge has already been added
+                continue
+            edge_names.add(edge_name)
+            for node_name in (first_node_name, second_node_name):  # create the incident nodes if needed
+                if node_name not in nodes:
+                    nodes[node_name] = Node(node_name, dict(), set())
+            first_incident_node, second_incident_node = nodes[first_node_name], nodes[second_node_name]
+            edge = Edge(weight, dict(), first_incident_node, second_incident_node)  # create the Edge object
+            first_incident_node.add_incident_edge(edge)  # connect the incident nodes using the edge
+            second_incident_node.add_incident_edge(edge)
+        return UndirectedGraph(set(nodes.values()))  # validate the graph once and return it
+
+    @staticmethod
+    def from_matrix(W):
+        """
+        Given a symmetric weight matrix as a numpy array (or a nested list), in which NaN and infinite entries
+        mark missing edges, returns the corresponding UndirectedGraph object with the nodes named "0" to "n-1".
+        Only the upper triangle of the matrix is read and the diagonal is ignored
+        """
+        import numpy as np
+        W = np.asarray(W, dtype=float)
+        if W.ndim != 2 or W.shape[0] != W.shape[1]:  # the matrix must be square
+            raise Exception("Error: The weight matrix is not square")
+        rows, columns = np.triu_indices(W.shape[0], 1)  # node pairs of the upper triangle
+        present = np.isfinite(W[rows, columns])  # mask of the edges of the graph
+        rows, columns = rows[present], columns[present]
+        weights = W[rows, columns]
+        if np.all(weights == np.round(weights)):  # keep integer weights as integers
+            weights = weights.astype(np.int64)
+        return UndirectedGraph.from_edge_arrays(rows, columns, weights, range(W.shape[0]))
 
     def extract_edge_induced_subgraph(self, predicate):
         """
@@ -248,64 +403,28 @@ class UndirectedGraph:
               disconnected nodes. However, as an added bonus of using this convention, this method may
               also be used to efficiently produce deep copies of an existing graph
         """
-        # initialize the new nodeset as sets containing disconnected copies of the original nodes
-        nodeset = {node.produce_duplicate_disconnected_node() for node in self.get_nodeset()}
-
-        # create a null graph using the nodeset constructed above
-        G_prime = UndirectedGraph(nodeset)
-
-        # for every edge in the original graph
-        for edge in self.get_edges():
-            if predicate(edge):  # if the edge is not filtered out
-                G_prime = UndirectedGraph.__induced_subgraph_helper(G_prime, edge)
-
-        return G_prime  # return the subgraph
+        return self.edge_induced_subgraph_view(predicate).materialize()  # build the subgraph in a single pass
 
     def extract_node_induced_subgraph(self, predicate):
         """
         Given a predicate that accepts Node objects as inputs, returns the node-induced subgraph of the graph
         based on the set of nodes filtered by the input predicate.
         """
-        # construct the filtered nodeset
-        nodeset = {node.produce_duplicate_disconnected_node() for node in self.get_nodeset() if predicate(node)}
-
-        G_prime = UndirectedGraph(nodeset)  # create a new subgraph
+        return self.node_induced_subgraph_view(predicate).materialize()  # build the subgraph in a single pass
 
-        for edge in self.get_edges():  # for every edge in the original graph
-            # if the first incident node is in the graph
-            if edge.get_first_incident_node().get_name() in G_prime.get_node_names():
-                # if the second incident node is also in the graph
-                if edge.get_second_incident_node().get_name() in G_prime.get_node_names():
-                    # add the edge to the subgraph
-                    G_prime = UndirectedGraph.__induced_subgraph_helper(G_prime, edge)
-        return G_prime  # return the subgraph
-
-    @staticmethod
-    def __induced_subgraph_helper(G, edge):
+    def edge_induced_subgraph_view(self, predicate):
         """
-        Helper function that adds a duplicate edge to the input graph and returns the modified graph.
-        Useful for extracting subgraphs.
+        Given a predicate that accepts Edge objects as inputs, returns a read-only SubgraphView object of the
+        edge-induced subgraph of the graph, which is only copied once the view is materialized
         """
-        first_incident_node = \
-            GraphProcessing.search_node_names(
-                G.get_nodeset(),
-                edge.get_first_incident_node().get_name()
-            ).pop()  # obtain the disconnected copy of the first incident node
-
-        second_incident_node = \
-            GraphProcessing.search_node_names(
-                G.get_nodeset(),
-                edge.get_second_incident_node().get_name()
-            ).pop()  # obtain the disconnected copy of the second incident node
+        return SubgraphView(self, None, predicate)  # return the view
 
-        G.add_edge(
-            edge.get_weight(),
-            dict(edge.get_attributes()),
-            first_incident_node,
-            second_incident_node
-        )  # create and add the duplicate edge to the subgraph
-
-        return G
+    def node_induced_subgraph_view(self, predicate):
+        """
+        Given a predicate that accepts Node objects as inputs, returns a read-only SubgraphView object of the
+        node-induced subgraph of the graph, which is only copied once the view is materialized
+        """
+        return SubgraphView(self, predicate, None)  # return the view
 
     def contract_graph(self, node_names, merged_node_name):
         """
@@ -373,6 +492,8 @@ class UndirectedGraph:
 
         Method should be called after every mutation
         """
+        if Profiler.enabled:
+            Profiler.count("check_validity")
         if self.__has_conflicting_node_names():  # if the graph has nodes with conflicting node names
             raise Exception("Error: Nodes have conflicting names")  # raise an exception
         if self.__has_multiple_edges():  # if the graph has nodes with multiple edges
@@ -1,5 +1,8 @@
 from Node import Node
 from Edge import Edge
+from AttributeStore import AttributeStore
+from SubgraphView import SubgraphView
+from GraphSnapshot import GraphSnapshot
 from GraphProcessing import GraphProcessing
 from UndirectedGraph import UndirectedGraph
 
@@ -0,0 +1,24 @@
+from setuptools import setup
+
+setup(
+    name="Traveling-Salesman-Problem",
+    version="1.0",
+    description="Branch-and-cut solver for the Traveling Salesman Problem",
+    py_modules=[
+        "BatchSolver", "Benchmark", "CommandLine", "DataIO", "DistanceOracle", "InstanceCache", "ModelBuilder",
+        "TSPLIB", "TourSolver"
+    ],
+    packages=[
+        "BranchAndCut", "ColumnGeneration", "DynamicProgramming", "LocalSearch", "LowerBound", "MinimumCutProblem",
+        "NearestNeighborAlgorithm", "Portfolio", "Profiling", "SolverBackend", "UndirectedGraph"
+    ],
+    install_requires=["numpy"],
+    extras_require={
+        "gurobi": ["gurobipy"],  # backends and visualization are imported only when they are used
+        "highs": ["scipy>=1.9"],
+        "visualization": ["graphviz"]
+    },
+    entry_points={
+        "console_scripts": ["tsp-solver = CommandLine:main", "tsp-benchmark = Benchmark:main"]
+    }
+)
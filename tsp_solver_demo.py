@@ -797,6 +797,74 @@ class DataIO:
         return [int(element) for element in line.lstrip().rstrip().split()]  # preprocess the input line
 
 
+class ModelBuilder:
+    """
+    Class containing implementation of functions used to construct the gurobi model of the TSP from a graph.
+    Decision variables are created in a single batched call and the degree-2 constraints are built from a
+    precomputed node-to-edge incidence index, so that model construction is linear in the number of edges
+    """
+    @staticmethod
+    def build_model(graph, objective_upper_bound=None, vtype=GRB.BINARY):
+        """
+        Given a graph represented as a dictionary, creates a gurobi model with one decision variable per edge
+        and a degree-2 constraint per node and returns the model along with the decision variables as a
+        tupledict keyed by node pairs. If an upper bound on the objective is given, it is added as a constraint
+        """
+        model = Model("TSP")  # create the model
+
+        edge_weights = ModelBuilder.extract_edge_weights(graph)  # retrieve the edges and their weights
+        pairs = sorted(edge_weights.keys())  # fix the order in which the variables are created
+
+        # create all decision variables at once
+        variables = model.addVars(
+            pairs,
+            obj=edge_weights,
+            vtype=vtype,
+            name=[str(i) + '_' + str(j) for i, j in pairs]
+        )
+
+        incidence_index = ModelBuilder.construct_incidence_index(pairs)  # map every node to its incident edges
+
+        # add the degree-2 constraints
+        model.addConstrs(
+            quicksum(variables[pair] for pair in incidence_index.get(node, list())) == 2
+            for node in graph.keys()
+        )
+
+        if objective_upper_bound is not None:  # if an upper bound on the objective is given
+            model.addConstr(variables.prod(edge_weights) <= objective_upper_bound)  # add the bound
+
+        model.update()  # update the model
+
+        return model, variables  # return the model and the decision variables
+
+    @staticmethod
+    def extract_edge_weights(graph):
+        """
+        Given a graph represented as a dictionary, returns a dictionary mapping every edge, represented as an
+        ordered node pair, to its weight
+        """
+        # return the edge weights keyed by ordered node pairs
+        return \
+            dict({
+                tuple((min(i, j), max(i, j))): weight
+                for i in graph.keys()
+                for j, weight in graph[i].items()
+            })
+
+    @staticmethod
+    def construct_incidence_index(pairs):
+        """
+        Given an iterable of edges represented as node pairs, returns a dictionary mapping every node to the
+        list of edges incident to it
+        """
+        incidence_index = {}  # initialize the incidence index
+        for pair in pairs:  # for every edge
+            for node in pair:  # register the edge with both of its incident nodes
+                incidence_index.setdefault(node, list()).append(pair)
+        return incidence_index  # return the incidence index
+
+
 class StoerWagner:
     """
     Class that houses Python implementation of the global minimum cut algorithm on undirected
@@ -1038,32 +1106,14 @@ num_nodes = len(weights.keys())  # get the number of nodes in the graph
 
 GraphVisualizer.disp_graph(weights, graph_prefix + "_graph")  # visualize the original graph
 
-# Create Model
-model = Model("TSP")
-
-obj = LinExpr()  # linear expression object for the objective function
-
-# Create variables
-variables = {}
-for i in range(num_nodes):
-    for j in weights[i].keys():
-        if j in weights[i]:
-            if not (j, i) in variables:
-                variable = model.addVar(obj=weights[i][j], vtype=GRB.BINARY, name=str(i) + '_' + str(j))
-                obj.add(variable, weights[i][j])
-                variables[tuple((i, j))] = variable
-
-# Add Degree-2 Constraints
-for i in weights.keys():
-    lhs = LinExpr()
-    for pair, var in variables.items():
-        if i in pair:
-            lhs.add(var)
-    model.addConstr(lhs == 2)
-
 mst, mst_weight = minimum_spanning_tree(weights)  # compute the mst weight
 
-model.addConstr(obj <= 2 * mst_weight)  # upper bound of 2 * MST weight
+# create the model with an upper bound of 2 * MST weight
+model, variables = ModelBuilder.build_model(weights, 2 * mst_weight)
+
+pairs = sorted(variables.keys())  # index the edges once - the order of the decision variables is fixed
+
+edge_variables = [variables[pair] for pair in pairs]
 
 iter_index = 1  # initialize iteration index
 
@@ -1075,13 +1125,14 @@ while True:  # enter infinite loop - see below for termination criterion
 
     model.optimize()  # solve the program
 
-    duplicate_weights = DataIO.read_graph(path)  # duplicate the graph
-    for pair, var in variables.items():  # superimpose the binary decision variable values on the edge weights
-        i, j = pair
-        duplicate_weights[i][j] = var.X
-        duplicate_weights[j][i] = var.X
+    values = model.getAttr("X", edge_variables)  # read the values of all decision variables in a single call
+
+    support_weights = GraphProcessing.construct_null_graph(num_nodes)  # build the support graph in memory
+    for (i, j), value in zip(pairs, values):  # weight every edge by the value of its decision variable
+        support_weights[i][j] = value
+        support_weights[j][i] = value
 
-    graph = UndirectedGraph.dictionary_to_undirected_graph_form(duplicate_weights)  # create graph object
+    graph = UndirectedGraph.dictionary_to_undirected_graph_form(support_weights)  # create graph object
 
     # get minimum cut and corresponding weight
     minimum_cut, minimum_cut_weight = StoerWagner.apply(graph, graph.get_node_names().pop())